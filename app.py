@@ -23,6 +23,7 @@ import logging
 import os
 import json
 import traceback
+import time
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 import pandas as pd
@@ -74,11 +75,42 @@ if not GEMINI_API_KEY:
 else:
     logger.info("GEMINI_API_KEY 환경 변수를 성공적으로 로드했습니다.")
 
+# 드라이버 풀 설정 (크기 0이면 풀 비활성화)
+DRIVER_POOL_SIZE = int(os.getenv("DRIVER_POOL_SIZE", "1"))
+DRIVER_POOL_MAX_USES = int(os.getenv("DRIVER_POOL_MAX_USES", "20"))
+DRIVER_POOL_HEADLESS = os.getenv("DRIVER_POOL_HEADLESS", "true").lower() != "false"
+DRIVER_POOL_ACQUIRE_TIMEOUT = float(os.getenv("DRIVER_POOL_ACQUIRE_TIMEOUT", "60"))
+
+# 키워드 병렬 크롤링 최대 워커 수
+MAX_CRAWL_CONCURRENCY = int(os.getenv("MAX_CRAWL_CONCURRENCY", "4"))
+
+# 브라우저당 동시에 여는 최대 상세 페이지 탭 수
+MAX_DETAIL_TABS = int(os.getenv("MAX_DETAIL_TABS", "6"))
+
+# 브라우저 없는 HTTP 수집 모드의 최대 동시 요청 수
+MAX_HTTP_CONCURRENCY = int(os.getenv("MAX_HTTP_CONCURRENCY", "32"))
+
 # 크롤러 관련 모듈 임포트 (반드시 환경 변수 설정 후에 임포트)
 try:
     # 직접 g2b_crawler 모듈에서 G2BCrawler 클래스를 임포트
     from backend.crawler.g2b_crawler import G2BCrawler
+    from backend.crawler.driver_pool import DriverPool
+    from backend.crawler.lean_fetch import validate_profiles
+    from backend.crawler.locator_registry import locator_registry
+    from backend.crawler.driver_resolver import driver_resolver
+    from backend.crawler.g2b_http import G2BHttpFetcher, HTTP_CONCURRENCY
+    from backend.crawler.driver_actor import DriverDeadError
+    from backend.crawler.watchdog import ResumePoint, driver_watchdog
+    from backend.crawler.memory_governor import RecycleRequested
+    from backend.crawler.date_range import DateRange
+    from backend.crawler.bid_registry import BidRegistry
+    from backend.crawler.watermark import WatermarkStore
+    from backend.crawler.snapshot_store import snapshot_store
+    from backend.crawler.search_cache import search_cache
+    from backend.crawler.detail_cache import detail_cache
+    from backend.crawler.parse_pool import parse_pool
     from backend.models import BidItem, SearchResult, BidStatus
+    from backend.utils.loop_monitor import LoopLagMonitor
     logger.info("크롤러 모듈 임포트 성공")
 except ImportError as e:
     logger.error(f"크롤러 모듈 임포트 실패: {str(e)}")
@@ -242,6 +274,13 @@ class WebSocketManager:
             }
         })
     
+    async def send_worker(self, data: Dict[str, Any]):
+        """워커별 진행 상황 전송"""
+        await self.broadcast({
+            "type": "worker",
+            "data": data
+        })
+    
     async def send_error(self, message: str, stopped: bool = False):
         """오류 메시지 전송"""
         await self.broadcast({
@@ -257,7 +296,15 @@ class WebSocketManager:
 class CrawlingState:
     def __init__(self):
         self.is_running = False
-        self.crawler = None
+        self.crawlers: Dict[int, Any] = {}  # 워커별 크롤러
+        self.pooled_workers = set()  # 드라이버 풀에서 크롤러를 임대한 워커
+        self.http_fetcher = None  # HTTP 수집 모드의 요청 재전송 수집기
+        self.date_range = None  # 이번 실행의 검색 기간 조건 (DateRange)
+        self.bid_registry = BidRegistry()  # 이번 실행에서 본 공고번호+차수 (키워드 간 중복 확인)
+        self.watermarks = None  # 증분 모드의 키워드별 수집 기준점 (WatermarkStore, 전체 수집이면 None)
+        self.memory_samples: Dict[int, List[Dict[str, Any]]] = {}  # 이번 실행의 워커별 브라우저 메모리 측정값
+        self.memory_recycles = 0  # 이번 실행의 메모리/페이지 수 한도 재시작 횟수
+        self.workers: Dict[int, Dict[str, Any]] = {}  # 워커별 진행 상황
         self.results = []
         self.processed_keywords = []
         self.total_keywords = 0
@@ -266,6 +313,31 @@ class CrawlingState:
         self.websocket_manager = WebSocketManager()
         self.logger = logging.getLogger(__name__)
     
+    @property
+    def crawler(self):
+        """대표 크롤러 (실행 중인 첫 번째 워커의 크롤러)"""
+        return next(iter(self.crawlers.values()), None)
+    
+    async def close_crawlers(self):
+        """풀에서 임대하지 않은 크롤러 종료 (임대한 크롤러는 워커가 반납)"""
+        for worker_id, crawler in list(self.crawlers.items()):
+            if worker_id not in self.pooled_workers:
+                await crawler.close()
+                self.crawlers.pop(worker_id, None)
+    
+    async def update_worker(self, worker_id: int, **fields):
+        """워커 진행 상황 갱신 후 웹소켓으로 전송"""
+        worker = self.workers.setdefault(worker_id, {
+            "worker_id": worker_id,
+            "state": "idle",
+            "keyword": None,
+            "keywords_done": 0,
+            "items_done": 0,
+            "items_total": 0
+        })
+        worker.update(fields)
+        await self.websocket_manager.send_worker(worker)
+    
     def get_status(self) -> Dict[str, Any]:
         """현재 크롤링 상태 반환"""
         return {
@@ -274,7 +346,9 @@ class CrawlingState:
             "total_keywords": self.total_keywords,
             "total_items": len(self.results),
             "start_time": self.start_time.isoformat() if self.start_time else None,
-            "end_time": self.end_time.isoformat() if self.end_time else None
+            "end_time": self.end_time.isoformat() if self.end_time else None,
+            "detail_fetches_saved": self.bid_registry.get_stats()["detail_fetches_saved"],
+            "workers": list(self.workers.values())
         }
     
     def save_results(self, filename: Optional[str] = None) -> str:
@@ -316,6 +390,12 @@ class CrawlingState:
 # 크롤링 상태 인스턴스 생성
 crawling_state = CrawlingState()
 
+# 이벤트 루프 블로킹 측정기
+loop_monitor = LoopLagMonitor()
+
+# 워밍된 웹드라이버 풀 (라이프스팬 시작 시 생성)
+driver_pool: Optional[DriverPool] = None
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -329,6 +409,21 @@ async def lifespan(app: FastAPI):
     # 결과 디렉토리 생성
     RESULTS_DIR.mkdir(exist_ok=True)
     
+    # 이벤트 루프 지연 측정 시작
+    loop_monitor.start()
+    
+    # 파싱 프로세스 풀 시작 (드라이버 스레드가 생기기 전에 작업 프로세스 생성)
+    await asyncio.to_thread(parse_pool.start)
+    
+    # 드라이버 풀 워밍 (서버 시작을 막지 않도록 백그라운드 실행)
+    global driver_pool
+    driver_pool = DriverPool(
+        size=DRIVER_POOL_SIZE,
+        headless=DRIVER_POOL_HEADLESS,
+        max_uses=DRIVER_POOL_MAX_USES
+    )
+    warmup_task = asyncio.create_task(driver_pool.start())
+    
     try:
         # 컨텍스트 내부로 제어 양도
         yield
@@ -336,9 +431,27 @@ async def lifespan(app: FastAPI):
         # 종료 시 실행할 코드
         logger.info("=== 나라장터 크롤링 애플리케이션 종료 ===")
         
-        # 실행 중인 크롤러가 있으면 종료
-        if hasattr(crawling_state, 'crawler') and crawling_state.crawler:
-            await crawling_state.crawler.close()
+        # 실행 중인 크롤러가 있으면 종료 (풀에서 임대한 크롤러는 풀 종료 시 정리)
+        await crawling_state.close_crawlers()
+        
+        # 드라이버 풀 종료
+        warmup_task.cancel()
+        await asyncio.gather(warmup_task, return_exceptions=True)
+        await driver_pool.close()
+        
+        # 선택자 기록 저장
+        locator_registry.save()
+        
+        # 대기 중인 페이지 스냅샷 저장 완료
+        await asyncio.to_thread(snapshot_store.flush)
+        
+        # 상세 캐시 연결 종료
+        await asyncio.to_thread(detail_cache.close)
+        
+        # 파싱 프로세스 풀 종료
+        await asyncio.to_thread(parse_pool.close)
+        
+        await loop_monitor.stop()
 
 # FastAPI 앱 생성 부분 수정
 app = FastAPI(
@@ -388,6 +501,79 @@ async def get_status():
         "data": crawling_state.get_status()
     }
 
+@app.get("/api/metrics")
+async def get_metrics():
+    """성능 지표 조회 (이벤트 루프 지연, 드라이버 액터 통계, 페이지 대기 시간)"""
+    metrics = {
+        "loop_lag": loop_monitor.get_stats(),
+        "driver_actors": {},
+        "wait_latency": {},
+        "detail_tabs": {},
+        "grid_capture": {},
+        "launch_profile": {},
+        "popups": {},
+        "page_state": {},
+        "date_range": crawling_state.date_range.as_dict() if crawling_state.date_range else None,
+        "dedup": crawling_state.bid_registry.get_stats(),
+        "incremental": crawling_state.watermarks.get_stats() if crawling_state.watermarks else None,
+        "snapshots": snapshot_store.get_stats(),
+        "search_cache": search_cache.get_stats(),
+        "detail_cache": detail_cache.get_stats(),
+        "parse_pool": parse_pool.get_stats(),
+        "locators": locator_registry.get_stats(),
+        "chromedriver": driver_resolver.get_stats(),
+        "watchdog": driver_watchdog.get_stats(),
+        "memory": {
+            "recycles": crawling_state.memory_recycles,
+            "samples": crawling_state.memory_samples,
+            "drivers": {}
+        },
+        "http_fetch": crawling_state.http_fetcher.get_stats() if crawling_state.http_fetcher else None,
+        "driver_pool": driver_pool.get_status() if driver_pool else None
+    }
+    
+    for worker_id, crawler in crawling_state.crawlers.items():
+        if crawler.actor:
+            metrics["driver_actors"][worker_id] = crawler.actor.get_stats()
+        if crawler.wait_engine:
+            metrics["wait_latency"][worker_id] = crawler.wait_engine.get_stats()
+        if crawler.detail_processor:
+            metrics["detail_tabs"][worker_id] = crawler.detail_processor.get_tab_stats()
+        if crawler.searcher and crawler.searcher.grid_capture:
+            metrics["grid_capture"][worker_id] = crawler.searcher.grid_capture.get_stats()
+        if crawler.base:
+            metrics["launch_profile"][worker_id] = crawler.base.launch_profile.get_stats()
+        if crawler.base and crawler.base.page_state:
+            metrics["page_state"][worker_id] = crawler.base.page_state.get_stats()
+        if crawler.base and crawler.base.popup_guard:
+            metrics["popups"][worker_id] = crawler.base.popup_guard.get_stats()
+        if crawler.base and crawler.base.memory_governor:
+            metrics["memory"]["drivers"][worker_id] = crawler.base.memory_governor.get_stats()
+    
+    return {
+        "status": "success",
+        "data": metrics
+    }
+
+@app.get("/api/pool")
+async def get_pool_status():
+    """드라이버 풀 크기 및 워밍 상태 조회"""
+    if not driver_pool:
+        return {"status": "error", "message": "드라이버 풀이 초기화되지 않았습니다."}
+    
+    return {
+        "status": "success",
+        "data": driver_pool.get_status()
+    }
+
+@app.get("/api/locators")
+async def get_locator_stats():
+    """요소별 기억된 선택자 및 적중/실패 통계 조회"""
+    return {
+        "status": "success",
+        "data": locator_registry.get_stats()
+    }
+
 @app.get("/api/results")
 async def get_results():
     """현재까지 수집된 결과 조회"""
@@ -506,16 +692,67 @@ async def start_crawling(request: Dict[str, Any], background_tasks: BackgroundTa
     headless = request.get("headless", True)
     start_date = request.get("startDate")
     end_date = request.get("endDate")
+    date_field = request.get("dateField", "posting")  # 기간 기준 ("posting": 공고게시일자, "deadline": 입찰마감일자)
+    try:
+        DateRange(start_date, end_date, date_field)
+    except ValueError as e:
+        return {"status": "error", "message": str(e)}
     max_items = request.get("maxItems", 10000)  # 추가: 최대 항목 수 파라미터
     
+    # 병렬 워커 수 (키워드 수 및 최대 동시 실행 수로 제한)
+    try:
+        concurrency = int(request.get("concurrency", 1))
+    except (TypeError, ValueError):
+        return {"status": "error", "message": "concurrency 값은 정수여야 합니다."}
+    concurrency = max(1, min(concurrency, MAX_CRAWL_CONCURRENCY, len(keywords)))
+    
+    # 리소스 차단(lean fetch) 사용 여부 및 페이지 유형별 프로필 (선택)
+    lean_fetch = bool(request.get("leanFetch", False))
+    lean_fetch_profiles = request.get("leanFetchProfiles")
+    try:
+        validate_profiles(lean_fetch_profiles)
+    except ValueError as e:
+        return {"status": "error", "message": str(e)}
+    
+    # 브라우저당 동시 상세 페이지 탭 수 (1이면 기존 클릭 방식)
+    try:
+        detail_tabs = int(request.get("detailTabs", 1))
+    except (TypeError, ValueError):
+        return {"status": "error", "message": "detailTabs 값은 정수여야 합니다."}
+    detail_tabs = max(1, min(detail_tabs, MAX_DETAIL_TABS))
+    
+    # 수집 방식 ("browser": 브라우저 조작, "http": 세션 캡처 후 요청 재전송)
+    fetch_mode = request.get("fetchMode", "browser")
+    if fetch_mode not in ("browser", "http"):
+        return {"status": "error", "message": "fetchMode 값은 'browser' 또는 'http'여야 합니다."}
+    try:
+        http_concurrency = int(request.get("httpConcurrency", HTTP_CONCURRENCY))
+    except (TypeError, ValueError):
+        return {"status": "error", "message": "httpConcurrency 값은 정수여야 합니다."}
+    http_concurrency = max(1, min(http_concurrency, MAX_HTTP_CONCURRENCY))
+    
+    # 증분 수집 (키워드별 기준점 이후의 새 공고/정정공고만 처리)
+    incremental = bool(request.get("incremental", False))
+    
+    # 검색 결과 목록 캐시 사용 여부 (SEARCH_CACHE_TTL 안에 같은 조건으로 검색한 목록 재사용)
+    use_search_cache = bool(request.get("searchCache", True))
+    
     # 크롤링 상태 초기화
     crawling_state.is_running = True
     crawling_state.results = []
     crawling_state.processed_keywords = []
     crawling_state.total_keywords = len(keywords)
+    crawling_state.workers = {}
+    crawling_state.memory_samples = {}
+    crawling_state.memory_recycles = 0
+    crawling_state.bid_registry = BidRegistry()
+    crawling_state.http_fetcher = None
     crawling_state.start_time = datetime.now()
     crawling_state.end_time = None
     
+    # 이번 실행 기준으로 이벤트 루프 지연 측정값 초기화
+    loop_monitor.reset()
+    
     # 상태 업데이트 브로드캐스트
     await crawling_state.websocket_manager.send_status(crawling_state.get_status())
     await crawling_state.websocket_manager.send_log(f"키워드 {len(keywords)}개로 크롤링을 시작합니다.")
@@ -527,7 +764,16 @@ async def start_crawling(request: Dict[str, Any], background_tasks: BackgroundTa
         headless=headless,
         start_date=start_date,
         end_date=end_date,
-        max_items=max_items  # 추가: 최대 항목 수 전달
+        date_field=date_field,
+        max_items=max_items,  # 추가: 최대 항목 수 전달
+        concurrency=concurrency,
+        lean_fetch=lean_fetch,
+        lean_fetch_profiles=lean_fetch_profiles,
+        detail_tabs=detail_tabs,
+        fetch_mode=fetch_mode,
+        http_concurrency=http_concurrency,
+        incremental=incremental,
+        use_search_cache=use_search_cache
     )
     
     return {
@@ -545,10 +791,8 @@ async def stop_crawling():
     try:
         await crawling_state.websocket_manager.send_log("크롤링 중지 요청이 접수되었습니다.")
         
-        # 진행 중인 크롤러 종료
-        if crawling_state.crawler:
-            await crawling_state.crawler.close()
-            crawling_state.crawler = None
+        # 진행 중인 크롤러 종료 (풀에서 임대한 브라우저는 작업 종료 후 반납되도록 유지)
+        await crawling_state.close_crawlers()
         
         # 상태 업데이트
         crawling_state.is_running = False
@@ -713,177 +957,668 @@ async def websocket_endpoint(websocket: WebSocket):
         # 연결 종료 시 관리자에서 제거
         crawling_state.websocket_manager.disconnect(websocket)
 
-# 크롤링 실행 함수 (백그라운드 태스크)
-async def run_crawling(keywords: List[str], headless: bool = True, start_date: Optional[str] = None, end_date: Optional[str] = None, max_items: int = 10000):
-    """크롤링 실행 (백그라운드 태스크)"""
+# 크롤러 준비 (워밍된 풀 우선, 없으면 새로 실행)
+async def acquire_crawler(worker_id: int, options: Dict[str, Any], log_prefix: str = ""):
+    """
+    워커용 크롤러 준비
+    
+    Args:
+        worker_id: 워커 번호
+        options: 크롤링 실행 옵션 (headless, lean_fetch 등)
+        log_prefix: 로그 메시지 접두어
+    
+    Returns:
+        (크롤러, 풀 임대 여부) 튜플 (실패 시 크롤러는 None)
+    """
+    ws = crawling_state.websocket_manager
+    headless = options["headless"]
+    
+    # 워밍된 드라이버 풀에서 브라우저 임대 시도 (헤드리스 설정이 같은 경우)
+    if driver_pool and worker_id < driver_pool.size and headless == driver_pool.headless:
+        await ws.send_log(f"{log_prefix}드라이버 풀에서 브라우저 임대 중...")
+        crawler = await driver_pool.acquire(timeout=DRIVER_POOL_ACQUIRE_TIMEOUT)
+        if crawler:
+            try:
+                await crawler.configure_lean_fetch(options["lean_fetch"], options["lean_fetch_profiles"])
+                crawler.set_date_range(options["date_range"])
+            except Exception as e:
+                # 설정에 실패한 브라우저는 상태를 알 수 없으므로 풀에서 교체
+                logger.error(f"임대한 브라우저 설정 실패: {str(e)}")
+                logger.debug(traceback.format_exc())
+                await driver_pool.discard(crawler)
+                await ws.send_error(f"{log_prefix}브라우저 설정 실패: {str(e)}")
+                return None, False
+            await ws.send_log(f"{log_prefix}워밍된 브라우저 임대 완료 (입찰공고 목록 페이지 대기 중)")
+            return crawler, True
+    
+    # 크롤러 초기화
+    await ws.send_log(f"{log_prefix}크롤러 초기화 중...")
+    crawler = G2BCrawler(headless=headless)
+    if not await crawler.initialize():
+        await ws.send_error(f"{log_prefix}크롤러 초기화 실패")
+        await crawler.close()
+        return None, False
+    
+    # 리소스 차단은 첫 페이지 이동 전에 설정
     try:
-        # 로그 메시지 전송
-        await crawling_state.websocket_manager.send_log("크롤러 초기화 중...")
-        
-        # 크롤러 초기화
-        crawler = G2BCrawler(headless=headless)
-        crawling_state.crawler = crawler
-        
-        # 크롤러 초기화
-        if not await crawler.initialize():
-            crawling_state.is_running = False
-            await crawling_state.websocket_manager.send_error("크롤러 초기화 실패", stopped=True)
-            return
-        
-        await crawling_state.websocket_manager.send_log("크롤러 초기화 완료, 메인 페이지로 이동 중...")
-        
-        # 메인 페이지로 이동
-        if not await crawler.navigate_to_main():
-            crawling_state.is_running = False
-            await crawling_state.websocket_manager.send_error("메인 페이지 이동 실패", stopped=True)
-            await crawler.close()
-            return
+        await crawler.configure_lean_fetch(options["lean_fetch"], options["lean_fetch_profiles"])
+        crawler.set_date_range(options["date_range"])
+    except Exception as e:
+        logger.error(f"브라우저 설정 실패: {str(e)}")
+        logger.debug(traceback.format_exc())
+        await ws.send_error(f"{log_prefix}브라우저 설정 실패: {str(e)}")
+        await crawler.close()
+        return None, False
+    
+    # 입찰공고 페이지로 이동 (메인 페이지 경유)
+    await ws.send_log(f"{log_prefix}크롤러 초기화 완료, 입찰공고 목록 페이지로 이동 중...")
+    if not await crawler.navigate_to_bid_list():
+        await ws.send_error(f"{log_prefix}입찰공고 목록 페이지 이동 실패")
+        await crawler.close()
+        return None, False
+    
+    return crawler, False
+
+# 키워드 단위 크롤링 (검색 → 페이지별 목록 추출 → 상세 정보 추출 → 결과 반영)
+async def crawl_keyword(crawler, keyword: str, options: Dict[str, Any], worker_id: int, log_prefix: str = "", checkpoint: Optional[ResumePoint] = None) -> List[Any]:
+    """
+    단일 키워드를 처리하고 상세 정보가 병합된 결과 목록 반환
+    
+    검색 결과를 페이지 단위로 받아 상세 정보를 처리하고 바로 전체 결과/WebSocket에 반영합니다.
+    checkpoint에 진행 상황(추출한 항목, 현재 페이지, 처리 완료 행)을 기록하며, 브라우저 세션이 죽으면
+    DriverDeadError를 발생시킵니다. 같은 checkpoint로 다시 호출하면 마지막 페이지의 남은 행부터 재개합니다.
+    """
+    ws = crawling_state.websocket_manager
+    checkpoint = checkpoint or ResumePoint(keyword)
+    resuming = checkpoint.items is not None
+    mark = keyword_watermark(keyword, options)
+    await check_driver_memory(crawler, worker_id)
+    
+    # 검색 결과 캐시에 첫 페이지가 있으면 목록 단계는 브라우저 없이 진행 (캐시에 없는 페이지에서 검색)
+    cached = not resuming and options["search_cache"] and await crawler.has_cached_search(keyword)
+    if cached:
+        search_success = True
+        await ws.send_log(f"{log_prefix}키워드 '{keyword}' 검색 결과 캐시 사용 (캐시에 없는 페이지부터 브라우저로 검색)")
+    else:
+        # 키워드 검색 수행 (재개 시에도 목록 페이지 상태를 복원하기 위해 다시 검색)
+        search_success = await crawler.search_keyword(keyword)
+        if not search_success:
+            # 검색 실패 시 세션 응답 여부를 직접 확인 (인식하지 못한 장애 대비)
+            await driver_watchdog.probe(crawler)
+        raise_if_driver_dead(crawler)
+    
+    published = []
+    if resuming:
+        keyword_results = checkpoint.items
+        driver_watchdog.stats["resumed_rows"] += len(checkpoint.done_rows)
+        await ws.send_log(f"{log_prefix}키워드 '{keyword}' {checkpoint.page}페이지 {checkpoint.row + 1}행부터 재개 ({len(checkpoint.done_rows)}/{len(keyword_results)}개 완료)", "warning")
         
-        # 입찰공고 페이지로 이동
-        await crawling_state.websocket_manager.send_log("입찰공고 목록 페이지로 이동 중...")
-        if not await crawler.navigate_to_bid_list():
-            crawling_state.is_running = False
-            await crawling_state.websocket_manager.send_error("입찰공고 목록 페이지 이동 실패", stopped=True)
-            await crawler.close()
-            return
+        # 중단된 페이지의 남은 행 처리 (클릭 방식 상세 처리를 위해 해당 페이지로 이동)
+        if checkpoint.pending_rows():
+            if search_success and not await crawler.go_to_result_page(checkpoint.page):
+                await ws.send_log(f"{log_prefix}{checkpoint.page}페이지로 이동하지 못했습니다 (상세 URL이 있는 항목만 처리)", "warning")
+            await process_detail_rows(crawler, keyword_results, checkpoint.pending_rows(), options, worker_id, log_prefix, checkpoint)
+        published.extend(await publish_rows(crawler, keyword_results, checkpoint.page_rows(), checkpoint))
+        if mark:
+            mark.observe_all(keyword_results[idx] for idx in checkpoint.page_rows() if idx in checkpoint.published_rows)
+        start_page = checkpoint.page + 1 if keyword_results else 1
+    else:
+        keyword_results = []
+        checkpoint.items = keyword_results
+        start_page = 1
+    
+    # 페이지별로 받은 즉시 상세 정보 처리 (다음 페이지는 그동안 미리 로딩)
+    max_items = options["max_items"]
+    remaining = max_items - len(keyword_results) if max_items > 0 else 0
+    if search_success and crawling_state.is_running and (max_items <= 0 or remaining > 0):
+        async for page, page_items in crawler.iter_search_results(max_items=remaining, start_page=start_page, keyword=keyword if cached else None):
+            checkpoint.page = page
+            checkpoint.page_start = len(keyword_results)
+            keyword_results.extend(page_items)
+            page_rows = checkpoint.page_rows()
+            
+            # 증분 모드: 이전 실행에서 처리한 공고(같은 차수)는 건너뜀
+            known = [idx for idx in page_rows if mark.is_known(keyword_results[idx])] if mark else []
+            if known:
+                mark.skipped += len(known)
+                await ws.send_log(f"{log_prefix}키워드 '{keyword}' {page}페이지 이미 수집한 공고 {len(known)}건은 건너뜁니다")
+            
+            # 다른 키워드에서 이미 찾은 공고는 상세 처리 없이 키워드만 기존 결과에 추가
+            # (선점한 키워드가 아직 게시하지 않은 공고는 키워드 마지막에 게시 여부를 확인한 뒤 반영)
+            duplicates = [idx for idx in page_rows if idx not in known and not crawling_state.bid_registry.claim(keyword_results[idx], keyword)]
+            confirmed = [idx for idx in duplicates if crawling_state.bid_registry.is_published(keyword_results[idx])]
+            checkpoint.deferred_rows.update(idx for idx in duplicates if idx not in confirmed)
+            checkpoint.done_rows.update(known + confirmed)
+            checkpoint.published_rows.update(known + confirmed)
+            if duplicates:
+                await ws.send_log(f"{log_prefix}키워드 '{keyword}' {page}페이지 중복 공고 {len(duplicates)}건은 상세 처리를 생략합니다")
+            
+            await crawling_state.update_worker(worker_id, items_done=len(checkpoint.done_rows), items_total=len(keyword_results))
+            await ws.send_log(f"{log_prefix}키워드 '{keyword}' {page}페이지 검색 결과: {len(page_items)}건 (누적 {len(keyword_results)}건)")
+            
+            await process_detail_rows(crawler, keyword_results, page_rows, options, worker_id, log_prefix, checkpoint)
+            published.extend(await publish_rows(crawler, keyword_results, page_rows, checkpoint))
+            if mark:
+                mark.observe_all(keyword_results[idx] for idx in page_rows if idx in checkpoint.published_rows and idx not in known)
+            if not crawling_state.is_running:
+                break
+            if known and len(known) == len(page_rows):
+                await ws.send_log(f"{log_prefix}키워드 '{keyword}' {page}페이지가 모두 이미 수집한 공고이므로 이후 페이지는 확인하지 않습니다")
+                break
+    
+    if not keyword_results:
+        # 결과가 없으면 세션 응답 여부를 직접 확인 (인식하지 못한 장애 대비)
+        await driver_watchdog.probe(crawler)
+        raise_if_driver_dead(crawler)
+        await ws.send_log(f"{log_prefix}키워드 '{keyword}'에 대한 검색 결과가 없습니다.")
+        if mark and search_success and crawling_state.is_running:
+            options["watermarks"].commit(mark)
+        return []
+    
+    # 게시하지 못한 공고의 선점을 먼저 해제한 뒤(다른 키워드가 처리하도록), 다른 키워드가 선점 중이던 중복 공고 정리
+    crawling_state.bid_registry.release(keyword)
+    published.extend(await resolve_deferred_rows(crawler, keyword, keyword_results, options, worker_id, log_prefix, checkpoint, mark))
+    crawling_state.bid_registry.release(keyword)
+    
+    # 끝까지 처리한 키워드만 기준점 저장 (중지된 키워드는 다음 실행에서 다시 확인)
+    if mark and search_success and crawling_state.is_running:
+        options["watermarks"].commit(mark)
+    
+    await crawling_state.update_worker(worker_id, items_done=len(checkpoint.done_rows), items_total=len(keyword_results))
+    await ws.send_log(f"{log_prefix}키워드 '{keyword}' 상세 정보 추출 완료: {len(checkpoint.done_rows)}/{len(keyword_results)}개 항목 ({checkpoint.page}페이지)")
+    return published
+
+async def resolve_deferred_rows(crawler, keyword: str, keyword_results: List[Any], options: Dict[str, Any], worker_id: int, log_prefix: str, checkpoint: ResumePoint, mark) -> List[Any]:
+    """
+    다른 키워드가 선점 중이던 중복 공고 행 정리 (키워드의 모든 페이지 처리 후 호출)
+    
+    선점한 키워드가 게시하면 처리 완료로 기록하고, 선점이 해제되면(중단/포기) 이 키워드가 다시 선점하여
+    상세 정보를 처리하고 게시합니다. 중지 요청 시 남은 행은 게시하지 않습니다.
+    """
+    ws = crawling_state.websocket_manager
+    registry = crawling_state.bid_registry
+    published = []
+    while checkpoint.deferred_rows and crawling_state.is_running:
+        rows = sorted(checkpoint.deferred_rows)
+        confirmed = [idx for idx in rows if registry.is_published(keyword_results[idx])]
+        reclaimed = [idx for idx in rows if idx not in confirmed and registry.reclaim(keyword_results[idx], keyword)]
+        checkpoint.deferred_rows.difference_update(confirmed + reclaimed)
+        checkpoint.done_rows.update(confirmed)
+        checkpoint.published_rows.update(confirmed)
+        if mark:
+            mark.observe_all(keyword_results[idx] for idx in confirmed)
         
-        # 검색 조건 설정
-        await crawling_state.websocket_manager.send_log("검색 조건 설정 중...")
-        if not await crawler.setup_search_conditions():
-            await crawling_state.websocket_manager.send_log("검색 조건 설정 중 오류 발생 (무시하고 계속 진행)", "warning")
+        if reclaimed:
+            await ws.send_log(f"{log_prefix}키워드 '{keyword}' 다른 키워드가 처리하지 못한 중복 공고 {len(reclaimed)}건을 다시 처리합니다", "warning")
+            # 목록 페이지가 바뀌었으므로 상세 URL이 없는 행은 기본 정보만 게시
+            checkpoint.done_rows.update(idx for idx in reclaimed if not (isinstance(keyword_results[idx], dict) and keyword_results[idx].get('detail_url')))
+            await process_detail_rows(crawler, keyword_results, reclaimed, options, worker_id, log_prefix, checkpoint)
+            published.extend(await publish_rows(crawler, keyword_results, reclaimed, checkpoint))
+            if mark:
+                mark.observe_all(keyword_results[idx] for idx in reclaimed if idx in checkpoint.published_rows)
+        elif checkpoint.deferred_rows:
+            # 선점한 키워드가 게시하거나 선점을 해제할 때까지 대기
+            await registry.wait_settled(keyword_results[min(checkpoint.deferred_rows)], lambda: crawling_state.is_running)
+    return published
+
+def keyword_watermark(keyword: str, options: Dict[str, Any]):
+    """증분 모드이면 키워드 + 기간 기준의 수집 기준점 반환 (전체 수집이면 None)"""
+    if not options["watermarks"]:
+        return None
+    return options["watermarks"].track(keyword, {"date_field": options["date_range"].field})
+
+async def process_detail_rows(crawler, keyword_results: List[Any], rows: List[int], options: Dict[str, Any], worker_id: int, log_prefix: str, checkpoint: ResumePoint):
+    """지정한 행들의 상세 정보를 추출해 항목에 병합 (처리 완료 행은 checkpoint에 기록)"""
+    ws = crawling_state.websocket_manager
+    pending_rows = [idx for idx in rows if idx not in checkpoint.done_rows and idx not in checkpoint.deferred_rows]
+    if not pending_rows:
+        return
+    result_count = len(keyword_results)
+    await ws.send_log(f"{log_prefix}상세 정보 추출 시작: {len(pending_rows)}개 항목")
+    
+    if options["detail_tabs"] > 1:
+        # 여러 탭에서 상세 페이지 동시 처리
+        pending_items = [keyword_results[idx] for idx in pending_rows]
         
-        # 결과 저장 경로 설정
-        save_path = str(RESULTS_DIR)
+        async def on_item_done(pos, detail_data):
+            idx = pending_rows[pos]
+            # 세션 장애로 실패한 행은 재개 시 다시 처리
+            if detail_data or not driver_watchdog.is_dead(crawler):
+                checkpoint.done_rows.add(idx)
+            if detail_data:
+                merge_detail_data(keyword_results[idx], detail_data)
+            await crawling_state.update_worker(worker_id, items_done=len(checkpoint.done_rows), items_total=result_count)
+            outcome = "성공" if detail_data else "실패"
+            await ws.send_log(f"{log_prefix}항목 {idx+1}/{result_count} 상세 정보 추출 {outcome} (탭)", "success" if detail_data else "warning")
         
-        # 키워드 크롤링 수행
-        await crawling_state.websocket_manager.send_log(f"검색 시작: {len(keywords)}개 키워드")
+        await crawler.process_detail_pages_in_tabs(pending_items, options["detail_tabs"], on_item_done)
+        raise_if_driver_dead(crawler)
+        await check_driver_memory(crawler, worker_id)
         
-        # 중간 상태 업데이트 함수
-        async def progress_callback(processed_kw, total_kw, current_results):
-            # 처리된 키워드 업데이트
-            crawling_state.processed_keywords = processed_kw
-            
-            # 결과 업데이트
-            if current_results:
-                # 결과 추가
-                for result in current_results:
-                    if result not in crawling_state.results:
-                        crawling_state.results.append(result)
+        tab_stats = crawler.detail_processor.get_tab_stats()
+        await ws.send_log(f"{log_prefix}탭 처리 시간: 평균 대기 {tab_stats['mean_wait_ms']}ms, 평균 추출 {tab_stats['mean_extract_ms']}ms, 평균 전체 {tab_stats['mean_total_ms']}ms")
+    else:
+        # 모든 항목에 상세 URL이 있으면 현재 항목을 파싱하는 동안 다음 항목 HTML을 탭에서 미리 가져옴
+        # (파싱은 프로세스 풀에서 실행되므로 브라우저 작업과 겹쳐 진행)
+        overlap = all(isinstance(keyword_results[idx], dict) and keyword_results[idx].get('detail_url') for idx in pending_rows)
+        prefetch = None
+        try:
+            for pos, idx in enumerate(pending_rows):
+                if not crawling_state.is_running:
+                    break
                 
-                # 상태 업데이트 전송
-                await crawling_state.websocket_manager.send_status(crawling_state.get_status())
-                await crawling_state.websocket_manager.send_results(crawling_state.results)
-            
-            # 진행 상황 로그
-            progress = round((len(processed_kw) / total_kw) * 100, 1)
-            await crawling_state.websocket_manager.send_log(f"진행 상황: {len(processed_kw)}/{total_kw} ({progress}%)")
-        
-        # 키워드별 크롤링 수행
-        for idx, keyword in enumerate(keywords):
+                item = keyword_results[idx]
+                await crawling_state.update_worker(worker_id, items_done=len(checkpoint.done_rows), items_total=result_count)
+                    
+                try:
+                    # 타이틀 정보 추출 (딕셔너리 또는 BidItem 모델에서)
+                    title = item.get('title', '') if isinstance(item, dict) else getattr(item, 'bid_title', '')
+                    await ws.send_log(f"{log_prefix}항목 {idx+1}/{result_count} 상세 정보 추출 중: {title}")
+                    
+                    fetched = None
+                    if overlap:
+                        fetched = await prefetch if prefetch else await crawler.fetch_detail_source(item)
+                        prefetch = None
+                        # 현재 항목 HTML을 확보한 경우에만 다음 항목 요청 (같은 드라이버에서 탭 작업이 겹치지 않도록)
+                        if fetched and pos + 1 < len(pending_rows):
+                            prefetch = asyncio.create_task(crawler.fetch_detail_source(keyword_results[pending_rows[pos + 1]]))
+                    
+                    # 상세 페이지 처리
+                    detail_data = await crawler.process_detail_page(item, fetched)
+                    
+                    # 세션 장애로 실패한 행은 처리 완료로 기록하지 않음
+                    raise_if_driver_dead(crawler)
+                    
+                    if detail_data:
+                        merge_detail_data(item, detail_data)
+                        await ws.send_log(f"{log_prefix}항목 {idx+1} 상세 정보 추출 성공", "success")
+                    else:
+                        await ws.send_log(f"{log_prefix}항목 {idx+1} 상세 정보 추출 실패", "warning")
+                    
+                except DriverDeadError:
+                    raise
+                except Exception as detail_err:
+                    await ws.send_log(f"{log_prefix}항목 {idx+1} 상세 정보 추출 오류: {str(detail_err)}", "error")
+                
+                checkpoint.done_rows.add(idx)  # 실패해도 기본 정보는 유지
+                
+                # 다음 행으로 넘어가기 전 메모리 한도 확인 (초과 시 재시작 후 다음 행부터 재개)
+                if checkpoint.pending_rows():
+                    await check_driver_memory(crawler, worker_id)
+        finally:
+            # 중지/재시작으로 사용하지 않게 된 미리 가져오기 정리 (탭 닫기까지 대기)
+            if prefetch:
+                prefetch.cancel()
+                await asyncio.gather(prefetch, return_exceptions=True)
+
+async def publish_rows(crawler, keyword_results: List[Any], rows: List[int], checkpoint: ResumePoint) -> List[Any]:
+    """처리 완료한 행을 모델로 변환해 전체 결과에 추가하고 WebSocket으로 전송 (중지 요청 시 일부)"""
+    rows = [idx for idx in rows if idx in checkpoint.done_rows and idx not in checkpoint.published_rows]
+    if not rows:
+        return []
+    checkpoint.published_rows.update(rows)
+    items = [keyword_results[idx] for idx in rows]
+    
+    try:
+        model_items = await crawler._convert_dict_results_to_model(items)
+    except Exception as model_err:
+        logger.warning(f"모델 기반 결과 변환 오류 (원본 항목 사용): {str(model_err)}")
+        model_items = []
+    published = model_items or items
+    # 게시 확인 (변환 결과 수가 다르면 원본 항목 기준으로 게시 처리)
+    for item, result in zip(items, published if len(published) == len(items) else items):
+        crawling_state.bid_registry.bind(item, result)
+    for result in published:
+        if result not in crawling_state.results:
+            crawling_state.results.append(result)
+    await crawling_state.websocket_manager.send_results(crawling_state.results)
+    return published
+
+async def check_driver_memory(crawler, worker_id: int):
+    """브라우저 메모리 측정값 기록 후 한도를 넘으면 RecycleRequested 발생 (재시작 후 재개)"""
+    # 프로세스 트리 RSS 측정(/proc 탐색)은 블로킹 I/O이므로 스레드에서 실행
+    sample, reason = await asyncio.to_thread(crawler.memory_recycle_reason)
+    if sample:
+        samples = crawling_state.memory_samples.setdefault(worker_id, [])
+        samples.append(sample)
+        del samples[:-500]
+    if reason:
+        raise RecycleRequested(reason)
+
+def raise_if_driver_dead(crawler):
+    """브라우저 세션이 죽었으면 DriverDeadError 발생 (재시작 후 재개)"""
+    if driver_watchdog.is_dead(crawler):
+        reason = crawler.actor.dead_reason if crawler and crawler.actor else "크롤러 없음"
+        raise DriverDeadError(reason)
+
+def merge_detail_data(item, detail_data: Dict[str, Any]):
+    """상세 정보를 항목(딕셔너리 또는 BidItem 모델)에 병합"""
+    if isinstance(item, dict):
+        item.update(detail_data)
+        return
+    
+    # BidItem 모델 업데이트
+    for key, value in detail_data.items():
+        if hasattr(item, key):
+            setattr(item, key, value)
+        elif hasattr(item, 'additional_info'):
+            # additional_info에 저장
+            if item.additional_info is None:
+                item.additional_info = {}
+            item.additional_info[key] = value
+
+# 키워드 큐를 소비하는 크롤링 워커
+async def crawl_worker(worker_id: int, queue: asyncio.Queue, options: Dict[str, Any], log_prefix: str = ""):
+    """자신의 크롤러로 공유 큐에서 키워드를 꺼내 처리 (브라우저 장애 시 재시작 후 재개)"""
+    ws = crawling_state.websocket_manager
+    await crawling_state.update_worker(worker_id, state="starting")
+    
+    crawler = await start_worker_crawler(worker_id, options, log_prefix)
+    if not crawler:
+        await crawling_state.update_worker(worker_id, state="failed")
+        return
+    
+    checkpoint: Optional[ResumePoint] = None  # 처리 중인 키워드의 재개 지점
+    try:
+        while True:
             # 크롤링 중지 요청 확인
             if not crawling_state.is_running:
-                await crawling_state.websocket_manager.send_log("크롤링 중지 요청으로 작업을 종료합니다.")
+                await ws.send_log(f"{log_prefix}크롤링 중지 요청으로 작업을 종료합니다.")
                 break
             
-            # 키워드 로그
-            await crawling_state.websocket_manager.send_log(f"키워드 검색 중 ({idx+1}/{len(keywords)}): '{keyword}'")
+            if checkpoint is None:
+                try:
+                    keyword = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                checkpoint = ResumePoint(keyword)
+                
+                # 키워드 로그
+                done = len(crawling_state.processed_keywords)
+                await ws.send_log(f"{log_prefix}키워드 검색 중 ({done+1}/{crawling_state.total_keywords}): '{keyword}'")
+                await crawling_state.update_worker(worker_id, state="running", keyword=keyword, items_done=0, items_total=0, checkpoint=None)
+            keyword = checkpoint.keyword
             
             try:
-                # 키워드 검색 수행
-                search_success = await crawler.search_keyword(keyword)
+                keyword_results = await crawl_keyword(crawler, keyword, options, worker_id, log_prefix, checkpoint)
                 
-                if search_success:
-                    # 검색 결과 추출
-                    keyword_results = await crawler.extract_search_results(max_items=max_items)
-                else:
-                    keyword_results = []
+                # 결과를 전체 결과에 병합
+                for result in keyword_results:
+                    if result not in crawling_state.results:
+                        crawling_state.results.append(result)
+            except DriverDeadError:
+                # 브라우저 재시작 후 같은 키워드/페이지/행부터 재개
+                driver_watchdog.record_failure(crawler, checkpoint)
+                await ws.send_log(f"{log_prefix}브라우저 응답 없음, 재시작 후 재개합니다 (키워드 '{keyword}', {checkpoint.page}페이지 {checkpoint.row + 1}행)", "warning")
+                await crawling_state.update_worker(worker_id, state="recovering", checkpoint=checkpoint.as_dict())
                 
-                # 결과 처리
-                if keyword_results:
-                    result_count = len(keyword_results)
-                    await crawling_state.websocket_manager.send_log(f"키워드 '{keyword}' 검색 결과: {result_count}건")
-                    
-                    # 상세 페이지 정보 추출 (모든 항목 처리)
-                    detailed_items = []
-                    await crawling_state.websocket_manager.send_log(f"상세 정보 추출 시작: {result_count}개 항목")
-                    
-                    for idx, item in enumerate(keyword_results):
-                        if not crawling_state.is_running:
-                            break
-                            
-                        try:
-                            # 타이틀 정보 추출 (딕셔너리 또는 BidItem 모델에서)
-                            title = item.get('title', '') if isinstance(item, dict) else getattr(item, 'bid_title', '')
-                            await crawling_state.websocket_manager.send_log(f"항목 {idx+1}/{result_count} 상세 정보 추출 중: {title}")
-                            
-                            # 상세 페이지 처리
-                            detail_data = await crawler.process_detail_page(item)
-                            
-                            if detail_data:
-                                # 상세 정보 병합
-                                if isinstance(item, dict):
-                                    item.update(detail_data)
-                                else:
-                                    # BidItem 모델 업데이트
-                                    for key, value in detail_data.items():
-                                        if hasattr(item, key):
-                                            setattr(item, key, value)
-                                        elif hasattr(item, 'additional_info'):
-                                            # additional_info에 저장
-                                            if item.additional_info is None:
-                                                item.additional_info = {}
-                                            item.additional_info[key] = value
-                                
-                                await crawling_state.websocket_manager.send_log(f"항목 {idx+1} 상세 정보 추출 성공", "success")
-                            else:
-                                await crawling_state.websocket_manager.send_log(f"항목 {idx+1} 상세 정보 추출 실패", "warning")
-                            
-                            detailed_items.append(item)
-                            
-                        except Exception as detail_err:
-                            await crawling_state.websocket_manager.send_log(f"항목 {idx+1} 상세 정보 추출 오류: {str(detail_err)}", "error")
-                            detailed_items.append(item)  # 기본 정보만 추가
-                    
-                    await crawling_state.websocket_manager.send_log(f"상세 정보 추출 완료: {len(detailed_items)}개 항목")
-                    
-                    # 모델 기반 결과 가져오기
-                    try:
-                        model_items = await crawler.get_model_results()
-                        if model_items and len(model_items) > 0:
-                            await crawling_state.websocket_manager.send_log(f"모델 기반 결과 {len(model_items)}개 항목 추가", "success")
-                            detailed_items = model_items
-                    except Exception as model_err:
-                        await crawling_state.websocket_manager.send_log(f"모델 기반 결과 변환 오류 (무시하고 계속 진행): {str(model_err)}", "warning")
-                    
-                    # 결과를 전체 결과에 추가
-                    for result in detailed_items:
-                        if result not in crawling_state.results:
-                            crawling_state.results.append(result)
-                    
-                    # 현재까지의 처리 키워드 업데이트
-                    if keyword not in crawling_state.processed_keywords:
-                        crawling_state.processed_keywords.append(keyword)
-                    
-                    # 상태 및 결과 업데이트 브로드캐스트
-                    await crawling_state.websocket_manager.send_status(crawling_state.get_status())
-                    await crawling_state.websocket_manager.send_results(crawling_state.results)
+                crawler, seconds = await restart_worker_crawler(worker_id, crawler, options, log_prefix)
+                driver_watchdog.record_restart(seconds, crawler is not None)
+                if not crawler:
+                    # 다른 워커가 처리하도록 키워드를 큐에 되돌림 (선점한 공고도 해제)
+                    crawling_state.bid_registry.release(keyword)
+                    queue.put_nowait(keyword)
+                    await ws.send_error(f"{log_prefix}브라우저 재시작 실패, 워커를 종료합니다")
+                    break
+                
+                checkpoint.restarts += 1
+                if checkpoint.restarts > driver_watchdog.max_restarts:
+                    driver_watchdog.stats["abandoned_keywords"] += 1
+                    await ws.send_log(f"{log_prefix}키워드 '{keyword}' 재시작 횟수({driver_watchdog.max_restarts}) 초과로 건너뜁니다", "error")
+                    # 게시하지 못한 공고는 같은 공고를 찾은 다른 키워드가 처리하도록 선점 해제
+                    crawling_state.bid_registry.release(keyword)
+                    checkpoint = None
                 else:
-                    await crawling_state.websocket_manager.send_log(f"키워드 '{keyword}'에 대한 검색 결과가 없습니다.")
-                    # 처리된 키워드로 추가
-                    if keyword not in crawling_state.processed_keywords:
-                        crawling_state.processed_keywords.append(keyword)
-                    
-                    # 상태 업데이트 브로드캐스트
-                    await crawling_state.websocket_manager.send_status(crawling_state.get_status())
+                    await crawling_state.update_worker(worker_id, state="running")
+                continue
+            except RecycleRequested as reason:
+                # 메모리/페이지 수 한도: 장애가 아니므로 재시작 횟수 제한 없이 같은 지점부터 재개
+                crawling_state.memory_recycles += 1
+                await ws.send_log(f"{log_prefix}브라우저 메모리 한도 도달 ({reason}), 재시작 후 {checkpoint.row + 1}행부터 재개합니다")
+                await crawling_state.update_worker(worker_id, state="recycling", checkpoint=checkpoint.as_dict())
+                
+                crawler, seconds = await restart_worker_crawler(worker_id, crawler, options, log_prefix)
+                logger.info(f"메모리 한도 재시작 {'완료' if crawler else '실패'} ({seconds:.1f}초)")
+                if not crawler:
+                    crawling_state.bid_registry.release(keyword)
+                    queue.put_nowait(keyword)
+                    await ws.send_error(f"{log_prefix}브라우저 재시작 실패, 워커를 종료합니다")
+                    break
+                await crawling_state.update_worker(worker_id, state="running")
+                continue
             except Exception as e:
                 logger.error(f"키워드 '{keyword}' 처리 중 오류: {str(e)}")
-                await crawling_state.websocket_manager.send_log(f"키워드 '{keyword}' 처리 중 오류: {str(e)}", "error")
+                await ws.send_log(f"{log_prefix}키워드 '{keyword}' 처리 중 오류: {str(e)}", "error")
                 
-                # 오류가 발생해도 계속 진행
+                # 오류가 발생해도 계속 진행 (게시하지 못한 공고는 선점 해제)
+                crawling_state.bid_registry.release(keyword)
+                checkpoint = None
                 continue
+            
+            checkpoint = None
+            
+            # 현재까지의 처리 키워드 업데이트
+            if keyword not in crawling_state.processed_keywords:
+                crawling_state.processed_keywords.append(keyword)
+            crawling_state.workers[worker_id]["keywords_done"] += 1
+            
+            # 상태 및 결과 업데이트 브로드캐스트
+            await ws.send_status(crawling_state.get_status())
+            if keyword_results:
+                await ws.send_results(crawling_state.results)
+    finally:
+        # 크롤러 종료 (풀에서 임대한 경우 반납)
+        if crawler:
+            await stop_worker_crawler(worker_id, crawler)
+        await crawling_state.update_worker(worker_id, state="done", keyword=None)
+
+async def start_worker_crawler(worker_id: int, options: Dict[str, Any], log_prefix: str = ""):
+    """워커 크롤러 준비 후 검색 조건 설정 (실패 시 None)"""
+    ws = crawling_state.websocket_manager
+    crawler, pooled = await acquire_crawler(worker_id, options, log_prefix)
+    if not crawler:
+        return None
+    
+    crawling_state.crawlers[worker_id] = crawler
+    if pooled:
+        crawling_state.pooled_workers.add(worker_id)
+    
+    # 검색 조건 설정 (현재 페이지 상태를 확인해 충족되지 않은 단계만 적용, 워밍된 브라우저는 대부분 생략)
+    await ws.send_log(f"{log_prefix}검색 조건 설정 중...")
+    try:
+        prepared = await crawler.prepare_search()
+    except Exception as e:
+        logger.error(f"검색 조건 설정 중 오류: {str(e)}")
+        logger.debug(traceback.format_exc())
+        prepared = False
+    if not prepared:
+        await ws.send_log(f"{log_prefix}검색 조건 설정 중 오류 발생 (무시하고 계속 진행)", "warning")
+    return crawler
+
+async def stop_worker_crawler(worker_id: int, crawler):
+    """워커 크롤러 종료 (풀에서 임대한 경우 반납, 응답 없으면 폐기)"""
+    crawling_state.crawlers.pop(worker_id, None)
+    if worker_id in crawling_state.pooled_workers:
+        crawling_state.pooled_workers.discard(worker_id)
+        if driver_watchdog.is_dead(crawler):
+            await driver_pool.discard(crawler)
+        else:
+            await driver_pool.release(crawler)
+    else:
+        await crawler.close()
+
+async def restart_worker_crawler(worker_id: int, crawler, options: Dict[str, Any], log_prefix: str = ""):
+    """
+    크롤러를 종료하고 새 크롤러로 교체 (입찰공고 목록 페이지까지 이동)
+    
+    Returns:
+        (새 크롤러 또는 None, 소요 시간 초) 튜플
+    """
+    start = time.perf_counter()
+    await stop_worker_crawler(worker_id, crawler)
+    new_crawler = await start_worker_crawler(worker_id, options, log_prefix)
+    return new_crawler, time.perf_counter() - start
+
+# 브라우저 없는 HTTP 수집 (세션 캡처 후 요청 재전송)
+async def crawl_http(keywords: List[str], options: Dict[str, Any]):
+    """
+    브라우저로 첫 키워드를 한 번 검색하여 세션/요청을 캡처한 뒤,
+    모든 키워드의 목록과 상세 정보를 공유 aiohttp 세션으로 수집
+
+    처리한 키워드는 crawling_state.processed_keywords에 기록되며,
+    캡처에 실패하면 아무 키워드도 처리하지 않고 반환합니다 (브라우저 수집으로 대체).
+    """
+    ws = crawling_state.websocket_manager
+    worker_id = 0
+    await crawling_state.update_worker(worker_id, state="starting")
+
+    # 1. 브라우저로 세션과 목록/상세 요청 캡처
+    crawler, pooled = await acquire_crawler(worker_id, options)
+    if not crawler:
+        await crawling_state.update_worker(worker_id, state="failed")
+        return
+
+    try:
+        # 검색 조건은 검색 시 prepare_search가 필요한 단계만 적용
+        await ws.send_log(f"HTTP 수집용 세션 캡처 중: '{keywords[0]}'")
+        templates = await crawler.capture_http_templates(keywords[0])
+    finally:
+        if pooled:
+            await driver_pool.release(crawler)
+        else:
+            await crawler.close()
+
+    if not templates:
+        await ws.send_log("HTTP 수집용 요청 캡처 실패", "warning")
+        await crawling_state.update_worker(worker_id, state="failed")
+        return
+
+    # 2. 공유 세션으로 키워드별 목록/상세 요청 재전송
+    fetcher = G2BHttpFetcher(
+        templates["session"],
+        templates["list_request"],
+        templates["detail_request"],
+        concurrency=options["http_concurrency"]
+    )
+    crawling_state.http_fetcher = fetcher
+    await ws.send_log(f"HTTP 수집 시작: {len(keywords)}개 키워드, 동시 요청 {fetcher.concurrency}개")
+    await crawling_state.update_worker(worker_id, state="running", keyword=None, items_done=0, items_total=0)
+
+    async def fetch_keyword(keyword: str):
+        mark = keyword_watermark(keyword, options)
+        items = await fetcher.fetch_all(keyword, max_items=options["max_items"], stop_when=mark.all_known if mark else None)
+        if items and mark:
+            # 증분 모드: 이전 실행에서 처리한 공고는 상세 요청 전에 제외
+            new_items = [item for item in items if not mark.is_known(item)]
+            mark.skipped += len(items) - len(new_items)
+            items = new_items
+        # 캡처한 목록 요청에 검색 폼 기간이 들어가지만, 응답 중 기간 밖 항목은 상세 요청 전에 제외
+        date_range = options["date_range"]
+        if items and date_range.active:
+            items = [item for item in items if date_range.contains(item)]
+        # 다른 키워드에서 이미 받은 공고는 상세 요청 없이 키워드만 기존 결과에 추가
+        items = [item for item in items or [] if crawling_state.bid_registry.claim(item, keyword)]
+        detailed = []
+        if items:
+            details = await fetcher.fetch_details(items)
+            for item, detail_data in zip(items, details):
+                if detail_data:
+                    merge_detail_data(item, detail_data)
+                    detailed.append(item)
+        return keyword, items, detailed, mark
+
+    async with fetcher:
+        pending = [asyncio.create_task(fetch_keyword(keyword)) for keyword in keywords]
+        for task in asyncio.as_completed(pending):
+            if not crawling_state.is_running:
+                for other in pending:
+                    other.cancel()
+                await ws.send_log("크롤링 중지 요청으로 HTTP 수집을 종료합니다.")
+                break
+            try:
+                keyword, items, detailed, mark = await task
+            except Exception as e:
+                # 처리하지 못한 키워드는 processed_keywords에 넣지 않아 브라우저 수집으로 넘어감
+                logger.error(f"HTTP 수집 중 오류 (브라우저 수집으로 대체): {str(e)}")
+                await ws.send_log(f"HTTP 수집 중 오류 (브라우저 수집으로 대체): {str(e)}", "error")
+                continue
+
+            # 캡처용 크롤러는 이미 반납/종료했으므로 인스턴스 없이 변환
+            model_items = await G2BCrawler._convert_dict_results_to_model(items) if items else []
+            for item, result in zip(items, model_items if len(model_items) == len(items) else items):
+                crawling_state.bid_registry.bind(item, result)
+            crawling_state.results.extend(model_items or items)
+            # 증분 모드: 상세 정보를 받아 게시한 공고만 기준점에 반영하고, 중지되지 않은 경우에만 저장
+            if mark:
+                mark.observe_all(detailed)
+                if crawling_state.is_running:
+                    options["watermarks"].commit(mark)
+            crawling_state.processed_keywords.append(keyword)
+            crawling_state.workers[worker_id]["keywords_done"] += 1
+            await ws.send_log(f"키워드 '{keyword}' HTTP 수집 완료: {len(items)}건", "success" if items else "info")
+            await ws.send_status(crawling_state.get_status())
+            if items:
+                await ws.send_results(crawling_state.results)
+
+    stats = fetcher.get_stats()
+    await ws.send_log(f"HTTP 수집 통계: 요청 {stats['requests']}건, 오류 {stats['errors']}건, 수신 {stats['bytes']}바이트")
+    await crawling_state.update_worker(worker_id, state="done", keyword=None)
+
+# 크롤링 실행 함수 (백그라운드 태스크)
+async def run_crawling(keywords: List[str], headless: bool = True, start_date: Optional[str] = None, end_date: Optional[str] = None, date_field: str = "posting", max_items: int = 10000, concurrency: int = 1, lean_fetch: bool = False, lean_fetch_profiles: Optional[Dict[str, Any]] = None, detail_tabs: int = 1, fetch_mode: str = "browser", http_concurrency: int = 8, incremental: bool = False, use_search_cache: bool = True):
+    """크롤링 실행 (백그라운드 태스크)"""
+    # 워커 공통 실행 옵션
+    options = {
+        "headless": headless,
+        "max_items": max_items,
+        "lean_fetch": lean_fetch,
+        "lean_fetch_profiles": lean_fetch_profiles,
+        "detail_tabs": detail_tabs,
+        "http_concurrency": http_concurrency,
+        "date_range": DateRange(start_date, end_date, date_field),
+        "watermarks": WatermarkStore() if incremental else None,
+        "search_cache": use_search_cache
+    }
+    crawling_state.date_range = options["date_range"]
+    crawling_state.watermarks = options["watermarks"]
+    if incremental:
+        await crawling_state.websocket_manager.send_log("증분 수집 모드: 이전 실행 이후 새로 올라오거나 정정된 공고만 처리합니다.")
+    if options["date_range"].active:
+        await crawling_state.websocket_manager.send_log(
+            f"검색 기간: {options['date_range'].label} {start_date or '제한 없음'} ~ {end_date or '제한 없음'}"
+        )
+    
+    try:
+        if fetch_mode == "http":
+            await crawl_http(keywords, options)
+            keywords = [keyword for keyword in keywords if keyword not in crawling_state.processed_keywords]
+            if keywords and crawling_state.is_running:
+                await crawling_state.websocket_manager.send_log(f"HTTP 수집 실패 키워드 {len(keywords)}개는 브라우저로 수집합니다.", "warning")
+        
+        # 공유 키워드 큐 구성
+        queue: asyncio.Queue = asyncio.Queue()
+        for keyword in keywords:
+            queue.put_nowait(keyword)
+        
+        # HTTP 수집으로 모두 처리했으면 브라우저 워커를 띄우지 않음
+        worker_count = min(concurrency, len(keywords)) if crawling_state.is_running else 0
+        
+        if worker_count > 0:
+            # 키워드 크롤링 수행
+            await crawling_state.websocket_manager.send_log(f"검색 시작: {len(keywords)}개 키워드, 워커 {worker_count}개")
+            
+            # 워커별로 자신의 브라우저를 사용하여 병렬 처리
+            workers = []
+            for worker_id in range(worker_count):
+                log_prefix = f"[워커 {worker_id + 1}] " if worker_count > 1 else ""
+                workers.append(crawl_worker(worker_id, queue, options, log_prefix))
+            await asyncio.gather(*workers)
         
         # 크롤링 종료
         await crawling_state.websocket_manager.send_log("모든 키워드 처리 완료")
+        dedup = crawling_state.bid_registry.get_stats()
+        if dedup["detail_fetches_saved"]:
+            await crawling_state.websocket_manager.send_log(f"키워드 간 중복 공고 {dedup['detail_fetches_saved']}건의 상세 정보 추출을 생략했습니다 (여러 키워드에 나온 공고 {dedup['multi_keyword_bids']}건)")
         
         # 결과 저장
         if crawling_state.results:
@@ -896,17 +1631,19 @@ async def run_crawling(keywords: List[str], headless: bool = True, start_date: O
         logger.error(f"크롤링 실행 중 오류: {str(e)}")
         await crawling_state.websocket_manager.send_error(f"크롤링 실행 중 오류: {str(e)}", stopped=True)
     finally:
-        # 크롤러 종료
-        if crawling_state.crawler:
-            await crawling_state.crawler.close()
-            crawling_state.crawler = None
-        
         # 상태 업데이트
         crawling_state.is_running = False
         crawling_state.end_time = datetime.now()
         
+        # 이벤트 루프 블로킹 통계 기록
+        lag_stats = loop_monitor.get_stats()
+        logger.info(f"이벤트 루프 지연 통계: {lag_stats}")
+        
         # 최종 상태 업데이트 브로드캐스트
         await crawling_state.websocket_manager.send_status(crawling_state.get_status())
+        await crawling_state.websocket_manager.send_log(
+            f"이벤트 루프 최대 지연 {lag_stats['max_lag_ms']}ms, 블로킹 누적 {lag_stats['blocked_ms']}ms"
+        )
         await crawling_state.websocket_manager.send_log("크롤링 작업이 완료되었습니다.")
 
 
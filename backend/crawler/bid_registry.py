@@ -0,0 +1,197 @@
+"""
+공고 중복 등록 모듈
+
+"AI", "인공지능", "머신러닝"처럼 겹치는 키워드로 검색하면 같은 공고가 여러 키워드에서 나옵니다.
+실행 단위로 공고번호 + 차수 키를 기록하여, 이미 본 공고는 상세 페이지 처리 전에 건너뛰고
+기존 결과에 검색 키워드만 추가합니다.
+처음 찾은 키워드가 결과를 게시(bind)하기 전까지는 선점 상태이며, 그 키워드가 중단/포기되면
+선점을 해제(release)하여 같은 공고를 찾은 다른 키워드가 다시 선점하고 처리합니다.
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from backend.crawler.detail_link import DEFAULT_REVISION, decode_bid_reference
+
+# 로거 설정
+logger = logging.getLogger("backend.crawler.bid_registry")
+
+BidKey = Tuple[str, str]
+
+def _field(item, key: str) -> Any:
+    """딕셔너리 또는 BidItem 모델에서 값 조회"""
+    if isinstance(item, dict):
+        return item.get(key)
+    return getattr(item, key, None)
+
+def bid_key(item) -> Optional[BidKey]:
+    """
+    항목의 공고번호 + 차수 키 생성
+
+    Args:
+        item: 검색 결과 항목 (딕셔너리 또는 BidItem 모델)
+
+    Returns:
+        (공고번호, 차수) 튜플 (공고번호가 없으면 None, 중복 확인 불가)
+    """
+    bid_number = str(_field(item, "bid_number") or "").strip()
+    revision = _field(item, "bid_revision")
+    if isinstance(item, dict) and (not revision or not bid_number):
+        # 공고번호 텍스트의 차수 표기(R25BK01234567-000) 또는 onclick 인자에서 해석
+        reference = decode_bid_reference(item)
+        if reference:
+            bid_number = reference["bid_number"]
+            revision = revision or reference["revision"]
+    if not bid_number:
+        return None
+    return bid_number, str(revision or DEFAULT_REVISION).zfill(3)
+
+class BidRegistry:
+    """실행 단위 공고 중복 확인 및 키워드 병합 클래스"""
+
+    def __init__(self):
+        """초기화"""
+        self.records: Dict[BidKey, Any] = {}  # 키별 대표 결과 (처리 중에는 딕셔너리, 게시 후에는 모델)
+        self.keywords: Dict[BidKey, List[str]] = {}  # 키별 검색 키워드 (처음 찾은 키워드 우선)
+        self.owners: Dict[BidKey, str] = {}  # 게시 전인 키의 선점 키워드
+        self._settled: Dict[BidKey, asyncio.Event] = {}  # 게시/해제 대기 이벤트
+        self.stats = {
+            "registered": 0,
+            "duplicates": 0,
+            "unkeyed": 0,
+            "released": 0,
+            "reclaimed": 0
+        }
+
+    def claim(self, item, keyword: str) -> bool:
+        """
+        항목을 등록하고 상세 정보 처리 대상인지 확인
+
+        이미 등록된 공고면 기존 결과에 키워드만 추가합니다.
+
+        Args:
+            item: 검색 결과 항목
+            keyword: 항목을 찾은 검색 키워드
+
+        Returns:
+            bool: 처음 본 공고(또는 키를 만들 수 없는 항목)이면 True, 중복이면 False
+                  (중복이지만 선점한 키워드가 아직 게시하지 않았으면 is_published/wait_settled로 확인 후 반영)
+        """
+        key = bid_key(item)
+        if key is None:
+            self.stats["unkeyed"] += 1
+            return True
+
+        if key not in self.records:
+            self.records[key] = item
+            self.keywords[key] = [keyword]
+            self.owners[key] = keyword
+            self.stats["registered"] += 1
+            self._write_keywords(item, self.keywords[key])
+            return True
+
+        self.stats["duplicates"] += 1
+        keywords = self.keywords[key]
+        if keyword not in keywords:
+            keywords.append(keyword)
+            self._write_keywords(self.records[key], keywords)
+        logger.info(f"중복 공고 상세 처리 생략: {key[0]}-{key[1]} (키워드: {', '.join(keywords)})")
+        return False
+
+    def bind(self, source, result):
+        """
+        처리한 항목을 게시용 결과(모델)로 교체하여 이후 중복 키워드가 게시된 결과에 반영되도록 함
+
+        Args:
+            source: claim에 사용한 원본 항목
+            result: 변환된 결과 (BidItem 모델 또는 딕셔너리)
+        """
+        key = bid_key(source)
+        if key is None or self.records.get(key) is not source:
+            return
+        self.records[key] = result
+        self._write_keywords(result, self.keywords[key])
+        self.owners.pop(key, None)
+        self._settle(key)
+
+    def is_published(self, item) -> bool:
+        """처음 찾은 키워드가 결과를 게시했는지 확인"""
+        key = bid_key(item)
+        return key is not None and key in self.records and key not in self.owners
+
+    def reclaim(self, item, keyword: str) -> bool:
+        """
+        선점이 해제된 공고를 다시 선점
+
+        Returns:
+            bool: 선점했으면 True (다른 키워드가 선점 중이거나 이미 게시되었으면 False)
+        """
+        key = bid_key(item)
+        if key is None or key in self.records:
+            return False
+        self.claim(item, keyword)
+        self.stats["reclaimed"] += 1
+        return True
+
+    def release(self, keyword: str) -> int:
+        """
+        키워드가 선점했지만 게시하지 않은 공고의 선점 해제 (키워드 중단/포기 시)
+
+        Returns:
+            int: 해제한 공고 수
+        """
+        keys = [key for key, owner in self.owners.items() if owner == keyword]
+        for key in keys:
+            del self.owners[key]
+            self.records.pop(key, None)
+            self.keywords.pop(key, None)
+            self._settle(key)
+        if keys:
+            self.stats["released"] += len(keys)
+            logger.info(f"키워드 '{keyword}'가 게시하지 않은 공고 {len(keys)}건 선점 해제")
+        return len(keys)
+
+    async def wait_settled(self, item, keep_waiting: Callable[[], bool], interval: float = 1.0):
+        """
+        다른 키워드가 선점한 공고가 게시되거나 선점이 해제될 때까지 대기
+
+        Args:
+            item: 대기할 항목
+            keep_waiting: 계속 기다릴지 확인하는 함수 (예: 크롤링 진행 중 여부)
+            interval: keep_waiting 확인 간격 (초)
+        """
+        key = bid_key(item)
+        if key is None or key not in self.owners:
+            return
+        event = self._settled.setdefault(key, asyncio.Event())
+        while not event.is_set() and keep_waiting():
+            try:
+                await asyncio.wait_for(event.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def _settle(self, key: BidKey):
+        """게시/해제를 기다리는 키워드 깨우기"""
+        event = self._settled.pop(key, None)
+        if event:
+            event.set()
+
+    @staticmethod
+    def _write_keywords(record, keywords: List[str]):
+        """결과에 검색 키워드 목록 기록 (모델은 additional_info에 저장)"""
+        if isinstance(record, dict):
+            record["keywords"] = list(keywords)
+            return
+        if getattr(record, "additional_info", None) is None:
+            record.additional_info = {}
+        record.additional_info["keywords"] = list(keywords)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """등록/중복 통계 반환 (중복 수 - 재선점 수 = 생략한 상세 페이지 처리 수)"""
+        return {
+            **self.stats,
+            "pending": len(self.owners),
+            "detail_fetches_saved": self.stats["duplicates"] - self.stats["reclaimed"],
+            "multi_keyword_bids": sum(1 for keywords in self.keywords.values() if len(keywords) > 1)
+        }
@@ -4,7 +4,6 @@
 모든 크롤러의 기본 클래스와 유틸리티 함수를 제공합니다.
 """
 
-import asyncio
 import logging
 import traceback
 import os
@@ -13,7 +12,7 @@ from pathlib import Path
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-import chromedriver_autoinstaller
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
@@ -21,9 +20,25 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 
+from backend.crawler.driver_actor import DriverActor
+from backend.crawler.driver_resolver import driver_resolver
+from backend.crawler.lean_fetch import LeanFetch
+from backend.crawler.wait_engine import WaitEngine
+from backend.crawler.popup_guard import PopupGuard
+from backend.crawler.page_state import PageStateMachine
+from backend.crawler.grid_capture import GridCapture
+from backend.crawler.launch_profile import LaunchProfile
+from backend.crawler.memory_governor import MemoryGovernor, MEMORY_GOVERNOR, kill_process_tree
+
 # 로거 설정
 logger = logging.getLogger("backend.crawler.base")
 
+# 그리드 응답 수집용 성능 로그 사용 여부
+GRID_CAPTURE = os.environ.get("GRID_CAPTURE", "true").lower() != "false"
+
+# 브라우저 시작 제한 시간 (초, chromedriver 다운로드 포함)
+DRIVER_START_TIMEOUT = float(os.environ.get("DRIVER_START_TIMEOUT", "180"))
+
 # 결과 저장 경로
 RESULTS_DIR = Path(__file__).parent / "results"
 RESULTS_DIR.mkdir(exist_ok=True)
@@ -31,25 +46,38 @@ RESULTS_DIR.mkdir(exist_ok=True)
 class CrawlerBase:
     """모든 크롤러의 기본 클래스"""
     
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, launch_profile: LaunchProfile = None):
         """
         크롤러 초기화
         
         Args:
             headless (bool): 헤드리스 모드 사용 여부
+            launch_profile (LaunchProfile): Chrome 실행 프로필 (None이면 환경 변수 설정으로 생성)
         """
         self.driver = None
         self.wait = None
+        self.actor = None  # 드라이버 전용 스레드 액터
+        self.lean_fetch = None  # 페이지 유형별 리소스 차단 (기본 비활성화)
+        self.wait_engine = None  # 조건 기반 적응형 대기 엔진
+        self.popup_guard = None  # 주입 스크립트 기반 팝업 자동 닫기
+        self.grid_capture = None  # 검색 결과 그리드 JSON 응답 수집 (성능 로그 사용 시)
+        self.memory_governor = None  # 브라우저 프로세스 트리 메모리 측정 및 재시작 판단
         self.headless = headless
-        self.current_page = None  # 페이지 상태 추적
+        self.launch_profile = launch_profile or LaunchProfile()  # 실행 플래그, 사용자 데이터 디렉토리, 캐시 시드
+        self.current_page = None  # 페이지 상태 추적 (마지막으로 확인/설정한 페이지 이름)
+        self.page_state = None  # 실제 페이지 상태 확인 및 필요한 전이 판단
     
     async def initialize(self):
         """크롤러 초기화 및 웹드라이버 설정"""
+        service = None
         try:
             logger.info("크롤러 초기화 시작")
             
-            # ChromeDriver 자동 설치
-            chromedriver_autoinstaller.install(True)
+            # 드라이버 전용 스레드 생성 (이벤트 루프 블로킹 방지)
+            self.actor = DriverActor()
+            
+            # ChromeDriver 경로 확인 (Chrome 주 버전별 캐시, 프로세스당 1회 검증)
+            driver_path = await self.actor.run(driver_resolver.resolve, deadline=DRIVER_START_TIMEOUT)
             
             # Chrome 옵션 설정
             chrome_options = Options()
@@ -59,26 +87,54 @@ class CrawlerBase:
                 chrome_options.add_argument('--headless=new')
                 logger.info("헤드리스 모드 활성화")
             
+            # 실행 프로필 플래그 및 사용자 데이터/캐시 디렉토리 (시드 복사는 드라이버 스레드에서)
+            await self.actor.run(self.launch_profile.apply, chrome_options)
+            
             # 기타 옵션 설정
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--window-size=1920,1080')
-            chrome_options.add_argument('--disable-popup-blocking')
-            chrome_options.add_argument('--lang=ko_KR.UTF-8')
             chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
             chrome_options.add_experimental_option("useAutomationExtension", False)
             chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36')
             
-            # 웹드라이버 초기화
-            self.driver = webdriver.Chrome(options=chrome_options)
+            # 그리드 XHR 응답 수집을 위한 성능 로그 활성화
+            if GRID_CAPTURE:
+                chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+            
+            # 웹드라이버 초기화 (드라이버 스레드에서 생성, 시작 중 멈추면 서비스 프로세스를 강제 종료하기 위해 직접 생성)
+            service = Service(driver_path) if driver_path else Service()
+            self.driver = await self.actor.run(webdriver.Chrome, service=service, options=chrome_options, deadline=DRIVER_START_TIMEOUT)
             self.wait = WebDriverWait(self.driver, 10)
+            self.lean_fetch = LeanFetch(self.driver, self.actor)
+            self.wait_engine = WaitEngine(self.driver, self.actor)
+            await self.wait_engine.install()
+            self.popup_guard = PopupGuard(self.driver, self.actor)
+            await self.popup_guard.install()
+            self.page_state = PageStateMachine(self.driver, self.actor)
+            if GRID_CAPTURE:
+                self.grid_capture = GridCapture(self.driver, self.actor)
+            if MEMORY_GOVERNOR:
+                self.memory_governor = MemoryGovernor(self._driver_pid())
             
             logger.info("크롤러 초기화 성공")
             return True
         except Exception as e:
             logger.error(f"크롤러 초기화 실패: {str(e)}")
             logger.debug(traceback.format_exc())
+            # 사용자 데이터 디렉토리 정리 전에 브라우저 종료 (시작 후 설정 단계 실패 또는 시작 중 멈춤)
+            if self.driver and self.actor and not self.actor.dead:
+                try:
+                    await self.actor.run(self.driver.quit, deadline=30)
+                except Exception as quit_err:
+                    logger.warning(f"초기화 실패한 웹드라이버 종료 중 오류: {str(quit_err)}")
+            process = getattr(service, "process", None)
+            if process and process.poll() is None:
+                kill_process_tree(process.pid)
+                logger.warning(f"초기화 실패한 chromedriver 강제 종료 (pid {process.pid})")
+            self.driver = None
+            self.wait = None
+            if self.actor:
+                self.actor.shutdown()
+                self.actor = None
+            self.launch_profile.cleanup(save_seed=False)
             return False
     
     """ 웹드라이버 종료 """
@@ -87,31 +143,82 @@ class CrawlerBase:
         if self.driver:
             try:
                 logger.info("웹드라이버 종료 시작")
-                
-                # 열려있는 모든 팝업창 닫기
-                try:
-                    main_window = self.driver.current_window_handle
-                    for handle in self.driver.window_handles:
-                        if handle != main_window:
-                            self.driver.switch_to.window(handle)
-                            self.driver.close()
-                    self.driver.switch_to.window(main_window)
-                except Exception as e:
-                    logger.warning(f"팝업창 닫기 중 오류 (무시): {str(e)}")
-                
-                # 드라이버 종료
-                self.driver.quit()
+                if self.actor.dead:
+                    # 응답 없는 세션은 드라이버 스레드를 거치지 않고 강제 종료
+                    self._kill_driver()
+                else:
+                    await self.actor.run(self._quit_driver, deadline=30)
+                    # 정상 종료한 경우에만 캐시를 시드로 저장
+                    await self.actor.run(self.launch_profile.cleanup, save_seed=True, deadline=60)
                 logger.info("웹드라이버 종료 완료")
             except Exception as e:
                 logger.error(f"웹드라이버 종료 중 오류: {str(e)}")
+                self._kill_driver()
             finally:
+                # 임시 사용자 데이터 디렉토리 정리 (이미 정리했으면 무시)
+                self.launch_profile.cleanup(save_seed=False)
                 self.driver = None
                 self.wait = None
+                self.lean_fetch = None
+                self.wait_engine = None
+                self.popup_guard = None
+                self.page_state = None
+                self.grid_capture = None
+                self.memory_governor = None
                 self.current_page = None
+        
+        if self.actor:
+            self.actor.shutdown()
+            self.actor = None
+    
+    def _quit_driver(self):
+        """팝업창을 닫고 드라이버 종료 (드라이버 스레드에서 실행)"""
+        # 열려있는 모든 팝업창 닫기
+        try:
+            main_window = self.driver.current_window_handle
+            for handle in self.driver.window_handles:
+                if handle != main_window:
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+            self.driver.switch_to.window(main_window)
+        except Exception as e:
+            logger.warning(f"팝업창 닫기 중 오류 (무시): {str(e)}")
+        
+        # 드라이버 종료
+        self.driver.quit()
+    
+    def _driver_pid(self):
+        """chromedriver 프로세스 pid (Chrome 프로세스 트리의 루트)"""
+        process = getattr(getattr(self.driver, "service", None), "process", None)
+        return process.pid if process else None
+    
+    def _kill_driver(self):
+        """chromedriver와 하위 Chrome 프로세스 강제 종료 (이벤트 루프 스레드에서 직접 실행)
+        
+        멈춘 드라이버 스레드의 명령은 연결이 끊기면서 오류로 끝납니다.
+        """
+        try:
+            process = getattr(getattr(self.driver, "service", None), "process", None)
+            if process and process.poll() is None:
+                kill_process_tree(process.pid)
+                logger.warning(f"응답 없는 chromedriver 강제 종료 (pid {process.pid})")
+        except Exception as e:
+            logger.warning(f"chromedriver 강제 종료 중 오류 (무시): {str(e)}")
     
     """ 팝업창 닫기 """
     async def close_popups(self):
         """팝업창 닫기 (통합 버전)"""
+        try:
+            # 주입 스크립트가 페이지 안에서 이미 닫았으면 기록만 수집
+            if self.popup_guard and self.popup_guard.installed:
+                if await self.actor.run(self.popup_guard.dismiss_sync) is not None:
+                    return
+            await self.actor.run(self._close_popups_sync)
+        except Exception as e:
+            logger.warning(f"팝업창 닫기 중 오류 (계속 진행): {str(e)}")
+    
+    def _close_popups_sync(self):
+        """팝업창 닫기 (주입 스크립트를 사용할 수 없을 때, 드라이버 스레드에서 실행)"""
         try:
             # 모든 팝업창 탐색 및 닫기
             logger.info("팝업창 닫기 시도 중...")
@@ -148,7 +255,7 @@ class CrawlerBase:
                 )
                 notice_close.click()
                 logger.info("공지사항 팝업 닫기 성공")
-                await asyncio.sleep(0.5)
+                time.sleep(0.5)
             except Exception:
                 pass
             
@@ -164,7 +271,7 @@ class CrawlerBase:
                     button.click()
                     closed_count += 1
                     logger.info(f"페이지 내 팝업창 닫기 성공: {button_id}")
-                    await asyncio.sleep(0.3)
+                    time.sleep(0.3)
                 except Exception:
                     pass
             
@@ -172,7 +279,7 @@ class CrawlerBase:
             try:
                 actions = ActionChains(self.driver)
                 actions.send_keys(Keys.ESCAPE).perform()
-                await asyncio.sleep(0.5)
+                time.sleep(0.5)
             except Exception:
                 pass
                 
@@ -196,7 +303,9 @@ class CrawlerBase:
                 logger.info("웹드라이버 종료 완료")
             except:
                 pass
-    
+        if getattr(self, 'actor', None):
+            self.actor.shutdown()
+
 
         """상세 페이지 내 팝업 처리"""
         try:
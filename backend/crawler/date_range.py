@@ -0,0 +1,112 @@
+"""
+검색 기간 모듈
+
+/api/start의 startDate/endDate를 나라장터 검색 폼의 기간 조건(공고게시일자 또는 입찰마감일자)으로
+넘기기 위한 값으로 정규화하고, 검색 결과 중 기간 밖 항목을 문자열 비교만으로 걸러냅니다.
+"""
+
+import logging
+import re
+from typing import Any, Dict, Optional
+
+# 로거 설정
+logger = logging.getLogger("backend.crawler.date_range")
+
+# 기간 기준별 검색 폼 조회기준 선택 문구와 항목 날짜 키 (앞쪽 우선)
+DATE_FIELDS = {
+    "posting": {"label": "게시", "item_keys": ["date_start", "start_date"]},
+    "deadline": {"label": "마감", "item_keys": ["date_end", "deadline"]}
+}
+
+DATE_PATTERN = re.compile(r"(\d{4})\D?(\d{1,2})\D?(\d{1,2})")
+
+def normalize_date(value: Any) -> Optional[str]:
+    """
+    날짜 문자열을 YYYYMMDD 형식으로 변환
+
+    Args:
+        value: 날짜 문자열 (예: 2024-03-01, 2024/03/01 10:00, 20240301)
+
+    Returns:
+        str: YYYYMMDD (날짜를 찾지 못하면 None)
+    """
+    if not value:
+        return None
+    match = DATE_PATTERN.search(str(value))
+    if not match:
+        return None
+    year, month, day = match.groups()
+    if not (1 <= int(month) <= 12 and 1 <= int(day) <= 31):
+        return None
+    return f"{year}{int(month):02d}{int(day):02d}"
+
+class DateRange:
+    """검색 기간 조건 및 결과 필터"""
+
+    def __init__(self, start: Optional[str] = None, end: Optional[str] = None, field: str = "posting"):
+        """
+        초기화
+
+        Args:
+            start: 시작일 (비우면 제한 없음)
+            end: 종료일 (비우면 제한 없음)
+            field: 기간 기준 (posting: 공고게시일자, deadline: 입찰마감일자)
+
+        Raises:
+            ValueError: 날짜 형식이 잘못되었거나 시작일이 종료일보다 늦은 경우
+        """
+        if field not in DATE_FIELDS:
+            raise ValueError(f"기간 기준은 {', '.join(DATE_FIELDS)} 중 하나여야 합니다: {field}")
+        self.start = normalize_date(start)
+        self.end = normalize_date(end)
+        if start and not self.start:
+            raise ValueError(f"시작일 형식이 올바르지 않습니다: {start}")
+        if end and not self.end:
+            raise ValueError(f"종료일 형식이 올바르지 않습니다: {end}")
+        if self.start and self.end and self.start > self.end:
+            raise ValueError(f"시작일({start})이 종료일({end})보다 늦습니다")
+        self.field = field
+        self.stats = {"checked": 0, "filtered": 0, "undated": 0}
+
+    @property
+    def active(self) -> bool:
+        """기간 조건이 하나라도 있는지 여부"""
+        return bool(self.start or self.end)
+
+    @property
+    def label(self) -> str:
+        """검색 폼 조회기준 선택 문구"""
+        return DATE_FIELDS[self.field]["label"]
+
+    def item_date(self, item) -> Optional[str]:
+        """항목의 기준 날짜 (YYYYMMDD, 없으면 None)"""
+        for key in DATE_FIELDS[self.field]["item_keys"]:
+            value = item.get(key) if isinstance(item, dict) else getattr(item, key, None)
+            normalized = normalize_date(value)
+            if normalized:
+                return normalized
+        return None
+
+    def contains(self, item) -> bool:
+        """항목이 기간 안에 있는지 확인 (날짜를 알 수 없으면 유지)"""
+        if not self.active:
+            return True
+        self.stats["checked"] += 1
+        date = self.item_date(item)
+        if date is None:
+            self.stats["undated"] += 1
+            return True
+        if (self.start and date < self.start) or (self.end and date > self.end):
+            self.stats["filtered"] += 1
+            return False
+        return True
+
+    def same_as(self, other: Optional["DateRange"]) -> bool:
+        """같은 기간 조건인지 비교 (둘 다 조건이 없으면 같음)"""
+        if other is None or not other.active:
+            return not self.active
+        return (self.start, self.end, self.field) == (other.start, other.end, other.field)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """상태 조회용 딕셔너리"""
+        return {"start": self.start, "end": self.end, "field": self.field, **self.stats}
@@ -0,0 +1,206 @@
+"""
+상세 페이지 처리 결과 캐시 모듈
+
+공고번호 + 차수별로 파싱한 상세 정보, Gemini 추출 결과, 정규화한 상세 테이블 해시를 SQLite에 저장합니다.
+같은 공고를 다시 처리할 때 테이블 해시가 같으면 저장된 결과를 그대로 사용하여 Gemini 호출을 생략합니다.
+정정공고는 차수가 올라가 키가 달라지므로 항상 새로 처리하며, 같은 차수라도 테이블 내용이 바뀌면 다시 처리합니다.
+SQLite 접근은 동기 함수이므로 이벤트 루프에서는 asyncio.to_thread로 호출합니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import traceback
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.crawler.paths import CACHE_DIR
+
+# 로거 설정
+logger = logging.getLogger("backend.crawler.detail_cache")
+
+# 환경 변수 설정
+DETAIL_CACHE = os.environ.get("DETAIL_CACHE", "true").lower() in ("1", "true", "yes")
+DETAIL_CACHE_PATH = Path(os.environ.get("DETAIL_CACHE_PATH", CACHE_DIR / "detail_cache.sqlite3"))
+
+# Gemini 추출 결과 필드 (상세 정보와 분리하여 저장)
+GEMINI_FIELDS = ("prompt_result", "prompt_result_parsed")
+
+def table_hash(raw_tables: Dict[str, List[Dict[str, Any]]]) -> Optional[str]:
+    """
+    상세 테이블 내용 해시 (정규화 후 SHA-256)
+
+    셀 텍스트와 input 값만 사용하고 공백을 하나로 줄입니다.
+    속성/링크(세션 토큰, 요소 id 등 요청마다 바뀌는 값)는 제외합니다.
+
+    Args:
+        raw_tables: G2BParser가 만든 원시 테이블 데이터 (캡션 → 행 리스트)
+
+    Returns:
+        str: 해시 (테이블이 없으면 None)
+    """
+    if not raw_tables:
+        return None
+    normalized = []
+    for caption, rows in raw_tables.items():
+        table_rows = []
+        for row in rows:
+            cells = []
+            for key, cell in row.items():
+                text = " ".join(str(cell.get("text") or "").split())
+                values = [" ".join(str(iv.get("value") or "").split()) for iv in cell.get("input_values") or []]
+                cells.append([key, text, values])
+            table_rows.append(cells)
+        normalized.append([" ".join(caption.split()), table_rows])
+    encoded = json.dumps(normalized, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+class DetailCache:
+    """SQLite 기반 상세 페이지 처리 결과 캐시"""
+
+    def __init__(self, path: Path = DETAIL_CACHE_PATH, enabled: bool = DETAIL_CACHE):
+        """
+        초기화
+
+        Args:
+            path: SQLite 파일 경로
+            enabled: 사용 여부 (False면 조회/저장을 무시)
+        """
+        self.path = Path(path)
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "changed": 0,
+            "writes": 0,
+            "errors": 0
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+        """연결 생성 및 테이블 준비 (잠금 안에서 호출, 처음 사용할 때 한 번)"""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS detail_cache (
+                    bid_number TEXT NOT NULL,
+                    revision TEXT NOT NULL,
+                    table_hash TEXT NOT NULL,
+                    detail_json TEXT NOT NULL,
+                    gemini_json TEXT,
+                    updated_at TEXT NOT NULL,
+                    hits INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (bid_number, revision)
+                )
+            """)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: Tuple[str, str], digest: str) -> Optional[Dict[str, Any]]:
+        """
+        저장된 처리 결과 조회
+
+        Args:
+            key: (공고번호, 차수) 튜플 (bid_key 반환값)
+            digest: 이번에 읽은 상세 테이블 해시 (table_hash 반환값)
+
+        Returns:
+            Dict: 상세 정보 + Gemini 추출 결과 (없거나 테이블 내용이 바뀌었으면 None)
+        """
+        if not self.enabled or not key or not digest:
+            return None
+        with self._lock:
+            try:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT table_hash, detail_json, gemini_json, updated_at FROM detail_cache WHERE bid_number = ? AND revision = ?",
+                    key
+                ).fetchone()
+                if row is None:
+                    self.stats["misses"] += 1
+                    return None
+                if row[0] != digest:
+                    self.stats["changed"] += 1
+                    self.stats["misses"] += 1
+                    logger.info(f"상세 테이블 내용 변경으로 다시 처리: {key[0]}-{key[1]}")
+                    return None
+
+                detail_data = json.loads(row[1])
+                detail_data.update(json.loads(row[2]) if row[2] else {})
+                detail_data["detail_cached_at"] = row[3]
+                conn.execute("UPDATE detail_cache SET hits = hits + 1 WHERE bid_number = ? AND revision = ?", key)
+                conn.commit()
+                self.stats["hits"] += 1
+                return detail_data
+            except Exception as e:
+                logger.warning(f"상세 캐시 조회 실패: {str(e)}")
+                logger.debug(traceback.format_exc())
+                self.stats["errors"] += 1
+                return None
+
+    def put(self, key: Tuple[str, str], digest: str, detail_data: Dict[str, Any]):
+        """
+        처리 결과 저장 (같은 공고번호 + 차수는 덮어씀)
+
+        Args:
+            key: (공고번호, 차수) 튜플
+            digest: 상세 테이블 해시
+            detail_data: G2BParser.parse_detail_page 결과 (Gemini 필드는 분리하여 저장)
+        """
+        if not self.enabled or not key or not digest:
+            return
+        detail = {k: v for k, v in detail_data.items() if k not in GEMINI_FIELDS and k != "detail_cached_at"}
+        gemini = {k: detail_data[k] for k in GEMINI_FIELDS if k in detail_data}
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO detail_cache (bid_number, revision, table_hash, detail_json, gemini_json, updated_at, hits) "
+                    "VALUES (?, ?, ?, ?, ?, ?, 0)",
+                    (key[0], key[1], digest,
+                     json.dumps(detail, ensure_ascii=False, default=str),
+                     json.dumps(gemini, ensure_ascii=False, default=str) if gemini else None,
+                     datetime.now().isoformat())
+                )
+                conn.commit()
+                self.stats["writes"] += 1
+            except Exception as e:
+                logger.warning(f"상세 캐시 저장 실패: {str(e)}")
+                logger.debug(traceback.format_exc())
+                self.stats["errors"] += 1
+
+    def close(self):
+        """연결 종료 (다음 사용 시 다시 연결)"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환"""
+        entries = None
+        if self.enabled and self.path.exists():
+            with self._lock:
+                try:
+                    entries = self._connect().execute("SELECT COUNT(*) FROM detail_cache").fetchone()[0]
+                except Exception:
+                    entries = None
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            "enabled": self.enabled,
+            "path": str(self.path),
+            "entries": entries,
+            **self.stats,
+            "hit_rate": round(self.stats["hits"] / lookups, 3) if lookups else None
+        }
+
+# 전역 상세 캐시 (DETAIL_CACHE=false면 사용 안 함)
+detail_cache = DetailCache()
@@ -0,0 +1,114 @@
+"""
+상세 페이지 직접 링크 모듈
+
+검색 결과 그리드에서 수집한 onclick 속성/공고번호를 해석하여
+목록 페이지를 떠나지 않고 열 수 있는 상세 페이지 URL을 만듭니다.
+"""
+
+import logging
+import os
+import re
+from typing import Any, Dict, List, Optional
+
+# 로거 설정
+logger = logging.getLogger("backend.crawler.detail_link")
+
+# 상세 페이지 URL 템플릿 ({bid_number}, {revision} 치환)
+DETAIL_URL_TEMPLATE = os.environ.get(
+    "DETAIL_URL_TEMPLATE",
+    "https://www.g2b.go.kr/link/PNPE027_01/single/?bidPbancNo={bid_number}&bidPbancOrd={revision}"
+)
+DEFAULT_REVISION = "000"
+
+# 입찰공고번호: 차세대 나라장터(R25BK01234567) 또는 기존 11자리 숫자(20240312345)
+BID_NUMBER_PATTERN = re.compile(r"\b(R\d{2}[A-Z]{2}\d{8}|\d{11})\b")
+# 공고번호 뒤 차수 표기 (예: R25BK01234567-000, 20240312345-00)
+BID_NUMBER_WITH_REVISION_PATTERN = re.compile(r"\b(R\d{2}[A-Z]{2}\d{8}|\d{11})\s*-\s*(\d{2,3})\b")
+# onclick 함수 호출 (예: fn_detail('R25BK01234567', '000'))
+ONCLICK_CALL_PATTERN = re.compile(r"([\w.$]+)\s*\((.*)\)", re.S)
+ONCLICK_ARG_PATTERN = re.compile(r"'([^']*)'|\"([^\"]*)\"|([^,\s][^,]*)")
+
+def parse_onclick(onclick: Optional[str]) -> Dict[str, Any]:
+    """
+    onclick 속성에서 함수 이름과 인자 목록 추출
+
+    Args:
+        onclick: onclick 속성 문자열
+
+    Returns:
+        Dict: {"function": 함수 이름, "args": 인자 문자열 목록} (해석 실패 시 빈 딕셔너리)
+    """
+    if not onclick:
+        return {}
+    match = ONCLICK_CALL_PATTERN.search(onclick)
+    if not match:
+        return {}
+
+    args = []
+    for quoted_single, quoted_double, bare in ONCLICK_ARG_PATTERN.findall(match.group(2)):
+        value = quoted_single or quoted_double or bare
+        args.append(value.strip())
+    return {"function": match.group(1), "args": args}
+
+def decode_bid_reference(item: Dict[str, Any]) -> Dict[str, str]:
+    """
+    항목의 onclick 인자와 공고번호 텍스트에서 공고번호/차수 추출
+
+    Args:
+        item: 검색 결과 항목 (onclick, bid_number 등)
+
+    Returns:
+        Dict: {"bid_number": ..., "revision": ...} (공고번호를 찾지 못하면 빈 딕셔너리)
+    """
+    # 1. onclick 인자: 공고번호 바로 다음 인자가 2~3자리 숫자면 차수로 사용
+    args = parse_onclick(item.get("onclick")).get("args", [])
+    for idx, arg in enumerate(args):
+        match = BID_NUMBER_WITH_REVISION_PATTERN.search(arg)
+        if match:
+            return {"bid_number": match.group(1), "revision": match.group(2).zfill(3)}
+        match = BID_NUMBER_PATTERN.search(arg)
+        if match:
+            revision = DEFAULT_REVISION
+            if idx + 1 < len(args) and re.fullmatch(r"\d{2,3}", args[idx + 1]):
+                revision = args[idx + 1].zfill(3)
+            return {"bid_number": match.group(1), "revision": revision}
+
+    # 2. 그리드의 공고번호 텍스트 (예: "R25BK01234567-000")
+    text = item.get("bid_number") or ""
+    match = BID_NUMBER_WITH_REVISION_PATTERN.search(text)
+    if match:
+        return {"bid_number": match.group(1), "revision": match.group(2).zfill(3)}
+    match = BID_NUMBER_PATTERN.search(text)
+    if match:
+        return {"bid_number": match.group(1), "revision": DEFAULT_REVISION}
+    return {}
+
+def build_detail_url(bid_number: str, revision: str = DEFAULT_REVISION, template: str = DETAIL_URL_TEMPLATE) -> str:
+    """공고번호와 차수로 상세 페이지 URL 생성"""
+    return template.format(bid_number=bid_number, revision=revision)
+
+def attach_detail_links(items: List[Dict[str, Any]], template: str = DETAIL_URL_TEMPLATE) -> int:
+    """
+    검색 결과 항목에 공고번호/차수/상세 URL 추가 (이미 detail_url이 있으면 유지)
+
+    Args:
+        items: 검색 결과 항목 리스트
+        template: 상세 페이지 URL 템플릿
+
+    Returns:
+        int: 상세 URL을 만든 항목 수
+    """
+    linked = 0
+    for item in items:
+        if not isinstance(item, dict) or item.get("detail_url"):
+            continue
+        reference = decode_bid_reference(item)
+        if not reference:
+            continue
+        item["bid_number"] = reference["bid_number"]
+        item["bid_revision"] = reference["revision"]
+        item["detail_url"] = build_detail_url(reference["bid_number"], reference["revision"], template)
+        linked += 1
+
+    logger.info(f"상세 페이지 직접 링크 생성: {linked}/{len(items)}개 항목")
+    return linked
@@ -0,0 +1,164 @@
+"""
+웹드라이버 액터 모듈
+
+각 webdriver.Chrome 인스턴스를 전용 스레드에서 소유하고,
+이벤트 루프에서는 await 가능한 명령으로만 접근하도록 하는 액터 계층을 제공합니다.
+모든 명령에는 제한 시간이 있으며, 시간을 넘기거나 세션 종료 오류가 나면 액터를 "dead"로 표시합니다.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+# 로거 설정
+logger = logging.getLogger("backend.crawler.actor")
+
+# 드라이버 명령 기본 제한 시간 (초, 0이면 무제한)
+DRIVER_COMMAND_TIMEOUT = float(os.environ.get("DRIVER_COMMAND_TIMEOUT", "90"))
+
+# 세션이 죽었음을 나타내는 예외 클래스 이름 / 메시지 (Selenium, urllib3)
+DEAD_SESSION_ERRORS = {"InvalidSessionIdException", "MaxRetryError", "NewConnectionError", "ProtocolError"}
+DEAD_SESSION_MESSAGES = [
+    "invalid session id",
+    "chrome not reachable",
+    "disconnected: not connected to devtools",
+    "session deleted because of page crash",
+    "tab crashed",
+    "no such session",
+    "connection refused",
+    "connection reset",
+    "remote end closed connection"
+]
+
+class DriverDeadError(RuntimeError):
+    """드라이버 세션이 종료되었거나 응답하지 않는 경우"""
+
+class DriverHangError(DriverDeadError):
+    """드라이버 명령이 제한 시간 안에 끝나지 않은 경우"""
+
+def is_dead_session_error(error: BaseException) -> bool:
+    """예외가 브라우저/드라이버 세션 종료를 의미하는지 확인"""
+    if isinstance(error, (DriverDeadError, ConnectionError)):
+        return True
+    if type(error).__name__ in DEAD_SESSION_ERRORS:
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in DEAD_SESSION_MESSAGES)
+
+class DriverActor:
+    """웹드라이버 전용 스레드 액터"""
+
+    _counter = 0
+    _counter_lock = threading.Lock()
+
+    def __init__(self, name: str = None, command_timeout: float = DRIVER_COMMAND_TIMEOUT):
+        """
+        액터 초기화
+
+        Args:
+            name (str): 스레드 이름 (None이면 자동 생성)
+            command_timeout (float): 명령 기본 제한 시간 (초, 0이면 무제한)
+        """
+        if not name:
+            with DriverActor._counter_lock:
+                DriverActor._counter += 1
+                name = f"driver-actor-{DriverActor._counter}"
+
+        self.name = name
+        # 단일 스레드 실행기: 하나의 드라이버에 대한 명령은 항상 같은 스레드에서 순차 실행
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+        self.closed = False
+        self.command_timeout = command_timeout
+
+        # 세션 상태 (명령 시간 초과 또는 세션 종료 오류 시 dead)
+        self.dead = False
+        self.dead_reason: Optional[str] = None
+
+        # 명령 실행 통계
+        self.command_count = 0
+        self.busy_time = 0.0
+        self.max_command_time = 0.0
+        self.hang_count = 0
+
+    async def run(self, func: Callable, *args, deadline: Optional[float] = None, **kwargs) -> Any:
+        """
+        드라이버 스레드에서 블로킹 함수 실행
+
+        Args:
+            func: 실행할 함수 (WebDriver/WebElement 메서드 등)
+            *args, **kwargs: 함수 인자
+            deadline: 이 명령의 제한 시간 (초, None이면 기본 제한 시간, 0이면 무제한)
+
+        Returns:
+            함수 실행 결과 (예외는 호출자에게 그대로 전달)
+
+        Raises:
+            DriverDeadError: 액터가 종료되었거나 세션이 이미 죽은 경우
+            DriverHangError: 명령이 제한 시간 안에 끝나지 않은 경우
+        """
+        if self.closed:
+            raise DriverDeadError(f"드라이버 액터가 종료되었습니다: {self.name}")
+        if self.dead:
+            # 멈춘 명령 뒤에 줄 서지 않고 즉시 실패
+            raise DriverDeadError(f"드라이버 세션이 응답하지 않습니다 ({self.name}): {self.dead_reason}")
+
+        timeout = self.command_timeout if deadline is None else deadline
+        loop = asyncio.get_running_loop()
+        call = functools.partial(func, *args, **kwargs)
+        start = time.perf_counter()
+        future = loop.run_in_executor(self._executor, call)
+        try:
+            if timeout:
+                # 드라이버 스레드는 중단할 수 없으므로 완료 여부만 기다림
+                done, _ = await asyncio.wait({future}, timeout=timeout)
+                if not done:
+                    self.hang_count += 1
+                    self.mark_dead(f"{getattr(func, '__name__', func)} 명령 {timeout:.0f}초 초과")
+                    raise DriverHangError(f"드라이버 명령 시간 초과 ({self.name}): {self.dead_reason}")
+            return await future
+        except DriverDeadError:
+            raise
+        except Exception as e:
+            if is_dead_session_error(e):
+                self.mark_dead(f"세션 종료 오류: {str(e).splitlines()[0] if str(e) else type(e).__name__}")
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            self.command_count += 1
+            self.busy_time += elapsed
+            self.max_command_time = max(self.max_command_time, elapsed)
+
+    def mark_dead(self, reason: str):
+        """세션을 사용할 수 없음으로 표시 (이후 명령은 즉시 DriverDeadError)"""
+        if self.dead:
+            return
+        self.dead = True
+        self.dead_reason = reason
+        logger.error(f"드라이버 세션 응답 없음 ({self.name}): {reason}")
+
+    def shutdown(self, wait: bool = False):
+        """액터 스레드 종료"""
+        if self.closed:
+            return
+        self.closed = True
+        self._executor.shutdown(wait=wait)
+        logger.debug(f"드라이버 액터 종료: {self.name}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """명령 실행 통계 반환"""
+        return {
+            "name": self.name,
+            "commands": self.command_count,
+            "busy_ms": round(self.busy_time * 1000, 1),
+            "max_command_ms": round(self.max_command_time * 1000, 1),
+            "command_timeout": self.command_timeout,
+            "hangs": self.hang_count,
+            "dead": self.dead,
+            "dead_reason": self.dead_reason,
+            "closed": self.closed
+        }
@@ -0,0 +1,278 @@
+"""
+웹드라이버 풀 모듈
+
+입찰공고 목록 페이지까지 미리 이동해 둔 크롤러(브라우저)를 보관하고,
+크롤링 작업마다 임대/반납하는 워밍 풀 기능을 제공합니다.
+"""
+
+import asyncio
+import logging
+import time
+import traceback
+from typing import Dict, Any, List, Optional
+
+from backend.crawler.g2b_crawler import G2BCrawler
+from backend.crawler.page_state import BID_LIST_MARKER_IDS
+
+# 로거 설정
+logger = logging.getLogger("backend.crawler.pool")
+
+class DriverPool:
+    """입찰공고 목록 페이지에 대기 중인 크롤러 풀"""
+
+    def __init__(self, size: int = 1, headless: bool = True, max_uses: int = 20):
+        """
+        풀 초기화
+
+        Args:
+            size: 유지할 브라우저 수
+            headless: 헤드리스 모드 사용 여부
+            max_uses: 브라우저 재시작 전 최대 임대 횟수
+        """
+        self.size = size
+        self.headless = headless
+        self.max_uses = max_uses
+
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._leased: List[G2BCrawler] = []
+        self._uses: Dict[int, int] = {}
+        self._launching = 0
+        self._closed = False
+        self._tasks = set()  # 백그라운드 실행 태스크 참조 유지
+
+        # 워밍 상태: cold -> warming -> ready (closed: 종료됨)
+        self.state = "cold"
+        self.stats = {
+            "launched": 0,
+            "launch_failures": 0,
+            "leases": 0,
+            "recycled": 0,
+            "health_failures": 0,
+            "discarded": 0,
+            "memory_recycled": 0,
+            "last_launch_seconds": None
+        }
+
+    async def start(self):
+        """풀 크기만큼 브라우저를 미리 실행하여 목록 페이지에 대기"""
+        if self.size <= 0:
+            self.state = "disabled"
+            logger.info("드라이버 풀 비활성화 (크기 0)")
+            return
+
+        self.state = "warming"
+        logger.info(f"드라이버 풀 워밍 시작 ({self.size}개)")
+
+        await asyncio.gather(*[self._add_new() for _ in range(self.size)])
+
+        if not self._closed:
+            self.state = "ready" if self._idle.qsize() > 0 else "cold"
+            logger.info(f"드라이버 풀 워밍 완료: 대기 {self._idle.qsize()}개")
+
+    async def _launch(self) -> Optional[G2BCrawler]:
+        """새 크롤러 실행 후 입찰공고 목록 페이지로 이동"""
+        start = time.perf_counter()
+        crawler = G2BCrawler(headless=self.headless)
+        try:
+            if not await crawler.initialize():
+                raise RuntimeError("크롤러 초기화 실패")
+            if not await crawler.navigate_to_bid_list():
+                raise RuntimeError("입찰공고 목록 페이지 이동 실패")
+
+            elapsed = time.perf_counter() - start
+            self.stats["launched"] += 1
+            self.stats["last_launch_seconds"] = round(elapsed, 2)
+            logger.info(f"풀 브라우저 준비 완료 ({elapsed:.1f}초)")
+            return crawler
+        except asyncio.CancelledError:
+            # 풀 종료/서버 종료로 취소되면 시작 중인 브라우저(Chrome, 프로필 디렉토리)를 정리한 뒤 취소 전파
+            await asyncio.shield(crawler.close())
+            raise
+        except Exception as e:
+            self.stats["launch_failures"] += 1
+            logger.error(f"풀 브라우저 실행 실패: {str(e)}")
+            logger.debug(traceback.format_exc())
+            await crawler.close()
+            return None
+
+    async def _add_new(self):
+        """새 브라우저를 실행하여 대기열에 추가"""
+        self._launching += 1
+        try:
+            crawler = await self._launch()
+        finally:
+            self._launching -= 1
+
+        if crawler is None:
+            return
+        if self._closed:
+            await crawler.close()
+            return
+
+        self._uses[id(crawler)] = 0
+        self._idle.put_nowait(crawler)
+
+    async def acquire(self, timeout: Optional[float] = None) -> Optional[G2BCrawler]:
+        """
+        목록 페이지에 대기 중인 크롤러 임대
+
+        Args:
+            timeout: 대기 제한 시간 (초, None이면 무제한)
+
+        Returns:
+            G2BCrawler: 임대된 크롤러 (실패 시 None)
+        """
+        if self._closed or self.size <= 0:
+            return None
+
+        # 대기 중인 브라우저가 없고 실행 중인 것도 없으면 즉시 하나 실행
+        total = self._idle.qsize() + len(self._leased) + self._launching
+        if self._idle.empty() and total < self.size:
+            self._spawn()
+
+        try:
+            crawler = await asyncio.wait_for(self._idle.get(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("드라이버 풀 임대 대기 시간 초과")
+            return None
+
+        self._leased.append(crawler)
+        self.stats["leases"] += 1
+        logger.info(f"풀 브라우저 임대 (대기 {self._idle.qsize()}개, 임대 {len(self._leased)}개)")
+        return crawler
+
+    async def release(self, crawler: G2BCrawler):
+        """
+        크롤러 반납 (상태 점검 후 재사용 또는 교체)
+
+        Args:
+            crawler: 반납할 크롤러
+        """
+        if crawler in self._leased:
+            self._leased.remove(crawler)
+
+        uses = self._uses.pop(id(crawler), 0) + 1
+
+        if self._closed:
+            await crawler.close()
+            return
+
+        # 사용 횟수 초과 시 재시작
+        if uses >= self.max_uses:
+            logger.info(f"풀 브라우저 최대 사용 횟수({self.max_uses}) 도달, 재시작")
+            self.stats["recycled"] += 1
+            await self._replace(crawler)
+            return
+
+        # 메모리/페이지 수 한도 초과 시 재시작
+        _, reason = await asyncio.to_thread(crawler.memory_recycle_reason, force_sample=True)
+        if reason:
+            logger.info(f"풀 브라우저 메모리 한도 초과 ({reason}), 재시작")
+            self.stats["memory_recycled"] += 1
+            await self._replace(crawler)
+            return
+
+        # 상태 점검 및 목록 페이지 복귀
+        if not await self._health_check(crawler):
+            self.stats["health_failures"] += 1
+            logger.warning("풀 브라우저 상태 점검 실패, 교체")
+            await self._replace(crawler)
+            return
+
+        self._uses[id(crawler)] = uses
+        self._idle.put_nowait(crawler)
+        logger.info(f"풀 브라우저 반납 (사용 {uses}/{self.max_uses})")
+
+    async def discard(self, crawler: G2BCrawler):
+        """
+        응답 없는 크롤러 반납 (상태 점검 없이 종료 후 새 브라우저 실행)
+
+        Args:
+            crawler: 폐기할 크롤러
+        """
+        if crawler in self._leased:
+            self._leased.remove(crawler)
+        self._uses.pop(id(crawler), None)
+        self.stats["discarded"] += 1
+
+        if self._closed:
+            await crawler.close()
+            return
+        logger.warning("풀 브라우저 폐기 후 교체")
+        await self._replace(crawler)
+
+    async def _replace(self, crawler: G2BCrawler):
+        """브라우저 종료 후 백그라운드에서 새 브라우저 실행"""
+        await crawler.close()
+        self._spawn()
+
+    def _spawn(self):
+        """백그라운드에서 새 브라우저 실행"""
+        task = asyncio.create_task(self._add_new())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _health_check(self, crawler: G2BCrawler) -> bool:
+        """드라이버 응답 확인 후 입찰공고 목록 페이지에 있도록 보장"""
+        if not crawler.driver or not crawler.actor:
+            return False
+
+        try:
+            on_bid_list = await asyncio.wait_for(
+                crawler.actor.run(self._is_on_bid_list, crawler.driver),
+                timeout=10
+            )
+        except Exception as e:
+            logger.warning(f"풀 브라우저 응답 없음: {str(e)}")
+            return False
+
+        if on_bid_list:
+            crawler.base.set_page_state("bid_list")
+            return True
+
+        # 목록 페이지가 아니면 다시 이동
+        crawler.base.set_page_state(None)
+        return await crawler.navigate_to_bid_list()
+
+    @staticmethod
+    def _is_on_bid_list(driver) -> bool:
+        """입찰공고 목록 페이지 여부 확인 (드라이버 스레드에서 실행)"""
+        if not driver.window_handles:
+            return False
+        return bool(driver.execute_script(
+            "return arguments[0].some(function(id) { return !!document.getElementById(id); });",
+            BID_LIST_MARKER_IDS
+        ))
+
+    async def close(self):
+        """풀의 모든 브라우저 종료"""
+        self._closed = True
+        self.state = "closed"
+
+        # 실행 중인 브라우저 시작 취소 (취소된 시작 작업이 브라우저를 정리할 때까지 대기)
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        crawlers = list(self._leased)
+        while not self._idle.empty():
+            crawlers.append(self._idle.get_nowait())
+        self._leased.clear()
+
+        for crawler in crawlers:
+            await crawler.close()
+        logger.info(f"드라이버 풀 종료 ({len(crawlers)}개 브라우저)")
+
+    def get_status(self) -> Dict[str, Any]:
+        """풀 크기 및 워밍 상태 반환"""
+        return {
+            "state": self.state,
+            "size": self.size,
+            "headless": self.headless,
+            "max_uses": self.max_uses,
+            "idle": self._idle.qsize(),
+            "leased": len(self._leased),
+            "launching": self._launching,
+            **self.stats
+        }
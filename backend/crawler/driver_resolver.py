@@ -0,0 +1,188 @@
+"""
+chromedriver 경로 확인 모듈
+
+설치된 Chrome 주 버전별로 chromedriver 경로를 로컬에 캐시하고,
+프로세스당 한 번만 검증하여 크롤러 시작 시 네트워크 접근과 버전 확인을 생략합니다.
+오프라인 모드에서는 네트워크 없이 캐시/지정 경로/PATH의 드라이버만 사용합니다.
+"""
+
+import json
+import logging
+import os
+import shutil
+import subprocess
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import chromedriver_autoinstaller
+
+from backend.crawler.paths import CACHE_DIR
+
+# 로거 설정
+logger = logging.getLogger("backend.crawler.driver_resolver")
+
+# 캐시 저장 경로
+DEFAULT_CACHE_PATH = Path(os.environ.get("CHROMEDRIVER_CACHE_PATH", CACHE_DIR / "chromedriver.json"))
+DEFAULT_INSTALL_DIR = CACHE_DIR / "chromedriver"
+
+# 환경 변수 설정
+CHROMEDRIVER_PATH = os.environ.get("CHROMEDRIVER_PATH")  # 직접 지정한 드라이버 경로
+CHROMEDRIVER_OFFLINE = os.environ.get("CHROMEDRIVER_OFFLINE", "false").lower() == "true"
+
+class ChromeDriverResolver:
+    """Chrome 주 버전별 chromedriver 경로 캐시 클래스"""
+
+    def __init__(self, cache_path: Path = DEFAULT_CACHE_PATH, install_dir: Path = DEFAULT_INSTALL_DIR,
+                 offline: bool = CHROMEDRIVER_OFFLINE, driver_path: Optional[str] = CHROMEDRIVER_PATH):
+        """
+        초기화
+
+        Args:
+            cache_path: 버전별 드라이버 경로 캐시 파일 (JSON)
+            install_dir: 드라이버 다운로드 디렉토리
+            offline: 네트워크 없이 로컬 드라이버만 사용할지 여부
+            driver_path: 직접 지정한 드라이버 경로 (있으면 최우선 사용)
+        """
+        self.cache_path = Path(cache_path)
+        self.install_dir = Path(install_dir)
+        self.offline = offline
+        self.driver_path = driver_path
+        self._lock = threading.Lock()  # 여러 드라이버 스레드에서 동시 초기화
+        self._validated: Dict[str, str] = {}  # 이번 프로세스에서 검증된 주 버전별 경로
+        self._chrome_major = None  # 프로세스당 한 번만 확인
+        self.stats = {
+            "resolutions": 0,
+            "process_hits": 0,
+            "disk_hits": 0,
+            "downloads": 0,
+            "last_source": None,
+            "last_seconds": None
+        }
+
+    def resolve(self) -> Optional[str]:
+        """
+        현재 Chrome에 맞는 chromedriver 경로 반환 (드라이버 스레드에서 실행)
+
+        Returns:
+            str: 드라이버 경로 (None이면 Selenium 기본 탐색에 맡김)
+        """
+        start = time.perf_counter()
+        with self._lock:
+            path, source = self._resolve_locked()
+            self.stats["resolutions"] += 1
+            self.stats["last_source"] = source
+            self.stats["last_seconds"] = round(time.perf_counter() - start, 3)
+
+        logger.info(f"chromedriver 경로 확인 ({source}, {self.stats['last_seconds']}초): {path}")
+        return path
+
+    def _resolve_locked(self):
+        """경로 확인 순서: 프로세스 캐시 -> 지정 경로 -> 디스크 캐시 -> 다운로드/PATH"""
+        if self._chrome_major is None:
+            self._chrome_major = self._chrome_major_version() or ""
+        major = self._chrome_major or None
+        cache_key = major or "unknown"
+
+        # 1. 이번 프로세스에서 이미 검증된 경로
+        if cache_key in self._validated:
+            self.stats["process_hits"] += 1
+            return self._validated[cache_key], "process"
+
+        # 2. 환경 변수로 지정한 경로
+        if self.driver_path:
+            if self._validate(self.driver_path, major):
+                self._validated[cache_key] = self.driver_path
+                return self.driver_path, "env"
+            logger.warning(f"CHROMEDRIVER_PATH 드라이버 검증 실패: {self.driver_path}")
+
+        # 3. 디스크 캐시
+        cached = self._load_cache().get(cache_key, {}).get("path")
+        if cached and self._validate(cached, major):
+            self.stats["disk_hits"] += 1
+            self._validated[cache_key] = cached
+            return cached, "disk"
+
+        # 4. 오프라인: PATH의 드라이버만 사용
+        if self.offline:
+            found = shutil.which("chromedriver")
+            if found and self._validate(found, major):
+                self._validated[cache_key] = found
+                self._save_cache(cache_key, found)
+                return found, "path"
+            raise RuntimeError(f"오프라인 모드: Chrome {cache_key} 버전에 맞는 chromedriver가 없습니다")
+
+        # 5. 온라인: 버전에 맞는 드라이버 다운로드
+        self.install_dir.mkdir(parents=True, exist_ok=True)
+        installed = chromedriver_autoinstaller.install(path=str(self.install_dir))
+        if not installed:
+            logger.warning("chromedriver 다운로드 실패, Selenium 기본 탐색 사용")
+            return None, "selenium"
+
+        self.stats["downloads"] += 1
+        self._validated[cache_key] = installed
+        self._save_cache(cache_key, installed)
+        return installed, "download"
+
+    @staticmethod
+    def _chrome_major_version() -> Optional[str]:
+        """설치된 Chrome 주 버전 확인 (로컬 바이너리 조회, 네트워크 없음)"""
+        try:
+            version = chromedriver_autoinstaller.get_chrome_version()
+            return version.split(".")[0] if version else None
+        except Exception as e:
+            logger.warning(f"Chrome 버전 확인 실패: {str(e)}")
+            return None
+
+    @staticmethod
+    def _validate(path: str, major: Optional[str]) -> bool:
+        """드라이버 실행 파일 존재 및 주 버전 일치 확인"""
+        if not path or not os.path.isfile(path) or not os.access(path, os.X_OK):
+            return False
+        try:
+            output = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=10).stdout
+        except Exception as e:
+            logger.warning(f"chromedriver 실행 확인 실패: {str(e)}")
+            return False
+        # 출력 예: "ChromeDriver 122.0.6261.94 (...)"
+        parts = output.split()
+        if len(parts) < 2 or parts[0] != "ChromeDriver":
+            return False
+        return major is None or parts[1].split(".")[0] == major
+
+    def _load_cache(self) -> Dict[str, Any]:
+        """디스크 캐시 로드"""
+        if not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"chromedriver 캐시 로드 실패 (무시): {str(e)}")
+            return {}
+
+    def _save_cache(self, cache_key: str, path: str):
+        """디스크 캐시에 주 버전별 경로 저장"""
+        try:
+            cache = self._load_cache()
+            cache[cache_key] = {"path": path, "resolved_at": time.time()}
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            logger.warning(f"chromedriver 캐시 저장 실패: {str(e)}")
+            logger.debug(traceback.format_exc())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """경로 확인 통계 반환"""
+        return {
+            "offline": self.offline,
+            "chrome_major": self._chrome_major or None,
+            "validated": dict(self._validated),
+            **self.stats
+        }
+
+# 프로세스 전역 드라이버 경로 확인기 (모든 크롤러가 공유)
+driver_resolver = ChromeDriverResolver()
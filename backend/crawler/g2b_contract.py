@@ -80,7 +80,7 @@ class G2BContractAnalyzer:
             tables = soup.find_all('table')
             for table in tables:
                 rows = table.find_all('tr')
-                    for row in rows:
+                for row in rows:
                     headers = row.find_all('th')
                     values = row.find_all('td')
                     
@@ -90,7 +90,7 @@ class G2BContractAnalyzer:
                             value_text = values[i].get_text(strip=True)
                             
                             # 필드 매핑 - models.py와 일치하도록 수정
-                                if any(keyword in header_text for keyword in ["계약방법", "계약형태", "계약구분"]):
+                            if any(keyword in header_text for keyword in ["계약방법", "계약형태", "계약구분"]):
                                 # contract_method -> bid_method 매핑
                                 contract_details["bid_method"] = value_text
                                 log.info(f"계약방법(bid_method) 추출: {value_text}")
@@ -99,20 +99,20 @@ class G2BContractAnalyzer:
                                 contract_details["bid_type"] = value_text
                                 log.info(f"입찰방법(bid_type) 추출: {value_text}")
                             elif any(keyword in header_text for keyword in ["추정가격", "예정가격", "기초금액"]):
-                                    contract_details["estimated_price"] = value_text
-                                    log.info(f"추정가격 추출: {value_text}")
+                                contract_details["estimated_price"] = value_text
+                                log.info(f"추정가격 추출: {value_text}")
                             elif any(keyword in header_text for keyword in ["계약기간", "이행기간", "납품기한"]):
                                 # contract_period는 additional_info에 저장
                                 if 'additional_info' not in contract_details:
                                     contract_details['additional_info'] = {}
                                 contract_details['additional_info']['contract_period'] = value_text
-                                    log.info(f"계약기간 추출: {value_text}")
-                                elif any(keyword in header_text for keyword in ["납품장소", "이행장소", "설치장소"]):
+                                log.info(f"계약기간 추출: {value_text}")
+                            elif any(keyword in header_text for keyword in ["납품장소", "이행장소", "설치장소"]):
                                 # delivery_location은 additional_info에 저장
                                 if 'additional_info' not in contract_details:
                                     contract_details['additional_info'] = {}
                                 contract_details['additional_info']['delivery_location'] = value_text
-                                    log.info(f"납품장소 추출: {value_text}")
+                                log.info(f"납품장소 추출: {value_text}")
                             elif any(keyword in header_text for keyword in ["참가자격", "입찰참가자격", "참가제한"]):
                                 # qualification -> requirements 매핑
                                 contract_details["requirements"] = value_text
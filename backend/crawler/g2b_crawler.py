@@ -26,11 +26,16 @@ project_root = backend_dir.parent
 # 리팩토링된 하위 모듈 임포트
 from backend.crawler.crawler_base import CrawlerBase
 from backend.crawler.g2b_navigation import G2BNavigator
-from backend.crawler.g2b_search import G2BSearcher
+from backend.crawler.g2b_search import G2BSearcher, SEARCH_MAX_PAGES
 from backend.crawler.g2b_detail import G2BDetailProcessor
 from backend.crawler.g2b_contract import G2BContractAnalyzer
 from backend.crawler.g2b_parser import G2BParser
 from backend.crawler.g2b_extractor import G2BExtractor
+from backend.crawler.detail_link import attach_detail_links
+from backend.crawler.bid_registry import bid_key
+from backend.crawler.snapshot_store import snapshot_store
+from backend.crawler.search_cache import search_cache, search_cache_key
+from backend.crawler.page_state import SEARCH_PAGE_SIZE
 
 # 모델 임포트 추가
 from backend.models import BidItem, SearchResult, BidStatus
@@ -53,24 +58,32 @@ RESULTS_DIR.mkdir(exist_ok=True)
 class G2BCrawler:
     """나라장터 크롤러 통합 클래스"""
     
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, launch_profile=None):
         """
         초기화
         
         Args:
             headless (bool): 헤드리스 모드 사용 여부
+            launch_profile (LaunchProfile): Chrome 실행 프로필 (None이면 환경 변수 설정 사용)
         """
         # 기본 속성 설정
         self.headless = headless
+        self.launch_profile = launch_profile
         self.results = []
         self.keyword = "AI"  # 기본 검색어
         
         # 검색 결과 모델 초기화
         self.search_result_model = None
         
+        # 검색 기간 조건 (DateRange, None이면 사이트 기본 기간)
+        self.date_range = None
+        self._reset_search_form = False  # 이전 기간 조건을 지우기 위해 목록 페이지를 다시 열어야 하는지 여부
+        
         # 기본 인스턴스 설정
         self.driver = None
         self.wait = None
+        self.actor = None
+        self.wait_engine = None
         
         # 각 모듈별 인스턴스 초기화 (driver 설정 후 초기화)
         self.base = None
@@ -92,26 +105,29 @@ class G2BCrawler:
             logger.info("크롤러 초기화 시작")
             
             # 기본 크롤러 초기화
-            self.base = CrawlerBase(headless=self.headless)
+            self.base = CrawlerBase(headless=self.headless, launch_profile=self.launch_profile)
             await self.base.initialize()  # CrawlerBase의 initialize 메서드 호출
             
             if not self.base:
                 logger.error("크롤러 기본 초기화 실패")
                 return False
             
-            # WebDriver 및 Wait 객체 공유
+            # WebDriver, Wait 및 드라이버 액터 공유
             self.driver = self.base.driver
             self.wait = self.base.wait
+            self.actor = self.base.actor
             
             if not self.driver:
                 logger.error("웹드라이버 초기화 실패")
                 return False
             
-            # 각 모듈 인스턴스 초기화 (driver와 wait 객체만 전달)
-            self.navigator = G2BNavigator(driver=self.driver, wait=self.wait)
-            self.searcher = G2BSearcher(driver=self.driver, wait=self.wait)
+            # 각 모듈 인스턴스 초기화 (driver, wait 및 액터 전달)
+            self.wait_engine = self.base.wait_engine
+            self.navigator = G2BNavigator(driver=self.driver, wait=self.wait, actor=self.actor, lean_fetch=self.base.lean_fetch, wait_engine=self.wait_engine, popup_guard=self.base.popup_guard)
+            self.searcher = G2BSearcher(driver=self.driver, wait=self.wait, actor=self.actor, wait_engine=self.wait_engine, grid_capture=self.base.grid_capture)
+            self.searcher.date_range = self.date_range
             self.extractor = G2BExtractor(driver=self.driver)
-            self.detail_processor = G2BDetailProcessor(driver=self.driver, extractor=self.extractor)
+            self.detail_processor = G2BDetailProcessor(driver=self.driver, extractor=self.extractor, actor=self.actor, lean_fetch=self.base.lean_fetch, wait_engine=self.wait_engine)
             self.parser = G2BParser()
             
             logger.info("크롤러 모듈 초기화 성공")
@@ -127,10 +143,52 @@ class G2BCrawler:
             await self.base.close()
             self.driver = None
             self.wait = None
+            self.actor = None
+            self.wait_engine = None
             # 페이지 상태도 초기화
             if hasattr(self.base, 'current_page'):
                 self.base.current_page = None
     
+    def record_pages(self, count: int = 1):
+        """메모리 관리용 처리 페이지 수 기록"""
+        if self.base and self.base.memory_governor:
+            self.base.memory_governor.record_pages(count)
+    
+    def memory_recycle_reason(self, force_sample: bool = False):
+        """
+        메모리 측정 후 드라이버 재시작이 필요한지 확인
+        
+        Args:
+            force_sample: 측정 간격과 관계없이 측정할지 여부
+        
+        Returns:
+            (새 측정값 또는 None, 재시작 사유 또는 None) 튜플
+        """
+        governor = self.base.memory_governor if self.base else None
+        if not governor:
+            return None, None
+        sample = governor.maybe_sample(force=force_sample)
+        return sample, governor.recycle_reason()
+    
+    async def configure_lean_fetch(self, enabled: bool, profiles: Optional[Dict[str, Any]] = None):
+        """
+        페이지 유형별 리소스 차단(lean fetch) 설정
+        
+        Args:
+            enabled: 리소스 차단 사용 여부
+            profiles: 페이지 유형별 차단 프로필 (None이면 기본 프로필)
+        """
+        if not self.base or not self.base.lean_fetch:
+            return
+        
+        if enabled:
+            await self.base.lean_fetch.enable(profiles)
+            # 현재 페이지 유형 프로필을 바로 적용
+            if self.base.is_on_page("bid_list") or self.base.is_on_page("search_results"):
+                await self.base.lean_fetch.apply("bid_list")
+        else:
+            await self.base.lean_fetch.disable()
+    
     async def navigate_to_main(self):
         """나라장터 메인 페이지로 이동"""
         try:
@@ -147,9 +205,11 @@ class G2BCrawler:
     async def navigate_to_bid_list(self):
         """입찰공고 목록 페이지로 이동"""
         try:
-            # 이미 입찰공고 목록 페이지에 있는 경우 건너뛰기
-            if self.base.is_on_page("bid_list"):
+            # 이미 입찰공고 목록 페이지에 있는 경우 건너뛰기 (실제 페이지 확인)
+            state = await self.base.page_state.probe()
+            if state.bid_list:
                 logger.info("이미 입찰공고 목록 페이지에 있습니다.")
+                self.base.set_page_state(state.name)
                 return True
                 
             logger.info("입찰공고 목록 페이지로 이동 시도")
@@ -172,6 +232,65 @@ class G2BCrawler:
             logger.debug(traceback.format_exc())
             return False
     
+    def set_date_range(self, date_range=None):
+        """
+        검색 기간 조건 설정 (다음 검색부터 검색 폼과 결과 필터에 적용)
+        
+        Args:
+            date_range: DateRange 인스턴스 (None이면 기간 조건 없음)
+        """
+        previous = self.date_range
+        if previous is not None and previous.active and not previous.same_as(date_range):
+            # 풀에서 재사용한 브라우저의 검색 폼에 이전 기간이 남아 있으므로 목록 페이지를 새로 연다
+            self._reset_search_form = True
+        self.date_range = date_range
+        if self.searcher:
+            self.searcher.date_range = date_range
+    
+    async def prepare_search(self, skip_navigation=False):
+        """
+        검색어 입력과 검색 버튼 클릭만 남은 상태로 준비
+        
+        현재 페이지 상태(URL, 검색 폼, 보기 개수, 기간)를 확인하여 목록 페이지 이동,
+        검색조건 탭 선택, 보기 개수/기간 설정 중 충족되지 않은 전이만 적용합니다.
+        
+        Args:
+            skip_navigation: 페이지 이동 단계를 건너뛸지 여부
+        
+        Returns:
+            bool: 준비 성공 여부
+        """
+        machine = self.base.page_state
+        state = await machine.probe()
+        
+        if state.bid_list and not self._reset_search_form:
+            logger.info("이미 입찰공고 목록 페이지에 있습니다.")
+            machine.record("navigate_bid_list", False)
+        elif not skip_navigation:
+            logger.info(f"입찰공고 목록 페이지로 이동합니다. (현재: {state.name or '알 수 없음'})")
+            if not await self.navigator.navigate_to_bid_list():
+                logger.error("입찰공고 목록 페이지 이동 실패")
+                return False
+            machine.record("navigate_bid_list", True)
+            self._reset_search_form = False
+            state = await machine.probe()
+        
+        select_tab = not state.search_input
+        set_page_size = not state.page_size_ok
+        set_dates = not state.dates_match(self.date_range)
+        machine.record("select_search_tab", select_tab)
+        machine.record("set_page_size", set_page_size)
+        if self.date_range is not None and self.date_range.active:
+            machine.record("set_date_range", set_dates)
+        if select_tab or set_page_size or set_dates:
+            if not await self.searcher.setup_search_conditions(select_tab=select_tab, set_page_size=set_page_size, set_dates=set_dates):
+                logger.warning("검색 조건 설정 실패 (계속 진행)")
+        else:
+            logger.info("검색 조건이 이미 설정되어 있습니다.")
+        
+        self.base.set_page_state(state.name or "bid_list")
+        return True
+    
     async def search_keyword(self, keyword=None, skip_navigation=False):
         """
         키워드로 입찰공고 검색 수행 (전체 흐름 조율)
@@ -190,22 +309,9 @@ class G2BCrawler:
         try:
             logger.info(f"키워드 '{search_keyword}' 검색 시작")
             
-            # 1. 페이지 이동 (G2BCrawler가 직접 담당)
-            if not skip_navigation:
-                if not self.base.is_on_page("bid_list"):
-                    logger.info("입찰공고 목록 페이지로 이동합니다.")
-                    if not await self.navigator.navigate_to_bid_list():
-                        logger.error("입찰공고 목록 페이지 이동 실패")
-                        return False
-                    
-                    # 페이지 이동 성공 시 상태 설정
-                    self.base.set_page_state("bid_list")
-                else:
-                    logger.info("이미 입찰공고 목록 페이지에 있습니다.")
-            
-            # 2. 검색 조건 설정
-            if not await self.searcher.setup_search_conditions():
-                logger.warning("검색 조건 설정 실패 (계속 진행)")
+            # 1~2. 페이지 이동 및 검색 조건 설정 (실제 상태를 확인해 빠진 단계만 수행)
+            if not await self.prepare_search(skip_navigation):
+                return False
             
             # 3. 실제 검색 수행 (G2BSearcher에 위임)
             if not await self.searcher.search_keyword(search_keyword):
@@ -214,27 +320,63 @@ class G2BCrawler:
             
             # 4. 검색 결과 페이지 상태 설정 (G2BCrawler가 담당)
             self.base.set_page_state("search_results")
+            self.record_pages(1)
             return True
         except Exception as e:
             logger.error(f"키워드 검색 중 오류 발생: {str(e)}")
             logger.debug(traceback.format_exc())
             return False
     
-    async def process_detail_page(self, item):
-        """단일 항목의 상세 페이지 처리"""
+    async def fetch_detail_source(self, item):
+        """
+        상세 URL을 새 탭에서 열어 HTML 소스만 가져오기 (목록 페이지 유지, 파싱은 하지 않음)
+        
+        이전 항목을 파싱하는 동안 다음 항목을 미리 가져올 때 사용하며,
+        결과는 process_detail_page의 fetched 인자로 전달합니다.
+        
+        Args:
+            item: 상세 URL이 있는 항목
+            
+        Returns:
+            Dict: {"page_source": HTML, "url": 현재 URL} (URL이 없거나 실패 시 None)
+        """
+        try:
+            return await self.detail_processor.fetch_detail_page_source(item)
+        except Exception as e:
+            logger.warning(f"상세 페이지 소스 미리 가져오기 실패: {str(e)}")
+            return None
+    
+    async def process_detail_page(self, item, fetched=None):
+        """
+        단일 항목의 상세 페이지 처리
+        
+        Args:
+            item: 처리할 항목
+            fetched: fetch_detail_source로 미리 가져온 HTML 소스 (None이면 여기서 가져옴)
+        """
         try:
             logger.info(f"항목 상세 페이지 처리: {item['title']}")
             
             # 상세 페이지 HTML 소스 가져오기
+            # 상세 URL이 있으면 새 탭에서 열어 가져오고 목록 페이지는 그대로 유지
             page_source = None
+            detail_url = None
             try:
-                page_source = self.detail_processor.driver.page_source
+                fetched = fetched or await self.detail_processor.fetch_detail_page_source(item)
+                if fetched:
+                    page_source = fetched["page_source"]
+                    detail_url = fetched["url"]
+                else:
+                    page_source = await self.actor.run(lambda: self.detail_processor.driver.page_source)
             except Exception as source_err:
                 logger.warning(f"페이지 소스 가져오기 실패: {str(source_err)}")
                 
             if not page_source:
                 logger.error("페이지 소스를 가져올 수 없습니다.")
                 return {'title': item.get('title', ''), 'error': '페이지 소스 없음'}
+            
+            # 재현용 스냅샷 기록 (PAGE_SNAPSHOTS=true일 때만)
+            snapshot_store.record("detail", page_source, keyword=item.get('keyword'), bid_number=item.get('bid_number'), url=detail_url)
                 
             # G2BParser를 활용한 상세 정보 추출
             bid_number = item.get('bid_number', '')
@@ -242,7 +384,7 @@ class G2BCrawler:
             
             # G2BParser의 parse_detail_page 메서드 활용
             detail_data = await self.parser.parse_detail_page(
-                page_source, bid_number, bid_title
+                page_source, bid_number, bid_title, cache_key=bid_key(item)
             )
             
             # 결과가 없는 경우 기존 방식으로 백업 추출
@@ -260,15 +402,17 @@ class G2BCrawler:
             
             # 추출 시간 및 URL 정보 추가
             detail_data['extraction_time'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            detail_data['detail_url'] = self.detail_processor.driver.current_url
+            self.record_pages(1)
+            detail_data['detail_url'] = detail_url or await self.actor.run(lambda: self.detail_processor.driver.current_url)
             
             # 모델 필드 매핑 위해 필요한 필드 이름 확인 및 매핑
             # bid_method, contract_method 등 필드 이름 통일
             if 'contract_method' in detail_data and 'bid_method' not in detail_data:
                 detail_data['bid_method'] = detail_data['contract_method']
             
-            # 페이지 상태 추적 업데이트
-            self.base.set_page_state("detail_page")
+            # 페이지 상태 추적 업데이트 (탭에서 열었으면 목록 페이지 유지)
+            if not detail_url:
+                self.base.set_page_state("detail_page")
             
             logger.info(f"상세 정보 추출 성공: {len(detail_data)} 필드")
             return detail_data
@@ -278,9 +422,135 @@ class G2BCrawler:
             logger.debug(traceback.format_exc())
             return {'title': item.get('title', ''), 'error': str(e)}
  
+    def search_cache_key(self, keyword, page):
+        """검색 결과 캐시 키 (키워드, 검색 기간, 보기 개수, 페이지)"""
+        return search_cache_key(keyword, self.date_range, SEARCH_PAGE_SIZE, page)
+    
+    async def has_cached_search(self, keyword, page=1):
+        """검색 결과 캐시에 해당 페이지가 있는지 확인 (있으면 목록 단계에서 브라우저 검색 생략 가능)"""
+        if not search_cache.enabled:
+            return False
+        return await asyncio.to_thread(search_cache.get, self.search_cache_key(keyword, page), False) is not None
+    
+    async def iter_search_results(self, max_items=0, start_page=1, prefetch=True, keyword=None):
+        """
+        검색 결과 전체 페이지를 순회하며 페이지별 항목을 추출 즉시 전달 (비동기 제너레이터)
+        
+        한 페이지를 넘겨준 뒤 소비자가 상세 정보를 처리하는 동안,
+        그 페이지의 모든 항목에 상세 URL이 있으면(목록 탭을 클릭하지 않음) 다음 페이지를 미리 요청합니다.
+        기간 조건이 있으면 검색 폼에 넣은 기간과 별도로 기간 밖 항목을 날짜 문자열 비교로 제외합니다.
+        
+        keyword를 지정하면 아직 검색하지 않은 상태로 보고, 검색 결과 캐시에 있는 페이지는 브라우저 없이 전달한 뒤
+        처음으로 캐시에 없는 페이지에서 검색을 수행해 브라우저로 이어서 순회합니다.
+        브라우저로 추출한 페이지는 캐시에 저장합니다.
+        
+        Args:
+            max_items: 전달할 최대 항목 수 (0 이하면 제한 없음)
+            start_page: 시작 페이지 번호 (재개 시 마지막으로 처리한 다음 페이지)
+            prefetch: 다음 페이지 미리 요청 여부
+            keyword: 캐시를 먼저 확인할 검색 키워드 (None이면 이미 검색한 브라우저의 결과만 사용)
+        
+        Yields:
+            (페이지 번호, 항목 리스트) 튜플
+        """
+        page = start_page
+        total = 0
+        
+        # 1. 캐시에 있는 페이지 전달 (브라우저 사용 안 함)
+        if keyword is not None and search_cache.enabled:
+            while page - start_page < SEARCH_MAX_PAGES:
+                entry = await asyncio.to_thread(search_cache.get, self.search_cache_key(keyword, page))
+                if entry is None:
+                    break
+                items = entry["items"]
+                if max_items > 0:
+                    items = items[:max_items - total]
+                total += len(items)
+                logger.info(f"{page}페이지 {len(items)}개 항목 검색 결과 캐시 사용 (누적 {total}개)")
+                if items:
+                    yield page, items
+                if entry["last"] or (max_items > 0 and total >= max_items):
+                    return
+                page += 1
+            
+            # 캐시에 없는 페이지부터는 브라우저로 검색
+            if not await self.search_keyword(keyword):
+                return
+        
+        cache_keyword = self.keyword
+        first_page = page
+        previous_keys = None
+        pending = None  # 미리 요청한 페이지의 클릭 전 첫 행 내용
+        ended = False  # 마지막 페이지까지 확인했는지 여부 (캐시의 마지막 페이지 표시용)
+        
+        if page > 1:
+            if not await self.searcher.go_to_page(page):
+                return
+            self.record_pages(1)
+        items = await self.searcher.extract_search_results()
+        
+        while items:
+            # 페이지 이동이 반영되지 않아 같은 행이 다시 나오면 중단
+            keys = [(item.get('bid_number'), item.get('title')) for item in items]
+            if keys == previous_keys:
+                logger.warning(f"{page}페이지 결과가 이전 페이지와 같아 순회를 중단합니다")
+                page -= 1
+                ended = True
+                break
+            previous_keys = keys
+            
+            # onclick/공고번호에서 상세 페이지 직접 URL 생성 (목록 재로딩 없이 상세 접근)
+            attach_detail_links(items)
+            if self.date_range is not None and self.date_range.active:
+                items = [item for item in items if self.date_range.contains(item)]
+            for item in items:
+                item['page'] = page
+            
+            # 상세 정보가 병합되기 전의 목록 항목을 캐시에 저장 (직렬화만 이벤트 루프에서)
+            if search_cache.enabled:
+                await asyncio.to_thread(search_cache.put, self.search_cache_key(cache_keyword, page), search_cache.serialize(items))
+            
+            if max_items > 0:
+                items = items[:max_items - total]
+            total += len(items)
+            logger.info(f"{page}페이지 {len(items)}개 항목 추출 (누적 {total}개)")
+            
+            more = (max_items <= 0 or total < max_items) and page - first_page + 1 < SEARCH_MAX_PAGES
+            if more and prefetch and all(self.detail_processor.get_detail_url(item) for item in items):
+                state = await self.searcher.request_page(page + 1)
+                pending = state.get("first", "") if state else None
+            
+            if items:
+                yield page, items
+            else:
+                logger.info(f"{page}페이지에 기간 안의 항목이 없습니다")
+            
+            if not more:
+                break
+            if not await self.searcher.go_to_page(page + 1, previous_first=pending):
+                ended = True
+                break
+            page += 1
+            self.record_pages(1)
+            # 미리 요청한 경우 상세 탭의 요청이 성능 로그에 섞이므로 그리드에서 직접 읽음
+            items = await self.searcher.extract_search_results(use_capture=pending is None)
+            pending = None
+        else:
+            ended = True
+            page -= 1
+        
+        if ended and page >= first_page and search_cache.enabled:
+            await asyncio.to_thread(search_cache.mark_last, self.search_cache_key(cache_keyword, page))
+    
+    async def go_to_result_page(self, page):
+        """검색 결과의 지정 페이지로 이동 (재개 시 클릭 방식 상세 처리를 위해 사용)"""
+        if page <= 1:
+            return True
+        return await self.searcher.go_to_page(page)
+    
     async def extract_search_results(self, max_items=1000):
         """
-        검색 결과 목록에서 항목 추출
+        검색 결과 목록에서 항목 추출 (모든 페이지)
         
         Args:
             max_items: 처리할 최대 항목 수 (기본값: 1000)
@@ -291,27 +561,15 @@ class G2BCrawler:
         try:
             logger.info("검색 결과 항목 추출 시작")
             
-            # 기본 검색 결과 항목 추출
-            all_items = await self.searcher.extract_search_results()
-            if not all_items:
-                logger.warning("추출된 항목이 없습니다")
-                return []
-                
-            logger.info(f"총 {len(all_items)}개 항목 추출됨")
-                
-            # 필터링 및 제한
             valid_items = []
+            async for page, page_items in self.iter_search_results(max_items=max_items, prefetch=False):
+                valid_items.extend(page_items)
             
-            for index, item in enumerate(all_items):
-                if max_items > 0 and len(valid_items) >= max_items:
-                    logger.info(f"최대 항목 수({max_items})에 도달하여 처리 중단")
-                    break
-                
-                # 연관성 확인 코드 제거 - 모든 항목을 유효한 것으로 처리
-                valid_items.append(item)
-                logger.info(f"항목 #{len(valid_items)} 추가: {item['title']}")
+            if not valid_items:
+                logger.warning("추출된 항목이 없습니다")
+                return []
             
-            logger.info(f"총 {len(all_items)}개 중 {len(valid_items)}개 항목 처리 대상")
+            logger.info(f"총 {len(valid_items)}개 항목 처리 대상")
             
             # 딕셔너리를 BidItem 모델로 변환하여 저장
             model_items = await self._convert_dict_results_to_model(valid_items)
@@ -372,6 +630,83 @@ class G2BCrawler:
             logger.debug(traceback.format_exc())
             return []
     
+    async def process_detail_pages_in_tabs(self, items, max_tabs: int = 3, on_item_done=None):
+        """
+        여러 탭에서 상세 페이지를 동시에 처리 (목록 페이지는 메인 탭에 유지)
+        
+        Args:
+            items: 처리할 항목 리스트
+            max_tabs: 동시에 열어 둘 최대 탭 수
+            on_item_done: 항목 처리 완료 시 호출할 코루틴 함수 (인덱스, 상세 정보)
+            
+        Returns:
+            List: 항목 순서대로 상세 정보 (실패 시 None)
+        """
+        try:
+            results = await self.detail_processor.process_detail_pages_in_tabs(items, max_tabs, on_item_done)
+            # 클릭 방식으로 처리한 항목이 있으면 목록 페이지로 복귀한 상태
+            self.base.set_page_state("search_results")
+            self.record_pages(len(items))
+            return results
+        except Exception as e:
+            logger.error(f"탭 병렬 상세 페이지 처리 중 오류: {str(e)}")
+            logger.debug(traceback.format_exc())
+            return [None] * len(items)
+
+    async def capture_http_templates(self, keyword: str) -> Optional[Dict[str, Any]]:
+        """
+        브라우저 없는 HTTP 수집을 위한 세션/요청 캡처
+
+        키워드를 한 번 검색하여 목록 요청을, 첫 항목의 상세 페이지를 열어
+        상세 요청을 캡처하고 세션 쿠키와 함께 반환합니다.
+
+        Args:
+            keyword: 캡처용 검색 키워드
+
+        Returns:
+            Dict: {"session": ..., "list_request": ..., "detail_request": ...} (목록 요청 캡처 실패 시 None)
+        """
+        from backend.crawler.g2b_http import export_session
+
+        grid_capture = self.base.grid_capture
+        if grid_capture is None:
+            logger.error("HTTP 수집에는 그리드 응답 수집(GRID_CAPTURE)이 필요합니다")
+            return None
+
+        try:
+            if not await self.search_keyword(keyword):
+                return None
+            items = await grid_capture.collect(keyword)
+            if not items or not grid_capture.list_request:
+                logger.error("목록 요청 캡처 실패")
+                return None
+            list_request = dict(grid_capture.list_request)
+
+            # 첫 항목 상세 페이지를 열어 공고번호가 포함된 요청 캡처
+            detail_request = None
+            first = next((item for item in items if item.get("bid_number")), None)
+            if first:
+                await grid_capture.begin()
+                if await self.detail_processor.fetch_detail_page_source(first):
+                    detail_request = await grid_capture.capture_request_containing(first["bid_number"])
+                if detail_request:
+                    detail_request["bid_number"] = first["bid_number"]
+                    detail_request["bid_revision"] = first.get("bid_revision")
+                else:
+                    logger.info("상세 요청을 찾지 못함, 상세 URL HTML 파싱으로 대체")
+
+            session = await export_session(self)
+            logger.info(f"HTTP 수집 템플릿 캡처 완료 (쿠키 {len(session['cookies'])}개, 상세 요청: {detail_request is not None})")
+            return {
+                "session": session,
+                "list_request": list_request,
+                "detail_request": detail_request
+            }
+        except Exception as e:
+            logger.error(f"HTTP 수집 템플릿 캡처 중 오류: {str(e)}")
+            logger.debug(traceback.format_exc())
+            return None
+
     def _prepare_results_for_save(self, items):
         """
         저장을 위해 결과 데이터 전처리
@@ -430,7 +765,8 @@ class G2BCrawler:
             
         return cleaned_results
 
-    def _convert_to_bid_item(self, item_dict: Dict[str, Any]) -> BidItem:
+    @staticmethod
+    def _convert_to_bid_item(item_dict: Dict[str, Any]) -> BidItem:
         """
         딕셔너리를 BidItem 모델로 변환
         
@@ -500,9 +836,10 @@ class G2BCrawler:
                 bid_title=item_dict.get('title', '변환 오류') or '변환 오류'
             )
 
-    async def _convert_dict_results_to_model(self, items: List[Dict[str, Any]]) -> List[BidItem]:
+    @staticmethod
+    async def _convert_dict_results_to_model(items: List[Dict[str, Any]]) -> List[BidItem]:
         """
-        딕셔너리 결과 목록을 BidItem 모델 목록으로 변환
+        딕셔너리 결과 목록을 BidItem 모델 목록으로 변환 (크롤러 상태를 사용하지 않으므로 인스턴스 없이 호출 가능)
         
         Args:
             items: 변환할 항목 딕셔너리 목록
@@ -514,7 +851,7 @@ class G2BCrawler:
         
         for item_dict in items:
             try:
-                bid_item = self._convert_to_bid_item(item_dict)
+                bid_item = G2BCrawler._convert_to_bid_item(item_dict)
                 model_items.append(bid_item)
             except Exception as e:
                 logger.error(f"항목 변환 중 오류: {str(e)}")
@@ -1,6 +1,5 @@
 import logging
 import traceback
-import asyncio
 from bs4 import BeautifulSoup
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -10,6 +9,11 @@ from datetime import datetime
 from urllib.parse import urlparse, urljoin
 import json
 import re
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+from backend.crawler.driver_actor import DriverActor
+from backend.crawler.wait_engine import WaitEngine
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -17,18 +21,25 @@ logger = logging.getLogger(__name__)
 class G2BDetailProcessor:
     """나라장터 상세 페이지 처리 클래스"""
     
-    def __init__(self, driver, extractor=None):
+    def __init__(self, driver, extractor=None, actor=None, lean_fetch=None, wait_engine=None):
         """
         초기화
         
         Args:
             driver: Selenium WebDriver 인스턴스
             extractor: JavaScript 값 추출을 위한 G2BExtractor 인스턴스 (선택사항)
+            actor: 드라이버 명령을 실행할 DriverActor (None이면 자체 생성)
+            lean_fetch: 페이지 유형별 리소스 차단 LeanFetch 인스턴스 (선택사항)
+            wait_engine: 조건 기반 대기 WaitEngine (None이면 자체 생성)
         """
         self.driver = driver
+        self.actor = actor or DriverActor()
+        self.lean_fetch = lean_fetch
+        self.wait_engine = wait_engine or WaitEngine(driver, self.actor)
         self.extractor = extractor
         self.search_results_url = None  # 검색 결과 페이지 URL 저장용
         self.recovery_attempts = 0  # 복구 시도 횟수 추적용
+        self.tab_timings = deque(maxlen=200)  # 탭별 상세 페이지 처리 시간 기록
     
     async def process_detail_page(self, item):
         """
@@ -40,42 +51,52 @@ class G2BDetailProcessor:
         Returns:
             상세 정보 (성공 시) 또는 None (실패 시)
         """
+        # 상세 URL이 있으면 새 탭에서 열어 목록 페이지를 그대로 유지
+        if self.get_detail_url(item):
+            return (await self.process_detail_pages_in_tabs([item], max_tabs=1))[0]
+        
         try:
             logger.info(f"상세 페이지 처리 시작 - {item['title']}")
             
-            # 실제 행 인덱스 값 획득
-            row_index = item.get('index', 0)
+            # 실제 행 인덱스 값 획득 (검색 결과 추출 시 row_index로 저장됨)
+            row_index = item.get('row_index', item.get('index', 0))
             
             # 상세 페이지 이동 - 셀 ID를 사용하여 직접 접근
             try:
                 # 현재 페이지의 행에 맞는 셀 ID를 생성
                 cell_id = f"mf_wfm_container_tacBidPbancLst_contents_tab2_body_gridView1_cell_{row_index}_6"
-                title_element = WebDriverWait(self.driver, 5).until(
+                title_element = await self.actor.run(
+                    WebDriverWait(self.driver, 5).until,
                     EC.presence_of_element_located((By.ID, cell_id))
                 )
                 
                 # 셀 내부의 링크 찾기
-                link_element = title_element.find_element(By.TAG_NAME, "a")
+                link_element = await self.actor.run(title_element.find_element, By.TAG_NAME, "a")
+                
+                if self.lean_fetch:
+                    await self.lean_fetch.apply("detail")
                 
                 # 직접 클릭
-                link_element.click()
+                await self.actor.run(link_element.click)
                 logger.info("셀 ID로 링크 클릭 성공")
             except Exception as e:
                 logger.error(f"상세 페이지 이동 실패: {str(e)}")
                 return None
             
-            # 상세 페이지 로딩 대기
-            await asyncio.sleep(3)
+            # 상세 페이지 로딩 대기 (상세 테이블 표시)
+            await self.wait_engine.wait_for_detail("detail")
             
             # 상세 페이지에서 정보 추출
             detail_data = await self._extract_detail_data()
             
             # 목록으로 돌아가기 - 항상 브라우저 뒤로가기 사용
-            self.driver.back()
+            if self.lean_fetch:
+                await self.lean_fetch.apply("bid_list")
+            await self.actor.run(self.driver.back)
             logger.info("브라우저 뒤로가기로 목록 페이지 복귀")
             
-            # 목록 페이지 로딩 대기
-            await asyncio.sleep(3)
+            # 목록 페이지 복귀 대기 (그리드 행 수 안정화)
+            await self.wait_engine.wait_for_grid("back_to_list")
             
             return detail_data
             
@@ -85,8 +106,8 @@ class G2BDetailProcessor:
             
             # 오류 발생 시 브라우저 뒤로가기 시도
             try:
-                self.driver.back()
-                await asyncio.sleep(2)
+                await self.actor.run(self.driver.back)
+                await self.wait_engine.wait_for_grid("back_to_list")
                 logger.info("오류 복구: 브라우저 뒤로가기 실행")
             except Exception as back_error:
                 logger.error(f"뒤로가기 실패: {str(back_error)}")
@@ -102,87 +123,12 @@ class G2BDetailProcessor:
             logger.info("상세 페이지 데이터 추출 시작")
             
             # 현재 URL이 실제로 상세 페이지인지 확인
-            current_url = self.driver.current_url
+            current_url = await self.actor.run(lambda: self.driver.current_url)
             if not ("Detail" in current_url or "detail" in current_url or "inqire" in current_url):
                 logger.warning(f"현재 URL이 상세 페이지가 아닌 것으로 보임: {current_url}")
             
-            # 페이지 로딩 대기
-            await asyncio.sleep(2)
-            
-            # 데이터 컨테이너 초기화
-            detail_data = {}
-            
-            # 방법 1: 표준 HTML 테이블에서 데이터 추출 시도
-            try:
-                # 상세 정보 테이블 찾기
-                tables = self.driver.find_elements(By.CSS_SELECTOR, ".table_list, .detail_table, .bid_table")
-                
-                if tables:
-                    logger.info(f"{len(tables)}개의 정보 테이블 발견")
-                    
-                    # 각 테이블에서 데이터 추출
-                    for table_idx, table in enumerate(tables):
-                        try:
-                            rows = table.find_elements(By.TAG_NAME, "tr")
-                            logger.info(f"테이블 {table_idx+1}: {len(rows)}개 행 발견")
-                            
-                            for row in rows:
-                                try:
-                                    # 제목 셀(th)과 데이터 셀(td) 찾기
-                                    th_cells = row.find_elements(By.TAG_NAME, "th")
-                                    td_cells = row.find_elements(By.TAG_NAME, "td")
-                                    
-                                    if th_cells and td_cells:
-                                        field_name = th_cells[0].text.strip()
-                                        field_value = td_cells[0].text.strip()
-                                        
-                                        # 필드명 정제 및 데이터 저장
-                                        field_name = field_name.replace(":", "").strip()
-                                        if field_name and field_value:
-                                            detail_data[field_name] = field_value
-                                            logger.debug(f"필드 추출: {field_name} = {field_value[:30]}...")
-                                except Exception as row_err:
-                                    logger.debug(f"행 처리 중 오류 (무시): {str(row_err)}")
-                                    continue
-                        except Exception as table_err:
-                            logger.debug(f"테이블 {table_idx+1} 처리 중 오류 (무시): {str(table_err)}")
-                            continue
-                else:
-                    logger.warning("표준 정보 테이블을 찾을 수 없음")
-            except Exception as tables_err:
-                logger.warning(f"HTML 테이블 추출 중 오류: {str(tables_err)}")
-            
-            # 방법 2: 특정 ID 패턴을 가진 요소에서 데이터 추출 시도
-            try:
-                # 나라장터 특유의 ID 패턴을 가진 요소들 찾기
-                detail_elements = self.driver.find_elements(By.CSS_SELECTOR, 
-                    "[id*='detail'], [id*='Detail'], [id*='Info'], [id*='info'], [class*='detail'], [class*='info']")
-                
-                if detail_elements:
-                    logger.info(f"{len(detail_elements)}개의 ID 패턴 요소 발견")
-                    
-                    for element in detail_elements:
-                        try:
-                            # 요소 ID와 텍스트 가져오기
-                            element_id = element.get_attribute("id") or ""
-                            element_text = element.text.strip()
-                            
-                            if element_text and ":" in element_text:
-                                # 텍스트에 "필드명: 값" 패턴이 있는 경우 분리
-                                parts = element_text.split(":", 1)
-                                field_name = parts[0].strip()
-                                field_value = parts[1].strip() if len(parts) > 1 else ""
-                                
-                                if field_name and field_value:
-                                    detail_data[field_name] = field_value
-                                    logger.debug(f"ID 요소에서 필드 추출: {field_name} = {field_value[:30]}...")
-                        except Exception as element_err:
-                            logger.debug(f"요소 처리 중 오류 (무시): {str(element_err)}")
-                            continue
-                else:
-                    logger.warning("ID 패턴 요소를 찾을 수 없음")
-            except Exception as id_err:
-                logger.warning(f"ID 패턴 요소 추출 중 오류: {str(id_err)}")
+            # 테이블/ID 패턴 요소에서 필드 수집 (드라이버 스레드에서 실행)
+            detail_data = await self.actor.run(self._collect_detail_fields)
             
             # 결과 확인
             if detail_data:
@@ -197,3 +143,259 @@ class G2BDetailProcessor:
             logger.debug(traceback.format_exc())
             return None
 
+    def _collect_detail_fields(self):
+        """
+        상세 페이지의 테이블 및 ID 패턴 요소에서 필드 수집 (드라이버 스레드에서 실행)
+        
+        Returns:
+            Dict: 필드명과 값 딕셔너리
+        """
+        # 데이터 컨테이너 초기화
+        detail_data = {}
+        
+        # 방법 1: 표준 HTML 테이블에서 데이터 추출 시도
+        try:
+            # 상세 정보 테이블 찾기
+            tables = self.driver.find_elements(By.CSS_SELECTOR, ".table_list, .detail_table, .bid_table")
+            
+            if tables:
+                logger.info(f"{len(tables)}개의 정보 테이블 발견")
+                
+                # 각 테이블에서 데이터 추출
+                for table_idx, table in enumerate(tables):
+                    try:
+                        rows = table.find_elements(By.TAG_NAME, "tr")
+                        logger.info(f"테이블 {table_idx+1}: {len(rows)}개 행 발견")
+                        
+                        for row in rows:
+                            try:
+                                # 제목 셀(th)과 데이터 셀(td) 찾기
+                                th_cells = row.find_elements(By.TAG_NAME, "th")
+                                td_cells = row.find_elements(By.TAG_NAME, "td")
+                                
+                                if th_cells and td_cells:
+                                    field_name = th_cells[0].text.strip()
+                                    field_value = td_cells[0].text.strip()
+                                    
+                                    # 필드명 정제 및 데이터 저장
+                                    field_name = field_name.replace(":", "").strip()
+                                    if field_name and field_value:
+                                        detail_data[field_name] = field_value
+                                        logger.debug(f"필드 추출: {field_name} = {field_value[:30]}...")
+                            except Exception as row_err:
+                                logger.debug(f"행 처리 중 오류 (무시): {str(row_err)}")
+                                continue
+                    except Exception as table_err:
+                        logger.debug(f"테이블 {table_idx+1} 처리 중 오류 (무시): {str(table_err)}")
+                        continue
+            else:
+                logger.warning("표준 정보 테이블을 찾을 수 없음")
+        except Exception as tables_err:
+            logger.warning(f"HTML 테이블 추출 중 오류: {str(tables_err)}")
+        
+        # 방법 2: 특정 ID 패턴을 가진 요소에서 데이터 추출 시도
+        try:
+            # 나라장터 특유의 ID 패턴을 가진 요소들 찾기
+            detail_elements = self.driver.find_elements(By.CSS_SELECTOR, 
+                "[id*='detail'], [id*='Detail'], [id*='Info'], [id*='info'], [class*='detail'], [class*='info']")
+            
+            if detail_elements:
+                logger.info(f"{len(detail_elements)}개의 ID 패턴 요소 발견")
+                
+                for element in detail_elements:
+                    try:
+                        # 요소 ID와 텍스트 가져오기
+                        element_id = element.get_attribute("id") or ""
+                        element_text = element.text.strip()
+                        
+                        if element_text and ":" in element_text:
+                            # 텍스트에 "필드명: 값" 패턴이 있는 경우 분리
+                            parts = element_text.split(":", 1)
+                            field_name = parts[0].strip()
+                            field_value = parts[1].strip() if len(parts) > 1 else ""
+                            
+                            if field_name and field_value:
+                                detail_data[field_name] = field_value
+                                logger.debug(f"ID 요소에서 필드 추출: {field_name} = {field_value[:30]}...")
+                    except Exception as element_err:
+                        logger.debug(f"요소 처리 중 오류 (무시): {str(element_err)}")
+                        continue
+            else:
+                logger.warning("ID 패턴 요소를 찾을 수 없음")
+        except Exception as id_err:
+            logger.warning(f"ID 패턴 요소 추출 중 오류: {str(id_err)}")
+        
+        return detail_data
+
+    @staticmethod
+    def get_detail_url(item) -> Optional[str]:
+        """탭으로 직접 열 수 있는 상세 페이지 URL 반환 (없으면 None)"""
+        url = item.get('detail_url') if isinstance(item, dict) else getattr(item, 'detail_url', None)
+        if url and urlparse(url).scheme in ("http", "https"):
+            return url
+        return None
+
+    async def process_detail_pages_in_tabs(self, items, max_tabs: int = 3, on_item_done: Optional[Callable] = None) -> List[Optional[Dict[str, Any]]]:
+        """
+        여러 탭에서 상세 페이지를 동시에 열어 처리 (목록 페이지는 메인 탭에 유지)
+        
+        상세 URL이 있는 항목은 최대 max_tabs개의 탭에서 동시에 로딩하고,
+        먼저 연 탭부터 추출 후 닫으면서 다음 항목의 탭을 엽니다.
+        URL이 없는 항목은 메인 탭에서 기존 클릭 방식으로 처리합니다.
+        
+        Args:
+            items: 처리할 항목 리스트
+            max_tabs: 동시에 열어 둘 최대 탭 수
+            on_item_done: 항목 처리 완료 시 호출할 코루틴 함수 (인덱스, 상세 정보)
+            
+        Returns:
+            List: 항목 순서대로 상세 정보 (실패 시 None)
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        queue = deque()
+        click_through = []
+        for index, item in enumerate(items):
+            url = self.get_detail_url(item)
+            if url:
+                queue.append((index, item, url))
+            else:
+                click_through.append((index, item))
+        
+        logger.info(f"탭 병렬 상세 처리 시작: 탭 {len(queue)}개 항목, 클릭 방식 {len(click_through)}개 항목 (최대 {max_tabs}개 탭)")
+        
+        main_handle = await self.actor.run(lambda: self.driver.current_window_handle)
+        open_tabs = deque()
+        
+        try:
+            while queue or open_tabs:
+                # 빈 슬롯만큼 새 탭 열기 (브라우저가 동시에 로딩)
+                while queue and len(open_tabs) < max_tabs:
+                    index, item, url = queue.popleft()
+                    start = time.perf_counter()
+                    try:
+                        handle = await self.actor.run(self._open_tab, url, main_handle)
+                    except Exception as e:
+                        logger.warning(f"상세 탭 열기 실패 ({url}): {str(e)}")
+                        click_through.append((index, item))
+                        continue
+                    open_tabs.append({"index": index, "item": item, "handle": handle, "start": start,
+                                      "open_ms": round((time.perf_counter() - start) * 1000, 1)})
+                
+                # 가장 먼저 연 탭 처리
+                tab = open_tabs.popleft()
+                results[tab["index"]] = await self._process_tab(tab, main_handle)
+                if on_item_done:
+                    await on_item_done(tab["index"], results[tab["index"]])
+        finally:
+            # 남은 탭 정리 후 목록 탭으로 복귀
+            for tab in open_tabs:
+                try:
+                    await self.actor.run(self._close_tab, tab["handle"], main_handle)
+                except Exception:
+                    pass
+        
+        # URL이 없는 항목은 메인 탭에서 클릭 방식으로 처리
+        for index, item in click_through:
+            results[index] = await self.process_detail_page(item)
+            if on_item_done:
+                await on_item_done(index, results[index])
+        
+        return results
+
+    async def _process_tab(self, tab: Dict[str, Any], main_handle: str) -> Optional[Dict[str, Any]]:
+        """열린 탭으로 전환하여 상세 정보 추출 후 탭 닫기"""
+        timing = {"index": tab["index"], "title": tab["item"].get('title', '') if isinstance(tab["item"], dict) else '',
+                  "open_ms": tab["open_ms"], "ok": False}
+        detail_data = None
+        try:
+            await self.actor.run(self.driver.switch_to.window, tab["handle"])
+            
+            # 탭 로딩 대기 (백그라운드에서 이미 로딩 중)
+            wait_start = time.perf_counter()
+            await self.wait_engine.wait_for_detail("detail_tab")
+            timing["wait_ms"] = round((time.perf_counter() - wait_start) * 1000, 1)
+            
+            extract_start = time.perf_counter()
+            detail_data = await self._extract_detail_data()
+            timing["extract_ms"] = round((time.perf_counter() - extract_start) * 1000, 1)
+            timing["ok"] = bool(detail_data)
+        except Exception as e:
+            logger.error(f"상세 탭 처리 중 오류: {str(e)}")
+            logger.debug(traceback.format_exc())
+        finally:
+            try:
+                await self.actor.run(self._close_tab, tab["handle"], main_handle)
+            except Exception as close_err:
+                logger.warning(f"상세 탭 닫기 실패: {str(close_err)}")
+        
+        timing["total_ms"] = round((time.perf_counter() - tab["start"]) * 1000, 1)
+        self.tab_timings.append(timing)
+        logger.info(f"상세 탭 처리 완료 (항목 {tab['index'] + 1}): 대기 {timing.get('wait_ms')}ms, 추출 {timing.get('extract_ms')}ms, 전체 {timing['total_ms']}ms")
+        return detail_data
+
+    async def fetch_detail_page_source(self, item) -> Optional[Dict[str, str]]:
+        """
+        상세 URL을 새 탭에서 열어 HTML 소스를 가져온 뒤 탭 닫기 (목록 페이지 유지)
+        
+        Args:
+            item: 상세 URL이 있는 항목
+            
+        Returns:
+            Dict: {"page_source": HTML, "url": 현재 URL} (URL이 없거나 실패 시 None)
+        """
+        url = self.get_detail_url(item)
+        if not url:
+            return None
+        
+        main_handle = await self.actor.run(lambda: self.driver.current_window_handle)
+        handle = None
+        try:
+            handle = await self.actor.run(self._open_tab, url, main_handle)
+            await self.actor.run(self.driver.switch_to.window, handle)
+            await self.wait_engine.wait_for_detail("detail_tab")
+            return await self.actor.run(lambda: {"page_source": self.driver.page_source, "url": self.driver.current_url})
+        except Exception as e:
+            logger.error(f"상세 페이지 직접 열기 실패 ({url}): {str(e)}")
+            logger.debug(traceback.format_exc())
+            return None
+        finally:
+            if handle:
+                try:
+                    await self.actor.run(self._close_tab, handle, main_handle)
+                except Exception as close_err:
+                    logger.warning(f"상세 탭 닫기 실패: {str(close_err)}")
+
+    def _open_tab(self, url: str, main_handle: str) -> str:
+        """메인 탭에서 새 탭을 열고 핸들 반환 (드라이버 스레드에서 실행)"""
+        self.driver.switch_to.window(main_handle)
+        before = set(self.driver.window_handles)
+        self.driver.execute_script("window.open(arguments[0], '_blank');", url)
+        new_handles = [handle for handle in self.driver.window_handles if handle not in before]
+        if not new_handles:
+            raise RuntimeError("새 탭이 열리지 않았습니다 (팝업 차단 여부 확인)")
+        return new_handles[0]
+
+    def _close_tab(self, handle: str, main_handle: str):
+        """탭을 닫고 메인 탭으로 복귀 (드라이버 스레드에서 실행)"""
+        if handle in self.driver.window_handles:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        self.driver.switch_to.window(main_handle)
+
+    def get_tab_stats(self) -> Dict[str, Any]:
+        """탭별 상세 페이지 처리 시간 통계 반환"""
+        timings = list(self.tab_timings)
+        
+        def mean(key):
+            values = [t[key] for t in timings if t.get(key) is not None]
+            return round(sum(values) / len(values), 1) if values else None
+        
+        return {
+            "count": len(timings),
+            "succeeded": sum(1 for t in timings if t["ok"]),
+            "mean_open_ms": mean("open_ms"),
+            "mean_wait_ms": mean("wait_ms"),
+            "mean_extract_ms": mean("extract_ms"),
+            "mean_total_ms": mean("total_ms"),
+            "recent": timings[-10:]
+        }
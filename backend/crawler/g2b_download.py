@@ -5,7 +5,6 @@
 """
 
 import os
-import time
 import logging
 import traceback
 from pathlib import Path
@@ -15,32 +14,92 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 
+from backend.crawler.driver_actor import DriverActor
+from backend.crawler.wait_engine import WaitEngine
+
 # 로거 설정
 logger = logging.getLogger("backend.crawler.download")
 
+# 다운로드 진행 중 임시 파일 확장자 (Chrome)
+PARTIAL_DOWNLOAD_SUFFIXES = (".crdownload", ".tmp")
+
 class G2BDownloader:
     """나라장터 첨부파일 다운로더 클래스"""
     
-    def __init__(self, driver, wait=None):
+    def __init__(self, driver, wait=None, actor=None, wait_engine=None):
         """
         초기화
         
         Args:
             driver: Selenium WebDriver 인스턴스
             wait: WebDriverWait 인스턴스 (None이면 기본값 사용)
+            actor: 드라이버 명령을 실행할 DriverActor (None이면 자체 생성)
+            wait_engine: 조건 기반 대기 WaitEngine (None이면 자체 생성)
         """
         self.driver = driver
         self.wait = wait if wait else self._create_default_wait()
+        self.actor = actor or DriverActor()
+        self.wait_engine = wait_engine or WaitEngine(driver, self.actor)
         
         # 다운로드 디렉토리 설정
         self.download_dir = Path("downloads")
         self.download_dir.mkdir(exist_ok=True)
+        self._download_path_set = False
+    
+    async def _set_download_path(self):
+        """브라우저 다운로드 위치를 다운로드 디렉토리로 지정 (완료 감지용, 처음 다운로드할 때 한 번)"""
+        if self._download_path_set:
+            return
+        try:
+            await self.actor.run(self.driver.execute_cdp_cmd, "Page.setDownloadBehavior", {
+                "behavior": "allow",
+                "downloadPath": str(self.download_dir.resolve())
+            })
+            self._download_path_set = True
+        except Exception as e:
+            logger.warning(f"다운로드 경로 설정 실패 (무시): {str(e)}")
     
     def _create_default_wait(self, timeout=10):
         """기본 WebDriverWait 생성"""
         from selenium.webdriver.support.ui import WebDriverWait
         return WebDriverWait(self.driver, timeout)
     
+    def _list_downloads(self) -> set:
+        """다운로드 디렉토리의 파일 이름 목록"""
+        return {path.name for path in self.download_dir.iterdir() if path.is_file()}
+    
+    def _find_completed_download(self, before: set) -> Optional[Path]:
+        """클릭 이후 새로 생긴 파일 중 다운로드가 끝난 파일 반환"""
+        current = self._list_downloads()
+        new_files = current - before
+        if not new_files or any(name.endswith(PARTIAL_DOWNLOAD_SUFFIXES) for name in new_files):
+            return None
+        return self.download_dir / sorted(new_files)[0]
+    
+    async def _click_and_wait_download(self, link, fallback_name: str) -> str:
+        """
+        다운로드 링크 클릭 후 파일이 완성될 때까지 대기
+        
+        Args:
+            link: 다운로드 링크 요소
+            fallback_name: 완료를 감지하지 못했을 때 사용할 파일 이름
+            
+        Returns:
+            str: 다운로드된 파일 경로 (감지 실패 시 추정 경로)
+        """
+        await self._set_download_path()
+        before = self._list_downloads()
+        await self.actor.run(link.click)
+        
+        downloaded = await self.wait_engine.wait_for("download", lambda: self._find_completed_download(before))
+        if downloaded:
+            logger.info(f"다운로드 완료: {downloaded.name}")
+            return str(downloaded)
+        
+        # 다운로드 완료를 감지하지 못한 경우 추정 경로 사용
+        logger.warning(f"다운로드 완료 확인 실패, 추정 경로 사용: {fallback_name}")
+        return str(self.download_dir / fallback_name)
+    
     async def download_attachments(self, bid_number: str) -> List[str]:
         """
         공고의 첨부파일 다운로드
@@ -58,7 +117,7 @@ class G2BDownloader:
             attachments = []
             try:
                 # 첨부파일 테이블 또는 첨부파일 링크 찾기
-                file_links = self.driver.find_elements(By.CSS_SELECTOR, "a.file_link, a[title*='다운로드'], a[onclick*='download']")
+                file_links = await self.actor.run(self.driver.find_elements, By.CSS_SELECTOR, "a.file_link, a[title*='다운로드'], a[onclick*='download']")
                 
                 if not file_links:
                     logger.info("첨부파일이 없거나 찾을 수 없습니다.")
@@ -69,16 +128,11 @@ class G2BDownloader:
                 # 각 첨부파일 다운로드
                 for idx, link in enumerate(file_links):
                     try:
-                        file_name = link.text.strip() or f"attachment_{idx+1}"
+                        file_name = (await self.actor.run(lambda: link.text)).strip() or f"attachment_{idx+1}"
                         logger.info(f"첨부파일 다운로드 시도: {file_name}")
                         
-                        # 다운로드 링크 클릭
-                        link.click()
-                        time.sleep(2)  # 다운로드 시작 대기
-                        
-                        # 다운로드된 파일 경로 추정 (브라우저 설정에 따라 다를 수 있음)
-                        expected_path = self.download_dir / file_name
-                        attachments.append(str(expected_path))
+                        # 다운로드 링크 클릭 후 완료 대기
+                        attachments.append(await self._click_and_wait_download(link, file_name))
                         
                     except Exception as e:
                         logger.warning(f"파일 '{file_name}' 다운로드 중 오류: {str(e)}")
@@ -113,7 +167,7 @@ class G2BDownloader:
             contract_files = []
             try:
                 # 계약 파일 링크 찾기
-                file_links = self.driver.find_elements(By.CSS_SELECTOR, "a.file_link, a[title*='다운로드'], a[onclick*='download']")
+                file_links = await self.actor.run(self.driver.find_elements, By.CSS_SELECTOR, "a.file_link, a[title*='다운로드'], a[onclick*='download']")
                 
                 if not file_links:
                     logger.info("계약 관련 파일이 없거나 찾을 수 없습니다.")
@@ -124,16 +178,11 @@ class G2BDownloader:
                 # 각 파일 다운로드
                 for idx, link in enumerate(file_links):
                     try:
-                        file_name = link.text.strip() or f"contract_{idx+1}"
+                        file_name = (await self.actor.run(lambda: link.text)).strip() or f"contract_{idx+1}"
                         logger.info(f"계약 관련 파일 다운로드 시도: {file_name}")
                         
-                        # 다운로드 링크 클릭
-                        link.click()
-                        time.sleep(2)  # 다운로드 시작 대기
-                        
-                        # 다운로드된 파일 경로 추정
-                        expected_path = self.download_dir / file_name
-                        contract_files.append(str(expected_path))
+                        # 다운로드 링크 클릭 후 완료 대기
+                        contract_files.append(await self._click_and_wait_download(link, file_name))
                         
                     except Exception as e:
                         logger.warning(f"파일 '{file_name}' 다운로드 중 오류: {str(e)}")
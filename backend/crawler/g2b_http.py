@@ -0,0 +1,292 @@
+"""
+브라우저 없는 HTTP 수집 모듈
+
+브라우저로 한 번 세션을 시작해 쿠키와 목록/상세 요청을 캡처한 뒤,
+공유 aiohttp.ClientSession으로 요청을 재전송하여 응답을 바로 파싱합니다.
+대량 백필(backfill)처럼 많은 키워드/항목을 수집할 때 사용합니다.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+import traceback
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import aiohttp
+
+from backend.crawler.bid_registry import bid_key
+from backend.crawler.grid_capture import GridCapture
+from backend.crawler.g2b_parser import G2BParser
+from backend.crawler.snapshot_store import snapshot_store
+
+# 로거 설정
+logger = logging.getLogger("backend.crawler.http")
+
+# 환경 변수 설정
+HTTP_BASE_URL = os.environ.get("G2B_HTTP_BASE_URL")  # 캡처한 요청의 호스트를 대체할 주소 (예: 스탠드인 서버)
+HTTP_CONCURRENCY = int(os.environ.get("G2B_HTTP_CONCURRENCY", "8"))
+HTTP_TIMEOUT = float(os.environ.get("G2B_HTTP_TIMEOUT", "30"))
+
+# 목록 요청의 페이지 번호/페이지 크기 파라미터 후보 키
+PAGE_KEYS = ["currentPage", "pageIndex", "pageNo", "page"]
+PAGE_SIZE_KEYS = ["recordCountPerPage", "pageUnit", "numOfRows", "pageSize"]
+
+# 재전송 시 제외할 헤더 (세션/연결별로 다시 생성됨)
+SKIPPED_HEADERS = {"cookie", "content-length", "host", "connection", "accept-encoding"}
+
+class HttpFetchError(Exception):
+    """목록 요청 실패 (HTTP 오류, 세션 만료, JSON이 아닌 응답) - 마지막 페이지와 구분하기 위해 사용"""
+    pass
+
+async def export_session(crawler) -> Dict[str, Any]:
+    """
+    브라우저 세션의 쿠키와 User-Agent 내보내기
+
+    Args:
+        crawler: 초기화된 G2BCrawler
+
+    Returns:
+        Dict: {"cookies": {이름: 값}, "user_agent": 문자열}
+    """
+    cookies = await crawler.actor.run(crawler.driver.get_cookies)
+    user_agent = await crawler.actor.run(crawler.driver.execute_script, "return navigator.userAgent;")
+    return {
+        "cookies": {cookie["name"]: cookie["value"] for cookie in cookies},
+        "user_agent": user_agent
+    }
+
+def rebase_url(url: str, base_url: Optional[str]) -> str:
+    """URL의 scheme/host를 base_url로 교체 (base_url이 없으면 그대로)"""
+    if not base_url:
+        return url
+    base = urlsplit(base_url)
+    parts = urlsplit(url)
+    return urlunsplit((base.scheme, base.netloc, parts.path, parts.query, parts.fragment))
+
+def replace_values(obj: Any, replacements: Dict[str, str], overrides: Dict[str, Any]) -> Any:
+    """
+    JSON 구조에서 값 치환
+
+    Args:
+        obj: 요청 본문 JSON
+        replacements: 원래 값 -> 새 값 (값이 정확히 일치하는 문자열만)
+        overrides: 키 이름 -> 새 값 (키 이름이 일치하면 교체)
+    """
+    if isinstance(obj, dict):
+        return {key: overrides[key] if key in overrides else replace_values(value, replacements, overrides)
+                for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [replace_values(value, replacements, overrides) for value in obj]
+    if isinstance(obj, str) and obj in replacements:
+        return replacements[obj]
+    return obj
+
+def flatten_json(obj: Any, result: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """중첩 JSON의 말단 값을 키별로 평탄화 (같은 키는 처음 값 유지)"""
+    result = {} if result is None else result
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if isinstance(value, (dict, list)):
+                flatten_json(value, result)
+            elif value not in (None, "") and key not in result:
+                result[key] = value
+    elif isinstance(obj, list):
+        for value in obj:
+            flatten_json(value, result)
+    return result
+
+class G2BHttpFetcher:
+    """캡처한 요청을 aiohttp로 재전송하는 수집기"""
+
+    def __init__(self, session_info: Dict[str, Any], list_request: Dict[str, Any], detail_request: Optional[Dict[str, Any]] = None,
+                 concurrency: int = HTTP_CONCURRENCY, base_url: Optional[str] = HTTP_BASE_URL, timeout: float = HTTP_TIMEOUT):
+        """
+        초기화
+
+        Args:
+            session_info: export_session() 결과 (쿠키, User-Agent)
+            list_request: 캡처한 목록 요청 (url, method, headers, post_data, keyword)
+            detail_request: 캡처한 상세 요청 (bid_number, bid_revision 포함, 없으면 detail_url GET)
+            concurrency: 동시 요청 수
+            base_url: 요청 호스트 대체 주소 (None이면 캡처한 주소 그대로)
+            timeout: 요청 제한 시간 (초)
+        """
+        self.session_info = session_info
+        self.list_request = list_request
+        self.detail_request = detail_request
+        self.concurrency = concurrency
+        self.base_url = base_url
+        self.timeout = timeout
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.stats = {
+            "requests": 0,
+            "errors": 0,
+            "bytes": 0,
+            "busy_seconds": 0.0
+        }
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def start(self):
+        """공유 세션 생성 (연결 풀 크기 = 동시 요청 수)"""
+        headers = {}
+        if self.session_info.get("user_agent"):
+            headers["User-Agent"] = self.session_info["user_agent"]
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.concurrency),
+            cookies=self.session_info.get("cookies", {}),
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+
+    async def close(self):
+        """세션 종료"""
+        if self.session:
+            await self.session.close()
+            self.session = None
+
+    def _build_request(self, template: Dict[str, Any], replacements: Dict[str, str], overrides: Dict[str, Any]) -> Tuple[str, str, Dict[str, str], Optional[str]]:
+        """캡처한 요청에 값을 치환하여 (method, url, headers, body) 생성"""
+        headers = {key: value for key, value in (template.get("headers") or {}).items()
+                   if key.lower() not in SKIPPED_HEADERS and not key.startswith(":")}
+        url = rebase_url(template["url"], self.base_url)
+        body = template.get("post_data")
+
+        if body:
+            try:
+                # JSON 본문 (WebSquare submission)
+                body = json.dumps(replace_values(json.loads(body), replacements, overrides), ensure_ascii=False)
+            except ValueError:
+                # form-urlencoded 본문
+                pairs = [(key, overrides.get(key, replacements.get(value, value))) for key, value in parse_qsl(body, keep_blank_values=True)]
+                body = urlencode(pairs)
+        else:
+            # GET 요청은 쿼리 문자열 치환
+            parts = urlsplit(url)
+            pairs = [(key, overrides.get(key, replacements.get(value, value))) for key, value in parse_qsl(parts.query, keep_blank_values=True)]
+            url = urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(pairs), parts.fragment))
+
+        return template.get("method", "GET"), url, headers, body
+
+    async def _request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, body: Optional[str] = None, raise_errors: bool = False) -> Optional[str]:
+        """동시 요청 수 제한 하에 요청 전송 후 응답 본문 반환 (실패 시 None, raise_errors이면 HttpFetchError 발생)"""
+        async with self._semaphore:
+            start = time.perf_counter()
+            self.stats["requests"] += 1
+            try:
+                async with self.session.request(method, url, headers=headers, data=body.encode("utf-8") if body else None) as response:
+                    text = await response.text()
+                    self.stats["bytes"] += len(text)
+                    if response.status >= 400:
+                        raise aiohttp.ClientResponseError(response.request_info, response.history, status=response.status)
+                    return text
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"HTTP 요청 실패 ({method} {url}): {str(e)}")
+                if raise_errors:
+                    raise HttpFetchError(f"HTTP 요청 실패 ({method} {url}): {str(e)}") from e
+                return None
+            finally:
+                self.stats["busy_seconds"] += time.perf_counter() - start
+
+    async def fetch_list(self, keyword: str, page: int = 1, page_size: int = 100) -> List[Dict[str, Any]]:
+        """
+        목록 요청 재전송으로 한 페이지의 검색 결과 항목 수집
+
+        Args:
+            keyword: 검색 키워드
+            page: 페이지 번호 (1부터)
+            page_size: 페이지당 항목 수
+
+        Returns:
+            List[Dict]: 검색 결과 항목 (빈 리스트는 결과 없음)
+
+        Raises:
+            HttpFetchError: 요청 실패 또는 JSON이 아닌 응답 (세션 만료 시 로그인/오류 페이지 HTML)
+        """
+        replacements = {self.list_request["keyword"]: keyword} if self.list_request.get("keyword") else {}
+        overrides = {key: page for key in PAGE_KEYS}
+        overrides.update({key: page_size for key in PAGE_SIZE_KEYS})
+
+        text = await self._request(*self._build_request(self.list_request, replacements, overrides), raise_errors=True)
+        try:
+            rows = GridCapture.find_rows(json.loads(text))
+        except ValueError as e:
+            raise HttpFetchError(f"목록 응답이 JSON이 아닙니다 ('{keyword}' {page}페이지)") from e
+
+        offset = (page - 1) * page_size
+        return [GridCapture.map_row(row, offset + index, keyword) for index, row in enumerate(rows)]
+
+    async def fetch_all(self, keyword: str, max_items: int = 1000, page_size: int = 100, stop_when: Optional[Callable[[List[Dict[str, Any]]], bool]] = None) -> List[Dict[str, Any]]:
+        """
+        마지막 페이지 또는 최대 항목 수까지 목록 수집 (stop_when이 페이지 행에 대해 True를 반환하면 중단)
+
+        Raises:
+            HttpFetchError: 목록 요청 실패 (일부 페이지만 받은 키워드를 완료로 처리하지 않도록 그대로 전달)
+        """
+        items: List[Dict[str, Any]] = []
+        page = 1
+        while max_items <= 0 or len(items) < max_items:
+            rows = await self.fetch_list(keyword, page, page_size)
+            items.extend(rows)
+            if len(rows) < page_size or (stop_when and stop_when(rows)):
+                break
+            page += 1
+        return items[:max_items] if max_items > 0 else items
+
+    async def fetch_detail(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        상세 요청 재전송 (캡처한 상세 요청이 없으면 detail_url GET 후 HTML 파싱)
+
+        Args:
+            item: 검색 결과 항목 (bid_number, bid_revision, detail_url)
+
+        Returns:
+            Dict: 상세 정보 (실패 시 None)
+        """
+        try:
+            if self.detail_request and item.get("bid_number"):
+                replacements = {self.detail_request["bid_number"]: item["bid_number"]}
+                if self.detail_request.get("bid_revision") and item.get("bid_revision"):
+                    replacements[self.detail_request["bid_revision"]] = item["bid_revision"]
+                text = await self._request(*self._build_request(self.detail_request, replacements, {}))
+                if text:
+                    detail_data = flatten_json(json.loads(text))
+                    detail_data.update({k: v for k, v in GridCapture.map_row(detail_data, item.get("row_index", 0)).items()
+                                        if k not in ("row_index", "keyword", "source", "additional_info") and v})
+                    return detail_data
+                return None
+
+            if not item.get("detail_url"):
+                return None
+            text = await self._request("GET", rebase_url(item["detail_url"], self.base_url))
+            if not text:
+                return None
+            snapshot_store.record("detail", text, keyword=item.get("keyword"), bid_number=item.get("bid_number"), url=item["detail_url"])
+            return await G2BParser.parse_detail_page(text, item.get("bid_number", ""), item.get("title", ""), cache_key=bid_key(item))
+        except Exception as e:
+            logger.warning(f"상세 응답 처리 실패 ({item.get('bid_number')}): {str(e)}")
+            logger.debug(traceback.format_exc())
+            return None
+
+    async def fetch_details(self, items: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """여러 항목의 상세 정보를 동시에 수집 (동시 요청 수는 세마포어로 제한)"""
+        return await asyncio.gather(*[self.fetch_detail(item) for item in items])
+
+    def get_stats(self) -> Dict[str, Any]:
+        """요청 통계 반환"""
+        return {
+            "concurrency": self.concurrency,
+            "base_url": self.base_url,
+            **self.stats,
+            "busy_seconds": round(self.stats["busy_seconds"], 2)
+        }
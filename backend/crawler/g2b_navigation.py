@@ -4,8 +4,8 @@
 나라장터 웹사이트 내 페이지 탐색 및 메뉴 접근 기능을 제공합니다.
 """
 
-import asyncio
 import logging
+import time
 import traceback
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
@@ -14,32 +14,45 @@ from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
 
+from backend.crawler.driver_actor import DriverActor
+from backend.crawler.wait_engine import WaitEngine
+
 # 로거 설정
 logger = logging.getLogger("backend.crawler.navigation")
 
 class G2BNavigator:
     """나라장터 페이지 탐색 클래스"""
     
-    def __init__(self, driver=None, wait=None):
+    def __init__(self, driver=None, wait=None, actor=None, lean_fetch=None, wait_engine=None, popup_guard=None):
         """
         나라장터 네비게이터 초기화
         
         Args:
             driver: Selenium WebDriver 인스턴스
             wait: WebDriverWait 인스턴스
+            actor: 드라이버 명령을 실행할 DriverActor (None이면 자체 생성)
+            lean_fetch: 페이지 유형별 리소스 차단 LeanFetch 인스턴스 (선택사항)
+            wait_engine: 조건 기반 대기 WaitEngine (None이면 자체 생성)
+            popup_guard: 팝업 자동 닫기 PopupGuard (None이면 기존 팝업 처리 사용)
         """
         self.driver = driver
         self.wait = wait
+        self.actor = actor or DriverActor()
+        self.lean_fetch = lean_fetch
+        self.wait_engine = wait_engine or WaitEngine(driver, self.actor)
+        self.popup_guard = popup_guard
         self.base_url = "https://www.g2b.go.kr"
     
     async def navigate_to_main(self):
         """나라장터 메인 페이지로 이동"""
         try:
             logger.info(f"나라장터 메인 페이지 접속 중: {self.base_url}")
-            self.driver.get(self.base_url)
+            if self.lean_fetch:
+                await self.lean_fetch.apply("main")
+            await self.actor.run(self.driver.get, self.base_url)
             
-            # 페이지 로딩 대기
-            await asyncio.sleep(3)
+            # 페이지 로딩 대기 (문서 로딩 완료 및 XHR 종료)
+            await self.wait_engine.wait_for_page_ready("main")
             
             # 팝업창 닫기
             await self._close_popups()
@@ -62,24 +75,25 @@ class G2BNavigator:
             
             for attempt in range(3):  # 최대 3번 시도
                 try:
-                    # 페이지 안정화를 위한 짧은 대기
-                    await asyncio.sleep(1)
-                    
                     # 메뉴 클릭을 통한 탐색
                     try:
+                        if self.lean_fetch:
+                            await self.lean_fetch.apply("bid_list")
+                        
                         # '입찰' 메뉴 직접 클릭
-                        bid_menu = self.wait.until(
+                        bid_menu = await self.actor.run(
+                            self.wait.until,
                             EC.element_to_be_clickable((By.ID, "mf_wfm_gnb_wfm_gnbMenu_genDepth1_1_btn_menuLvl1_span"))
                         )
-                        bid_menu.click()
-                        await asyncio.sleep(1)
+                        await self.actor.run(bid_menu.click)
                         
                         # '입찰공고목록' 직접 클릭
-                        bid_list = self.wait.until(
+                        bid_list = await self.actor.run(
+                            self.wait.until,
                             EC.element_to_be_clickable((By.ID, "mf_wfm_gnb_wfm_gnbMenu_genDepth1_1_genDepth2_0_genDepth3_0_btn_menuLvl3_span"))
                         )
-                        bid_list.click()
-                        await asyncio.sleep(3)
+                        await self.actor.run(bid_list.click)
+                        await self.wait_engine.wait_for_page_ready("bid_list")
                     except Exception as e:
                         logger.error(f"메뉴 클릭 실패: {str(e)}")
                         if attempt == 2:  # 마지막 시도에서 실패
@@ -95,12 +109,14 @@ class G2BNavigator:
                         search_button = None
                         try:
                             # 실제 운영 페이지 버튼 ID
-                            search_button = self.wait.until(
+                            search_button = await self.actor.run(
+                                self.wait.until,
                                 EC.presence_of_element_located((By.ID, "mf_wfm_container_tacBidPbancLst_contents_tab2_body_btnS0004"))
                             )
                         except Exception:
                             # 테스트 페이지 버튼 ID
-                            search_button = self.wait.until(
+                            search_button = await self.actor.run(
+                                self.wait.until,
                                 EC.presence_of_element_located((By.ID, "buttonSearch"))
                             )
                         
@@ -115,8 +131,8 @@ class G2BNavigator:
                     if attempt == 2:  # 마지막 시도에서도 실패
                         raise
                     # 페이지 새로고침 후 재시도
-                    self.driver.refresh()
-                    await asyncio.sleep(3)
+                    await self.actor.run(self.driver.refresh)
+                    await self.wait_engine.wait_for_page_ready("main")
                     await self._close_popups()
             
             # 모든 시도 실패
@@ -134,9 +150,9 @@ class G2BNavigator:
             
             # 탭 선택 (검색조건 탭이 있는 경우)
             try:
-                tab_element = self.driver.find_element(By.CSS_SELECTOR, ".tab_wrap li:nth-child(2) a")
-                tab_element.click()
-                await asyncio.sleep(1)
+                tab_element = await self.actor.run(self.driver.find_element, By.CSS_SELECTOR, ".tab_wrap li:nth-child(2) a")
+                await self.actor.run(tab_element.click)
+                await self.wait_engine.wait_for_page_ready("search_tab")
             except NoSuchElementException:
                 logger.info("검색조건 탭을 찾을 수 없습니다. 계속 진행합니다.")
             
@@ -151,9 +167,9 @@ class G2BNavigator:
             
             # 보기 개수 설정 (100개)
             try:
-                select_element = self.driver.find_element(By.ID, "mf_wfm_container_tacBidPbancLst_contents_tab2_body_sbxRecordCountPerPage1")
-                select = Select(select_element)
-                select.select_by_visible_text("100")
+                select_element = await self.actor.run(self.driver.find_element, By.ID, "mf_wfm_container_tacBidPbancLst_contents_tab2_body_sbxRecordCountPerPage1")
+                select = await self.actor.run(Select, select_element)
+                await self.actor.run(select.select_by_visible_text, "100")
                 logger.info("보기 개수 100개로 설정 완료")
             except Exception as e:
                 logger.warning(f"보기 개수 설정 실패 (무시): {str(e)}")
@@ -166,6 +182,18 @@ class G2BNavigator:
     
     async def _close_popups(self):
         """팝업창 닫기 (성공적인 부분만 유지)"""
+        try:
+            # 주입 스크립트가 페이지 안에서 이미 닫았으면 기록만 수집 (폴링/고정 대기 없음)
+            if self.popup_guard and self.popup_guard.installed:
+                if await self.actor.run(self.popup_guard.dismiss_sync) is not None:
+                    return True
+            return await self.actor.run(self._close_popups_sync)
+        except Exception as e:
+            logger.warning(f"팝업 처리 중 오류 (계속 진행): {str(e)}")
+            return True
+    
+    def _close_popups_sync(self):
+        """팝업창 닫기 (주입 스크립트를 사용할 수 없을 때, 드라이버 스레드에서 실행)"""
         try:
             logger.info("팝업창 닫기 시도 중...")
             
@@ -203,7 +231,7 @@ class G2BNavigator:
                         logger.info(f"공지사항 팝업 닫기 버튼 발견 (ID: {button_id})")
                         button.click()
                         logger.info("공지사항 팝업 닫기 성공")
-                        await asyncio.sleep(0.5)  # 잠시 대기
+                        time.sleep(0.5)  # 잠시 대기
                     except Exception as click_err:
                         logger.debug(f"버튼 클릭 실패, 다음 버튼 시도: {str(click_err)}")
                         continue
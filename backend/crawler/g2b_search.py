@@ -4,8 +4,8 @@
 나라장터 웹사이트에서 검색 수행 및 결과 추출 기능을 제공합니다.
 """
 
-import asyncio
 import logging
+import os
 import traceback
 import json
 import re
@@ -17,41 +17,200 @@ from selenium.webdriver.support.ui import Select
 from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
 from bs4 import BeautifulSoup
 
+from backend.crawler.driver_actor import DriverActor
+from backend.crawler.wait_engine import WaitEngine, GRID_ROW_SELECTOR
+from backend.crawler.locator_registry import locator_registry
 from backend.crawler.g2b_navigation import G2BNavigator
+from backend.crawler.page_state import (
+    PAGE_SIZE_SELECT_ID, SEARCH_PAGE_SIZE, FIND_FIRST_JS,
+    DATE_FROM_SELECTORS, DATE_TO_SELECTORS, DATE_TYPE_SELECTORS
+)
+from backend.crawler.snapshot_store import snapshot_store
+from backend.crawler.grid_script import GRID_ID, GRID_EXTRACT_SCRIPT, TITLE_COLUMN, rows_to_items
 from backend.utils.ai_helpers import check_relevance_with_ai, extract_with_gemini_text
 
 # 로거 설정
 logger = logging.getLogger("backend.crawler.search")
 
+# 검색어 입력 필드 후보 선택자 (우선순위 순)
+SEARCH_INPUT_LOCATORS = [
+    # ID로 직접 찾기 (현재 ID)
+    (By.ID, "mf_wfm_container_tacBidPbancLst_contents_tab2_body_bidPbancNm"),
+    # 이전 ID (이전 버전 호환)
+    (By.ID, "mf_wfm_container_tacBidPbancLst_contents_tab2_body_txtBidNm"),
+    # 부분 ID 매칭
+    (By.CSS_SELECTOR, "[id*='bidPbancNm']"),
+    (By.CSS_SELECTOR, "[id*='txtBidNm']"),
+    # title 속성 활용
+    (By.CSS_SELECTOR, "input[title='공고명']"),
+    # XPath 활용
+    (By.XPATH, "//*[contains(@id, 'bidPbancNm')]"),
+    (By.XPATH, "//input[@title='공고명']")
+]
+
+# 검색 버튼 후보 선택자 (우선순위 순)
+SEARCH_BUTTON_LOCATORS = [
+    # ID로 직접 찾기 (현재 ID)
+    (By.ID, "mf_wfm_container_tacBidPbancLst_contents_tab2_body_btnS0004"),
+    # 이전 ID (이전 버전 호환)
+    (By.ID, "buttonSearch"),
+    # 부분 ID 매칭
+    (By.CSS_SELECTOR, "[id*='btnS0004']"),
+    (By.CSS_SELECTOR, "button[id*='Search']"),
+    # title 또는 텍스트 속성 활용
+    (By.XPATH, "//button[contains(text(), '검색')]"),
+    (By.CSS_SELECTOR, "button[title='검색']"),
+    # 이미지 버튼 시도
+    (By.CSS_SELECTOR, "img[alt='검색']")
+]
+
+# 키워드당 최대 검색 결과 페이지 수 (무한 순회 방지)
+SEARCH_MAX_PAGES = int(os.environ.get("SEARCH_MAX_PAGES", "50"))
+
+# 목표 페이지까지 페이지 번호/다음 묶음 버튼을 누르는 최대 횟수
+MAX_PAGE_STEPS = 20
+
+# 페이지 목록(pglList)에서 현재 페이지와 보이는 페이지 번호를 읽고, 목표 페이지가 있으면 클릭하는 스크립트
+PAGE_LIST_SCRIPT = """
+var target = arguments[0], gridSelector = arguments[1], gridId = arguments[2];
+var scope = gridId.replace(/gridView1$/, '');
+var firstCell = document.querySelector(gridSelector);
+var first = firstCell ? (firstCell.textContent || '').trim().slice(0, 80) : '';
+var root = document.querySelector("[id^='" + scope + "'][id*='pglList']") || document.querySelector('.w2pageList');
+if (!root) return {found: false, first: first, current: null, pages: [], clicked: null};
+
+function visible(el) {
+    return !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+}
+function cls(el) {
+    return (el && el.getAttribute && el.getAttribute('class')) || '';
+}
+function control(pattern) {
+    var nodes = root.querySelectorAll("[id$='_" + pattern + "_btn'], [class*='" + pattern + "'], [title*='" + (pattern === 'next' ? '다음' : '이전') + "']");
+    for (var i = 0; i < nodes.length; i++) {
+        var label = cls(nodes[i]) + ' ' + (nodes[i].id || '') + ' ' + (nodes[i].getAttribute('title') || '');
+        if (/last|first|끝|처음/.test(label) || /disabled/.test(label) || !visible(nodes[i])) continue;
+        return nodes[i];
+    }
+    return null;
+}
+
+var labels = {}, current = null;
+var nodes = root.querySelectorAll('a, button, span, li');
+for (var i = 0; i < nodes.length; i++) {
+    var node = nodes[i], text = (node.textContent || '').trim();
+    if (!/^\\d+$/.test(text) || node.querySelector('a, button, span')) continue;
+    var num = +text;
+    if (!labels[num] || visible(node)) labels[num] = node;
+    var marker = cls(node) + ' ' + cls(node.parentElement);
+    if (/selected|active|current|\\bon\\b/.test(marker) || node.getAttribute('aria-current')) current = num;
+}
+var pages = Object.keys(labels).map(Number).sort(function(a, b) { return a - b; });
+
+var clicked = null;
+if (target && current !== target) {
+    if (labels[target] && visible(labels[target])) {
+        labels[target].click();
+        clicked = 'page';
+    } else if (pages.length && target > pages[pages.length - 1]) {
+        var next = control('next');
+        if (next) { next.click(); clicked = 'next_group'; }
+    } else if (pages.length && target < pages[0]) {
+        var prev = control('prev');
+        if (prev) { prev.click(); clicked = 'prev_group'; }
+    }
+}
+return {found: true, first: first, current: current, pages: pages, clicked: clicked};
+"""
+
+# 검색 폼 기간 조건을 설정하는 스크립트
+# WebSquare 달력 컴포넌트가 있으면 setValue(YYYYMMDD)를, 없으면 입력값 설정 후 변경 이벤트를 발생시킴
+SET_DATE_RANGE_SCRIPT = FIND_FIRST_JS + """
+var dateSelectors = arguments[0], start = arguments[1], end = arguments[2], label = arguments[3];
+function component(el) {
+    var ids = [el.id, el.id.replace(/_input$/, '')];
+    for (var i = 0; i < ids.length; i++) {
+        try {
+            if (window.$p && $p.getComponentById) { var c = $p.getComponentById(ids[i]); if (c && c.setValue) return c; }
+        } catch (e) {}
+        try {
+            if (window.WebSquare && WebSquare.util && WebSquare.util.getComponentById) {
+                var w = WebSquare.util.getComponentById(ids[i]); if (w && w.setValue) return w;
+            }
+        } catch (e) {}
+    }
+    return null;
+}
+function setDate(selectors, value) {
+    if (!value) return 'skipped';
+    var el = findFirst(selectors);
+    if (!el) return 'missing';
+    var comp = component(el);
+    if (comp) { comp.setValue(value); return 'component'; }
+    el.value = value.slice(0, 4) + '-' + value.slice(4, 6) + '-' + value.slice(6, 8);
+    ['input', 'change', 'blur'].forEach(function(type) { el.dispatchEvent(new Event(type, {bubbles: true})); });
+    return 'input';
+}
+var type = findFirst(dateSelectors[2]), typeResult = 'missing';
+if (type && type.options) {
+    typeResult = 'unmatched';
+    for (var i = 0; i < type.options.length; i++) {
+        if ((type.options[i].text || '').indexOf(label) >= 0) {
+            if (type.selectedIndex !== i) {
+                type.selectedIndex = i;
+                type.dispatchEvent(new Event('change', {bubbles: true}));
+            }
+            typeResult = 'selected';
+            break;
+        }
+    }
+}
+return {type: typeResult, start: setDate(dateSelectors[0], start), end: setDate(dateSelectors[1], end)};
+"""
+
 class G2BSearcher:
     """나라장터 검색 및 결과 추출 클래스"""
     
-    def __init__(self, driver=None, wait=None):
+    def __init__(self, driver=None, wait=None, actor=None, wait_engine=None, grid_capture=None):
         """
         나라장터 검색기 초기화
         
         Args:
             driver: Selenium WebDriver 인스턴스
             wait: WebDriverWait 인스턴스
-            navigator: G2BNavigator 인스턴스 (선택사항)
+            actor: 드라이버 명령을 실행할 DriverActor (None이면 자체 생성)
+            wait_engine: 조건 기반 대기 WaitEngine (None이면 자체 생성)
+            grid_capture: 그리드 JSON 응답 수집 GridCapture (None이면 DOM 추출만 사용)
         """
         self.driver = driver
         self.wait = wait
+        self.actor = actor or DriverActor()
+        self.wait_engine = wait_engine or WaitEngine(driver, self.actor)
+        self.grid_capture = grid_capture
         self.results = []
         self.keyword = ""
+        self.date_range = None  # 검색 폼에 넣을 기간 조건 (DateRange)
+        
+    async def setup_search_conditions(self, select_tab: bool = True, set_page_size: bool = True, set_dates: bool = True):
+        """
+        검색 조건 설정
         
-    async def setup_search_conditions(self):
-        """검색 조건 설정"""
+        Args:
+            select_tab: 검색조건 탭 선택 여부 (검색 폼이 이미 보이면 False)
+            set_page_size: 보기 개수 100개 설정 여부 (이미 설정되어 있으면 False)
+            set_dates: 기간 조건 설정 여부 (기간 조건이 없거나 이미 설정되어 있으면 False)
+        """
         try:
             logger.info("검색 조건 설정 중...")
             
             # 탭 선택 (검색조건 탭이 있는 경우)
-            try:
-                tab_element = self.driver.find_element(By.CSS_SELECTOR, ".tab_wrap li:nth-child(2) a")
-                tab_element.click()
-                await asyncio.sleep(1)
-            except NoSuchElementException:
-                logger.info("검색조건 탭을 찾을 수 없습니다. 계속 진행합니다.")
+            if select_tab:
+                try:
+                    tab_element = await self.actor.run(self.driver.find_element, By.CSS_SELECTOR, ".tab_wrap li:nth-child(2) a")
+                    await self.actor.run(tab_element.click)
+                    await self.wait_engine.wait_for_page_ready("search_tab")
+                except NoSuchElementException:
+                    logger.info("검색조건 탭을 찾을 수 없습니다. 계속 진행합니다.")
             
             # # '입찰마감제외' 체크박스 클릭
             # try:
@@ -65,16 +224,21 @@ class G2BSearcher:
             #     logger.warning(f"'입찰마감제외' 체크박스 선택 실패 (계속 진행): {str(e)}")
             
             # 보기 개수 설정 (100개)
-            try:
-                select_element = self.driver.find_element(By.ID, "mf_wfm_container_tacBidPbancLst_contents_tab2_body_sbxRecordCountPerPage1")
-                select = Select(select_element)
-                select.select_by_visible_text("100")
-                logger.info("보기 개수 100개로 설정 완료")
-            except Exception as e:
-                logger.warning(f"보기 개수 설정 실패 (계속 진행): {str(e)}")
+            if set_page_size:
+                try:
+                    select_element = await self.actor.run(self.driver.find_element, By.ID, PAGE_SIZE_SELECT_ID)
+                    select = await self.actor.run(Select, select_element)
+                    await self.actor.run(select.select_by_visible_text, SEARCH_PAGE_SIZE)
+                    logger.info(f"보기 개수 {SEARCH_PAGE_SIZE}개로 설정 완료")
+                except Exception as e:
+                    logger.warning(f"보기 개수 설정 실패 (계속 진행): {str(e)}")
+                
+                # 보기 개수 변경에 따른 요청 완료 대기
+                await self.wait_engine.wait_for_page_ready("search_conditions")
             
-            # 시간 지연으로 UI 반영 대기
-            await asyncio.sleep(1)
+            # 기간 조건 설정 (공고게시일자/입찰마감일자)
+            if set_dates:
+                await self.apply_date_range()
             
             return True
         except Exception as e:
@@ -82,6 +246,38 @@ class G2BSearcher:
             logger.debug(traceback.format_exc())
             return False
         
+    async def apply_date_range(self) -> bool:
+        """
+        검색 폼에 기간 조건 입력 (스크립트 1회 실행)
+        
+        Returns:
+            bool: 요청한 날짜를 모두 입력했는지 여부 (기간 조건이 없으면 True)
+        """
+        date_range = self.date_range
+        if not date_range or not date_range.active:
+            return True
+        
+        try:
+            result = await self.actor.run(
+                self.driver.execute_script, SET_DATE_RANGE_SCRIPT,
+                [DATE_FROM_SELECTORS, DATE_TO_SELECTORS, DATE_TYPE_SELECTORS],
+                date_range.start, date_range.end, date_range.label
+            ) or {}
+        except Exception as e:
+            logger.warning(f"기간 조건 설정 실패 (결과 필터만 적용): {str(e)}")
+            return False
+        
+        applied = all(result.get(key) in ("component", "input", "skipped") for key in ("start", "end"))
+        if applied:
+            logger.info(f"기간 조건 설정 완료: {date_range.label} {date_range.start or ''}~{date_range.end or ''} ({result})")
+        else:
+            logger.warning(f"기간 입력 필드를 찾지 못했습니다 (결과 필터만 적용): {result}")
+        if result.get("type") not in ("selected", "missing"):
+            logger.warning(f"조회기준 '{date_range.label}' 선택 실패: {result.get('type')}")
+        
+        await self.wait_engine.wait_for_page_ready("search_dates")
+        return applied
+        
     async def search_keyword(self, search_keyword):
         """
         키워드로 입찰공고 검색 수행 (순수 검색 기능만 담당)
@@ -94,27 +290,32 @@ class G2BSearcher:
         """
         try:
             logger.info(f"키워드 '{search_keyword}' 검색 시작")
+            self.keyword = search_keyword
             
             # 검색어 입력 필드 찾기
-            search_input = self.find_search_input()
+            search_input = await self.actor.run(self.find_search_input)
             if not search_input:
                 logger.error("검색어 입력 필드를 찾을 수 없습니다")
                 return False
             
             # 검색어 입력
-            search_input.clear()
-            search_input.send_keys(search_keyword)
+            await self.actor.run(search_input.clear)
+            await self.actor.run(search_input.send_keys, search_keyword)
             
             # 검색 버튼 찾아 클릭
-            search_button = self.find_search_button()
+            search_button = await self.actor.run(self.find_search_button)
             if not search_button:
                 logger.error("검색 버튼을 찾을 수 없습니다")
                 return False
             
-            search_button.click()
+            # 이번 검색의 그리드 응답만 수집되도록 이전 성능 로그 비우기
+            if self.grid_capture:
+                await self.grid_capture.begin()
             
-            # 검색 결과 로딩 대기
-            await asyncio.sleep(2)
+            await self.actor.run(search_button.click)
+            
+            # 검색 결과 로딩 대기 (그리드 행 수 안정화)
+            await self.wait_engine.wait_for_grid("search_results")
             
             logger.info(f"키워드 '{search_keyword}' 검색 성공")
             return True
@@ -125,31 +326,10 @@ class G2BSearcher:
             return False
     
     def find_search_input(self):
-        """다양한 방법으로 검색어 입력 필드 찾기"""
-        selectors = [
-            # ID로 직접 찾기 (현재 ID)
-            By.ID, "mf_wfm_container_tacBidPbancLst_contents_tab2_body_bidPbancNm",
-            # 이전 ID (이전 버전 호환)
-            By.ID, "mf_wfm_container_tacBidPbancLst_contents_tab2_body_txtBidNm",
-            # 부분 ID 매칭
-            By.CSS_SELECTOR, "[id*='bidPbancNm']",
-            By.CSS_SELECTOR, "[id*='txtBidNm']",
-            # title 속성 활용
-            By.CSS_SELECTOR, "input[title='공고명']",
-            # XPath 활용
-            By.XPATH, "//*[contains(@id, 'bidPbancNm')]",
-            By.XPATH, "//input[@title='공고명']"
-        ]
-        
-        for i in range(0, len(selectors), 2):
-            try:
-                selector_type = selectors[i]
-                selector_value = selectors[i+1]
-                element = self.wait.until(EC.presence_of_element_located((selector_type, selector_value)))
-                logger.info(f"검색 입력 필드 발견: {selector_type} - {selector_value}")
-                return element
-            except Exception:
-                continue
+        """기억된 선택자 우선으로 검색어 입력 필드 찾기 (드라이버 스레드에서 실행)"""
+        element = locator_registry.find(self.driver, "search_input", SEARCH_INPUT_LOCATORS)
+        if element:
+            return element
         
         # JavaScript로 직접 찾기 (최후의 수단)
         try:
@@ -167,16 +347,97 @@ class G2BSearcher:
         logger.error("검색 입력 필드를 찾을 수 없습니다.")
         return None
     
-    async def extract_search_results(self):
+    async def read_page_list(self, target: int = 0) -> Optional[Dict[str, Any]]:
+        """
+        페이지 목록 상태 확인 (target이 보이면 클릭, 없으면 다음/이전 묶음 버튼 클릭)
+        
+        Args:
+            target: 이동할 페이지 번호 (0이면 확인만)
+        
+        Returns:
+            Dict: 현재 페이지, 보이는 페이지 번호, 클릭 전 첫 행 내용, 클릭한 버튼 종류
+        """
+        return await self.actor.run(self.driver.execute_script, PAGE_LIST_SCRIPT, target, GRID_ROW_SELECTOR, GRID_ID)
+    
+    async def request_page(self, page: int) -> Optional[Dict[str, Any]]:
+        """
+        결과 페이지 이동 요청 (클릭만 하고 그리드 로딩은 기다리지 않음, 미리 로딩용)
+        
+        Returns:
+            Dict: 클릭 전 페이지 목록 상태 (목표 페이지 번호가 보이지 않으면 None)
+        """
+        state = await self.read_page_list(page)
+        if not state or state.get("clicked") != "page":
+            return None
+        return state
+    
+    async def go_to_page(self, page: int, previous_first: Optional[str] = None) -> bool:
+        """
+        결과 페이지 이동 후 그리드 로딩 대기 (필요하면 다음/이전 묶음 버튼을 거쳐 이동)
+        
+        Args:
+            page: 이동할 페이지 번호
+            previous_first: 이미 요청한 이동의 클릭 전 첫 행 내용 (미리 로딩한 경우)
+        
+        Returns:
+            bool: 이동 성공 여부 (페이지가 없으면 False)
+        """
+        try:
+            if previous_first is not None:
+                # 미리 요청한 페이지 로딩 완료 대기 후 실제로 도착했는지 확인
+                await self.wait_engine.wait_for_grid_change(previous_first, "search_page")
+            
+            for _ in range(MAX_PAGE_STEPS):
+                if self.grid_capture:
+                    await self.grid_capture.begin()
+                state = await self.read_page_list(page)
+                if not state or not state.get("found"):
+                    return page == 1
+                if state.get("current") == page:
+                    return True
+                if not state.get("clicked"):
+                    logger.info(f"검색 결과 {page}페이지가 없습니다 (표시된 페이지: {state.get('pages')})")
+                    return False
+                if not await self.wait_engine.wait_for_grid_change(state.get("first", ""), "search_page"):
+                    logger.warning(f"검색 결과 {page}페이지 로딩 대기 시간 초과")
+                    return False
+                if state.get("clicked") == "page":
+                    return True
+            
+            logger.warning(f"검색 결과 {page}페이지 이동 실패 ({MAX_PAGE_STEPS}회 시도)")
+            return False
+        except Exception as e:
+            logger.error(f"검색 결과 페이지 이동 중 오류: {str(e)}")
+            logger.debug(traceback.format_exc())
+            return False
+    
+    async def extract_search_results(self, use_capture: bool = True):
         """
         검색 결과 목록에서 항목 추출
         
+        Args:
+            use_capture: 그리드 응답 수집 방식 사용 여부 (다른 탭의 요청이 섞였으면 False)
+        
         Returns:
             검색 결과 항목 리스트
         """
         try:
             logger.info("검색 결과 항목 추출 시작")
             
+            # 그리드 JSON 응답 수집 방식 우선 시도 (DOM 탐색 없음)
+            if self.grid_capture and use_capture:
+                items = await self.grid_capture.collect(self.keyword)
+                if items:
+                    return items
+            
+            # WebSquare 그리드 데이터셋을 스크립트 한 번으로 읽기 (행/셀별 왕복 없음)
+            try:
+                items = await self.extract_search_results_script()
+                if items:
+                    return items
+            except Exception as script_err:
+                logger.warning(f"그리드 스크립트 추출 실패: {str(script_err)}")
+            
             # BS4 방식 추출 시도 (더 안정적)
             try:
                 items = await self.extract_search_results_bs4()
@@ -194,54 +455,8 @@ class G2BSearcher:
             try:
                 logger.info("셀 ID 패턴 방식으로 항목 추출 시도")
                 
-                # 셀 ID 패턴으로 직접 공고명 셀 탐색
-                for row_idx in range(20):  # 최대 20행까지 시도
-                    try:
-                        cell_id = f"mf_wfm_container_tacBidPbancLst_contents_tab2_body_gridView1_cell_{row_idx}_6"
-                        cell = self.driver.find_element(By.ID, cell_id)
-                        
-                        # 셀에서 링크 찾기
-                        try:
-                            link = cell.find_element(By.CSS_SELECTOR, "nobr > a")
-                        except:
-                            try:
-                                link = cell.find_element(By.TAG_NAME, "a")
-                            except:
-                                continue
-                        
-                        if not link.is_displayed():
-                            continue
-                            
-                        title = link.text.strip()
-                        onclick = link.get_attribute("onclick")
-                        
-                        if title:
-                            item = {
-                                "title": title,
-                                "onclick": onclick,
-                                "cell_id": cell_id,
-                                "row_index": row_idx
-                            }
-                            
-                            # 다른 필드 추출 시도
-                            try:
-                                # 공고번호 (일반적으로 셀 ID의 마지막 숫자만 다름)
-                                for col_idx in [1, 2, 3]:  # 1~3번째 열에서 시도
-                                    try:
-                                        num_cell_id = f"mf_wfm_container_tacBidPbancLst_contents_tab2_body_gridView1_cell_{row_idx}_{col_idx}"
-                                        num_cell = self.driver.find_element(By.ID, num_cell_id)
-                                        item["bid_number"] = num_cell.text.strip()
-                                        if item["bid_number"]:
-                                            break
-                                    except:
-                                        continue
-                            except Exception:
-                                pass
-                            
-                            items.append(item)
-                            logger.info(f"셀 ID 패턴으로 항목 추출: {title[:30]}... (행 {row_idx})")
-                    except Exception:
-                        continue
+                # 셀 ID 패턴으로 직접 공고명 셀 탐색 (드라이버 스레드에서 실행)
+                items = await self.actor.run(self._extract_items_by_cell_ids)
                 
                 if items:
                     logger.info(f"셀 ID 패턴으로 {len(items)}개 항목 추출 성공")
@@ -259,13 +474,13 @@ class G2BSearcher:
                 if tables:
                     for table in tables:
                         # 테이블 행 추출
-                        rows = table.find_elements(By.XPATH, ".//tr")
+                        rows = await self.actor.run(table.find_elements, By.XPATH, ".//tr")
                         
                         # 첫 번째 행은 헤더이므로 제외
                         if len(rows) > 1:
                             # 행별로 항목 추출
                             for i, row in enumerate(rows[1:], 0):  # 인덱스 0부터 시작 (실제 행은 1부터)
-                                item = await self._extract_item_from_row(row, i, current_date)
+                                item = await self.actor.run(self._extract_item_from_row, row, i, current_date)
                                 if item:
                                     items.append(item)
                         
@@ -283,13 +498,13 @@ class G2BSearcher:
                 
                 # 행 추출 (첫 번째 행은 헤더일 수 있으므로 생략)
                 xpath = "//table//tr[position() > 1]"
-                rows = self.driver.find_elements(By.XPATH, xpath)
+                rows = await self.actor.run(self.driver.find_elements, By.XPATH, xpath)
                 
                 logger.info(f"XPath {xpath}로 {len(rows)}개 행 발견")
                 
                 for i, row in enumerate(rows):
                     try:
-                        item = await self._extract_item_from_row(row, i, current_date)
+                        item = await self.actor.run(self._extract_item_from_row, row, i, current_date)
                         if item:
                             items.append(item)
                     except Exception as row_err:
@@ -313,6 +528,75 @@ class G2BSearcher:
             logger.debug(traceback.format_exc())
             return []
 
+    async def extract_search_results_script(self):
+        """
+        그리드 데이터셋 전체를 execute_script 한 번으로 추출
+        
+        WebSquare 컴포넌트 API가 있으면 숨김 ID 컬럼을 포함한 데이터셋을,
+        없으면 셀 ID 패턴 DOM 순회 결과를 사용합니다.
+        
+        Returns:
+            검색 결과 항목 리스트
+        """
+        payload = await self.actor.run(self.driver.execute_script, GRID_EXTRACT_SCRIPT, GRID_ID, TITLE_COLUMN)
+        items = rows_to_items(payload, self.keyword)
+        if items:
+            logger.info(f"그리드 스크립트 추출로 {len(items)}개 항목 추출 성공 (방식: {payload.get('source')})")
+        return items
+    
+    def _extract_items_by_cell_ids(self):
+        """셀 ID 패턴으로 검색 결과 항목 추출 (드라이버 스레드에서 실행)"""
+        items = []
+        for row_idx in range(20):  # 최대 20행까지 시도
+            try:
+                cell_id = f"mf_wfm_container_tacBidPbancLst_contents_tab2_body_gridView1_cell_{row_idx}_6"
+                cell = self.driver.find_element(By.ID, cell_id)
+                
+                # 셀에서 링크 찾기
+                try:
+                    link = cell.find_element(By.CSS_SELECTOR, "nobr > a")
+                except:
+                    try:
+                        link = cell.find_element(By.TAG_NAME, "a")
+                    except:
+                        continue
+                
+                if not link.is_displayed():
+                    continue
+                    
+                title = link.text.strip()
+                onclick = link.get_attribute("onclick")
+                
+                if title:
+                    item = {
+                        "title": title,
+                        "onclick": onclick,
+                        "cell_id": cell_id,
+                        "row_index": row_idx
+                    }
+                    
+                    # 다른 필드 추출 시도
+                    try:
+                        # 공고번호 (일반적으로 셀 ID의 마지막 숫자만 다름)
+                        for col_idx in [1, 2, 3]:  # 1~3번째 열에서 시도
+                            try:
+                                num_cell_id = f"mf_wfm_container_tacBidPbancLst_contents_tab2_body_gridView1_cell_{row_idx}_{col_idx}"
+                                num_cell = self.driver.find_element(By.ID, num_cell_id)
+                                item["bid_number"] = num_cell.text.strip()
+                                if item["bid_number"]:
+                                    break
+                            except:
+                                continue
+                    except Exception:
+                        pass
+                    
+                    items.append(item)
+                    logger.info(f"셀 ID 패턴으로 항목 추출: {title[:30]}... (행 {row_idx})")
+            except Exception:
+                continue
+    
+        return items
+    
     async def extract_search_results_bs4(self):
         """
         BeautifulSoup를 사용하여 검색 결과 목록에서 항목 추출
@@ -327,16 +611,11 @@ class G2BSearcher:
             current_date = datetime.now().strftime("%Y-%m-%d")
             
             # 페이지 소스 가져오기
-            page_source = self.driver.page_source
+            page_source = await self.actor.run(lambda: self.driver.page_source)
             soup = BeautifulSoup(page_source, 'html.parser')
             
-            # 디버깅을 위해 페이지 소스 저장
-            try:
-                with open("search_results_debug.html", "w", encoding="utf-8") as f:
-                    f.write(page_source)
-                logger.info("디버깅을 위해 페이지 소스를 search_results_debug.html에 저장했습니다.")
-            except Exception as e:
-                logger.warning(f"디버그 파일 저장 실패: {str(e)}")
+            # 재현용 스냅샷 기록 (PAGE_SNAPSHOTS=true일 때만, 백그라운드 스레드에서 압축 저장)
+            snapshot_store.record("list", page_source, keyword=self.keyword)
             
             # 테이블 기반 추출 (이미지 확인 기반)
             items = self._extract_items_from_table(soup, current_date)
@@ -521,31 +800,10 @@ class G2BSearcher:
             return None 
         
     def find_search_button(self):
-        """다양한 방법으로 검색 버튼 찾기"""
-        selectors = [
-            # ID로 직접 찾기 (현재 ID)
-            By.ID, "mf_wfm_container_tacBidPbancLst_contents_tab2_body_btnS0004",
-            # 이전 ID (이전 버전 호환)
-            By.ID, "buttonSearch",
-            # 부분 ID 매칭
-            By.CSS_SELECTOR, "[id*='btnS0004']",
-            By.CSS_SELECTOR, "button[id*='Search']",
-            # title 또는 텍스트 속성 활용
-            By.XPATH, "//button[contains(text(), '검색')]",
-            By.CSS_SELECTOR, "button[title='검색']",
-            # 이미지 버튼 시도
-            By.CSS_SELECTOR, "img[alt='검색']"
-        ]
-        
-        for i in range(0, len(selectors), 2):
-            try:
-                selector_type = selectors[i]
-                selector_value = selectors[i+1]
-                element = self.wait.until(EC.element_to_be_clickable((selector_type, selector_value)))
-                logger.info(f"검색 버튼 발견: {selector_type} - {selector_value}")
-                return element
-            except Exception:
-                continue
+        """기억된 선택자 우선으로 검색 버튼 찾기 (드라이버 스레드에서 실행)"""
+        element = locator_registry.find(self.driver, "search_button", SEARCH_BUTTON_LOCATORS, EC.element_to_be_clickable)
+        if element:
+            return element
         
         # JavaScript로 직접 찾기 (최후의 수단)
         try:
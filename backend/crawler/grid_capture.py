@@ -0,0 +1,229 @@
+"""
+검색 결과 그리드 응답 수집 모듈
+
+WebSquare 목록 그리드(gridView1)를 채우는 JSON XHR 응답을
+Chrome 성능 로그(performance log)와 CDP Network.getResponseBody로 읽어
+렌더링된 DOM을 긁지 않고 바로 검색 결과 항목으로 변환합니다.
+"""
+
+import json
+import logging
+import time
+import traceback
+from typing import Any, Dict, List, Optional
+
+from backend.crawler.detail_link import build_detail_url, DEFAULT_REVISION
+
+# 로거 설정
+logger = logging.getLogger("backend.crawler.grid_capture")
+
+# 결과 항목 필드별 응답 JSON 후보 키 (앞쪽 우선)
+FIELD_KEYS = {
+    "bid_number": ["bidPbancNo", "bidNtceNo", "pbancNo"],
+    "bid_revision": ["bidPbancOrd", "bidNtceOrd", "pbancOrd"],
+    "title": ["bidPbancNm", "bidNtceNm", "pbancNm"],
+    "department": ["dmstNm", "ntceInsttNm", "grpNm", "pbancInstNm", "dminsttNm"],
+    "date_start": ["pbancPstgDt", "bidNtceDt", "pbancDt"],
+    "date_end": ["slprRcptDdlnDt", "bidClseDt", "ddlnDt"],
+    "status": ["pbancSttsNm", "bidPrgsSttsNm", "prgsSttsNm"],
+    "bid_method": ["bidMthdNm", "cntrctMthdNm", "cntrctCnclsMthdNm"],
+    "bid_type": ["bidPbancKndNm", "bsnsDivNm", "prcmBsneSeNm"]
+}
+
+# 목록 응답으로 판단할 키 (행 딕셔너리에 하나 이상 존재)
+ROW_MARKER_KEYS = FIELD_KEYS["bid_number"] + FIELD_KEYS["title"]
+
+class GridCapture:
+    """성능 로그 기반 그리드 JSON 응답 수집 클래스"""
+
+    def __init__(self, driver, actor):
+        """
+        초기화
+
+        Args:
+            driver: performance 로그가 활성화된 Selenium WebDriver 인스턴스
+            actor: 드라이버 명령을 실행할 DriverActor
+        """
+        self.driver = driver
+        self.actor = actor
+        self.list_request: Optional[Dict[str, Any]] = None  # 마지막 그리드 응답을 만든 요청 (재전송용)
+        self.stats = {
+            "captures": 0,
+            "hits": 0,
+            "misses": 0,
+            "rows": 0,
+            "last_seconds": None
+        }
+
+    async def begin(self):
+        """검색 직전 호출: 이전 성능 로그를 비워 이번 검색 응답만 남도록 함"""
+        try:
+            await self.actor.run(self.driver.get_log, "performance")
+        except Exception as e:
+            logger.debug(f"성능 로그 비우기 실패 (무시): {str(e)}")
+
+    async def collect(self, keyword: str = "") -> List[Dict[str, Any]]:
+        """
+        검색 이후 수신한 그리드 JSON 응답을 찾아 항목 목록으로 변환
+
+        Args:
+            keyword: 항목에 기록할 검색 키워드
+
+        Returns:
+            List[Dict]: 검색 결과 항목 (응답을 찾지 못하면 빈 리스트)
+        """
+        start = time.perf_counter()
+        self.stats["captures"] += 1
+        try:
+            rows = await self.actor.run(self._collect_rows)
+        except Exception as e:
+            logger.warning(f"그리드 응답 수집 실패: {str(e)}")
+            logger.debug(traceback.format_exc())
+            rows = []
+
+        if rows and self.list_request is not None:
+            self.list_request["keyword"] = keyword  # 재전송 시 치환할 원래 검색어
+
+        items = [self.map_row(row, index, keyword) for index, row in enumerate(rows)]
+        items = [item for item in items if item.get("title")]
+
+        self.stats["last_seconds"] = round(time.perf_counter() - start, 3)
+        if items:
+            self.stats["hits"] += 1
+            self.stats["rows"] += len(items)
+            logger.info(f"그리드 응답에서 {len(items)}개 항목 추출 ({self.stats['last_seconds']}초)")
+        else:
+            self.stats["misses"] += 1
+            logger.info("그리드 응답을 찾지 못함, DOM 추출로 대체")
+        return items
+
+    def _read_network_log(self) -> List[Any]:
+        """성능 로그에서 완료된 XHR/JSON 응답의 (requestId, 요청 정보) 목록 반환 (드라이버 스레드에서 실행)"""
+        entries = self.driver.get_log("performance")
+
+        requests = {}
+        json_requests = []
+        finished = set()
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError, TypeError):
+                continue
+            method = message.get("method")
+            params = message.get("params", {})
+            if method == "Network.requestWillBeSent":
+                request = params.get("request", {})
+                requests[params.get("requestId")] = {
+                    "url": request.get("url"),
+                    "method": request.get("method", "GET"),
+                    "headers": request.get("headers", {}),
+                    "post_data": request.get("postData"),
+                    "has_post_data": request.get("hasPostData", False)
+                }
+            elif method == "Network.responseReceived":
+                response = params.get("response", {})
+                if params.get("type") in ("XHR", "Fetch") or "json" in response.get("mimeType", ""):
+                    json_requests.append(params.get("requestId"))
+            elif method == "Network.loadingFinished":
+                finished.add(params.get("requestId"))
+
+        return [(request_id, requests.get(request_id)) for request_id in json_requests if request_id in finished]
+
+    def _request_template(self, request_id: str, request: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """재전송용 요청 정보 완성 (로그에 빠진 POST 본문 보충)"""
+        if not request:
+            return None
+        template = dict(request)
+        if template.pop("has_post_data", False) and template.get("post_data") is None:
+            try:
+                template["post_data"] = self.driver.execute_cdp_cmd("Network.getRequestPostData", {"requestId": request_id}).get("postData")
+            except Exception:
+                pass
+        return template
+
+    def _collect_rows(self) -> List[Dict[str, Any]]:
+        """성능 로그에서 JSON 응답 본문을 읽어 가장 큰 목록 행 배열 반환 (드라이버 스레드에서 실행)"""
+        best_rows: List[Dict[str, Any]] = []
+        best_request = None
+        # 마지막 응답이 현재 그리드 내용일 가능성이 높으므로 역순 확인
+        for request_id, request in reversed(self._read_network_log()):
+            try:
+                body = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+            except Exception:
+                continue  # 이미 해제된 응답
+            if body.get("base64Encoded"):
+                continue
+            try:
+                payload = json.loads(body.get("body", ""))
+            except ValueError:
+                continue
+            rows = self.find_rows(payload)
+            if len(rows) > len(best_rows):
+                best_rows = rows
+                best_request = self._request_template(request_id, request)
+
+        if best_request:
+            self.list_request = best_request
+        return best_rows
+
+    async def capture_request_containing(self, value: str) -> Optional[Dict[str, Any]]:
+        """
+        begin() 이후 URL 또는 POST 본문에 값이 포함된 마지막 XHR 요청 정보 반환 (상세 요청 캡처용)
+
+        Args:
+            value: 찾을 값 (예: 공고번호)
+
+        Returns:
+            Dict: 요청 정보 (url, method, headers, post_data) (없으면 None)
+        """
+        def find():
+            for request_id, request in reversed(self._read_network_log()):
+                template = self._request_template(request_id, request)
+                if template and value in (template.get("url") or "") + (template.get("post_data") or ""):
+                    return template
+            return None
+
+        try:
+            return await self.actor.run(find)
+        except Exception as e:
+            logger.warning(f"요청 캡처 실패: {str(e)}")
+            return None
+
+    @staticmethod
+    def find_rows(payload: Any) -> List[Dict[str, Any]]:
+        """응답 JSON에서 입찰공고 행으로 보이는 가장 큰 딕셔너리 배열 탐색"""
+        best: List[Dict[str, Any]] = []
+        stack = [payload]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                stack.extend(node.values())
+            elif isinstance(node, list):
+                if node and isinstance(node[0], dict) and any(key in node[0] for key in ROW_MARKER_KEYS):
+                    if len(node) > len(best):
+                        best = node
+                else:
+                    stack.extend(node)
+        return best
+
+    @staticmethod
+    def map_row(row: Dict[str, Any], index: int, keyword: str = "") -> Dict[str, Any]:
+        """응답 행을 DOM 추출과 같은 형태의 항목 딕셔너리로 변환 (BidItem 변환 가능)"""
+        item: Dict[str, Any] = {"row_index": index, "keyword": keyword, "source": "network"}
+        for field, keys in FIELD_KEYS.items():
+            for key in keys:
+                value = row.get(key)
+                if value not in (None, ""):
+                    item[field] = str(value).strip()
+                    break
+
+        if item.get("bid_number"):
+            revision = str(item.get("bid_revision") or DEFAULT_REVISION).zfill(3)
+            item["bid_revision"] = revision
+            item["detail_url"] = build_detail_url(item["bid_number"], revision)
+        item["additional_info"] = row  # 원본 응답 필드 보존
+        return item
+
+    def get_stats(self) -> Dict[str, Any]:
+        """수집 통계 반환"""
+        return dict(self.stats)
@@ -0,0 +1,159 @@
+"""
+그리드 스크립트 추출 모듈
+
+검색 결과 그리드(gridView1)를 execute_script 한 번으로 읽습니다.
+WebSquare 컴포넌트 API(gridView → dataList)가 있으면 숨김 ID 컬럼을 포함한 전체 데이터셋을,
+없으면 셀 ID 패턴(gridView1_cell_{행}_{열}) DOM 순회 결과를 컬럼/행 배열 형태의 간결한 JSON으로 반환합니다.
+"""
+
+import logging
+import re
+from typing import Any, Dict, List, Optional
+
+from backend.crawler.grid_capture import GridCapture
+
+# 로거 설정
+logger = logging.getLogger("backend.crawler.grid_script")
+
+# 검색 결과 그리드 컴포넌트 ID
+GRID_ID = "mf_wfm_container_tacBidPbancLst_contents_tab2_body_gridView1"
+
+# 공고명 링크가 있는 열과 공고번호 후보 열 (DOM 순회 시)
+TITLE_COLUMN = 6
+BID_NUMBER_COLUMNS = [1, 2, 3]
+
+# 그리드 데이터셋을 컬럼/행 배열로 반환하는 스크립트
+GRID_EXTRACT_SCRIPT = """
+var gridId = arguments[0], titleCol = arguments[1];
+
+function component(id) {
+    try {
+        if (window.$p && $p.getComponentById) { var c = $p.getComponentById(id); if (c) return c; }
+    } catch (e) {}
+    try {
+        if (window.WebSquare && WebSquare.util && WebSquare.util.getComponentById) {
+            var w = WebSquare.util.getComponentById(id); if (w) return w;
+        }
+    } catch (e) {}
+    return window[id] || null;
+}
+
+function fromDataList(grid) {
+    if (!grid || !grid.getDataList) return null;
+    var dl = grid.getDataList();
+    if (typeof dl === 'string') dl = component(dl) || component(gridId.replace(/gridView1$/, '') + dl);
+    if (!dl || !dl.getAllJSON) return null;
+    var data = dl.getAllJSON() || [];
+    var columns = [];
+    data.forEach(function(row) {
+        for (var key in row) { if (columns.indexOf(key) < 0) columns.push(key); }
+    });
+    return {
+        source: 'dataList',
+        columns: columns,
+        rows: data.map(function(row) {
+            return columns.map(function(key) { return row[key] == null ? null : row[key]; });
+        })
+    };
+}
+
+function fromGridApi(grid) {
+    if (!grid || !grid.getRowCount || !grid.getColumnCount || !grid.getColumnID || !grid.getCellData) return null;
+    var rowCount = grid.getRowCount(), colCount = grid.getColumnCount();
+    var columns = [];
+    for (var c = 0; c < colCount; c++) columns.push(grid.getColumnID(c));
+    var rows = [];
+    for (var r = 0; r < rowCount; r++) {
+        var values = [];
+        for (var k = 0; k < colCount; k++) values.push(grid.getCellData(r, k));
+        rows.push(values);
+    }
+    return {source: 'gridApi', columns: columns, rows: rows};
+}
+
+function fromDom() {
+    var pattern = /_cell_(\\d+)_(\\d+)$/;
+    var cells = document.querySelectorAll('[id^="' + gridId + '_cell_"]');
+    var byRow = {}, maxCol = -1;
+    for (var i = 0; i < cells.length; i++) {
+        var m = cells[i].id.match(pattern);
+        if (!m) continue;
+        var r = +m[1], c = +m[2];
+        (byRow[r] = byRow[r] || {})[c] = (cells[i].textContent || '').trim();
+        if (c === titleCol) {
+            var link = cells[i].querySelector('nobr > a') || cells[i].querySelector('a');
+            byRow[r].onclick = link ? link.getAttribute('onclick') : null;
+            byRow[r].cellId = cells[i].id;
+        }
+        if (c > maxCol) maxCol = c;
+    }
+    var columns = ['row'];
+    for (var col = 0; col <= maxCol; col++) columns.push('col_' + col);
+    columns.push('onclick', 'cell_id');
+    var rows = Object.keys(byRow).map(Number).sort(function(a, b) { return a - b; }).map(function(r) {
+        var values = [r];
+        for (var col = 0; col <= maxCol; col++) values.push(byRow[r][col] == null ? null : byRow[r][col]);
+        values.push(byRow[r].onclick || null, byRow[r].cellId || null);
+        return values;
+    });
+    return {source: 'dom', columns: columns, rows: rows};
+}
+
+var grid = component(gridId), result = null;
+try { result = fromDataList(grid); } catch (e) {}
+if (!result || !result.rows.length) { try { result = fromGridApi(grid) || result; } catch (e) {} }
+if (!result || !result.rows.length) result = fromDom();
+return result;
+"""
+
+def _dom_row_to_item(row: Dict[str, Any], keyword: str) -> Optional[Dict[str, Any]]:
+    """DOM 순회 행을 셀 ID 추출과 같은 형태의 항목으로 변환"""
+    title = row.get(f"col_{TITLE_COLUMN}")
+    if not title:
+        return None
+    item: Dict[str, Any] = {
+        "title": title,
+        "onclick": row.get("onclick"),
+        "cell_id": row.get("cell_id") or f"{GRID_ID}_cell_{row['row']}_{TITLE_COLUMN}",
+        "row_index": row["row"],
+        "keyword": keyword,
+        "source": "grid_dom"
+    }
+    for column in BID_NUMBER_COLUMNS:
+        value = row.get(f"col_{column}")
+        if value:
+            item["bid_number"] = value
+            break
+    item["additional_info"] = {key: value for key, value in row.items() if re.match(r"col_\d+$", key) and value}
+    return item
+
+def rows_to_items(payload: Optional[Dict[str, Any]], keyword: str = "") -> List[Dict[str, Any]]:
+    """
+    스크립트 반환값(컬럼/행 배열)을 검색 결과 항목 목록으로 변환
+
+    Args:
+        payload: GRID_EXTRACT_SCRIPT 반환값
+        keyword: 항목에 기록할 검색 키워드
+
+    Returns:
+        List[Dict]: 검색 결과 항목 (데이터가 없으면 빈 리스트)
+    """
+    if not payload or not payload.get("rows"):
+        return []
+
+    columns = payload.get("columns") or []
+    source = payload.get("source")
+    items = []
+    for index, values in enumerate(payload["rows"]):
+        row = dict(zip(columns, values))
+        if source == "dom":
+            item = _dom_row_to_item(row, keyword)
+        else:
+            # 컴포넌트 데이터셋은 응답 JSON과 같은 컬럼 ID를 사용하므로 같은 매핑 적용
+            item = GridCapture.map_row(row, index, keyword)
+            item["source"] = f"grid_{source}"
+            if not item.get("title"):
+                item = None
+        if item:
+            items.append(item)
+    return items
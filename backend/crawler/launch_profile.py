@@ -0,0 +1,184 @@
+"""
+Chrome 실행 프로필 모듈
+
+크롤러용 Chrome 실행 플래그 묶음(standard/lean), tmpfs에 두는 임시 사용자 데이터 디렉토리,
+여러 워커가 읽기 전용으로 공유하는 HTTP 디스크 캐시 시드(seed)를 관리합니다.
+
+캐시 시드는 Chrome이 동시에 같은 캐시 디렉토리를 열 수 없으므로,
+실행 시 워커별 캐시 디렉토리로 복사해 사용하고 시드가 없을 때만 종료 시 한 번 기록합니다.
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+import time
+import traceback
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# 로거 설정
+logger = logging.getLogger("backend.crawler.launch_profile")
+
+# 환경 변수 설정
+CHROME_LAUNCH_PROFILE = os.environ.get("CHROME_LAUNCH_PROFILE", "standard")  # standard | lean
+CHROME_PROFILE_ROOT = os.environ.get("CHROME_PROFILE_ROOT", "")  # 사용자 데이터 디렉토리 상위 경로 (예: /dev/shm, 비우면 Chrome 기본값)
+CHROME_CACHE_SEED_DIR = os.environ.get("CHROME_CACHE_SEED_DIR", "")  # 공유 HTTP 캐시 시드 경로 (비우면 미사용)
+CHROME_CACHE_SIZE_MB = int(os.environ.get("CHROME_CACHE_SIZE_MB", "200"))
+
+# 모든 프로필 공통 플래그 (기존 CrawlerBase 설정)
+STANDARD_FLAGS = [
+    "--disable-gpu",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--window-size=1920,1080",
+    "--disable-popup-blocking",
+    "--lang=ko_KR.UTF-8"
+]
+
+# lean 프로필 추가 플래그: 크롤링과 무관한 백그라운드 작업/기능 비활성화
+LEAN_FLAGS = [
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-extensions",
+    "--disable-component-extensions-with-background-pages",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-domain-reliability",
+    "--disable-client-side-phishing-detection",
+    "--disable-breakpad",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--disable-features=Translate,OptimizationHints,MediaRouter,InterestFeedContentSuggestions,AutofillServerCommunication"
+]
+
+PROFILES = {
+    "standard": STANDARD_FLAGS,
+    "lean": STANDARD_FLAGS + LEAN_FLAGS
+}
+
+def dir_size(path: Path) -> int:
+    """디렉토리 전체 파일 크기 (바이트)"""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                continue
+    return total
+
+class LaunchProfile:
+    """Chrome 실행 플래그, 사용자 데이터 디렉토리, 캐시 시드 관리 클래스"""
+
+    def __init__(self, name: str = CHROME_LAUNCH_PROFILE, profile_root: str = CHROME_PROFILE_ROOT,
+                 cache_seed_dir: str = CHROME_CACHE_SEED_DIR, cache_size_mb: int = CHROME_CACHE_SIZE_MB):
+        """
+        초기화
+
+        Args:
+            name: 플래그 프로필 이름 (standard, lean)
+            profile_root: 사용자 데이터 디렉토리를 만들 상위 경로 (tmpfs 권장, 비우면 Chrome 기본값)
+            cache_seed_dir: 공유 HTTP 캐시 시드 경로 (비우면 미사용)
+            cache_size_mb: 디스크 캐시 최대 크기 (MB)
+        """
+        if name not in PROFILES:
+            logger.warning(f"알 수 없는 실행 프로필 '{name}', standard 사용")
+            name = "standard"
+        self.name = name
+        self.profile_root = profile_root
+        self.cache_seed_dir = Path(cache_seed_dir) if cache_seed_dir else None
+        self.cache_size_mb = cache_size_mb
+
+        self.user_data_dir: Optional[Path] = None
+        self.cache_dir: Optional[Path] = None
+        self.stats = {
+            "seeded": False,
+            "seed_bytes": 0,
+            "prepare_ms": None,
+            "seed_saved": False
+        }
+
+    def prepare(self) -> List[str]:
+        """
+        디렉토리 준비 후 Chrome 실행 인자 목록 반환 (파일 복사가 있으므로 드라이버 스레드에서 실행)
+
+        Returns:
+            List[str]: Chrome 명령줄 인자
+        """
+        start = time.perf_counter()
+        args = list(PROFILES[self.name])
+        self.stats.update({"seeded": False, "seed_bytes": 0, "seed_saved": False})
+
+        if self.profile_root or self.cache_seed_dir:
+            root = self.profile_root or None
+            if root:
+                os.makedirs(root, exist_ok=True)
+            self.user_data_dir = Path(tempfile.mkdtemp(prefix="cradcrawl-chrome-", dir=root))
+            args.append(f"--user-data-dir={self.user_data_dir}")
+
+        if self.cache_seed_dir:
+            self.cache_dir = self.user_data_dir / "http-cache"
+            if self.cache_seed_dir.is_dir():
+                # 시드를 워커 전용 디렉토리로 복사 (시드 자체는 읽기 전용)
+                shutil.copytree(self.cache_seed_dir, self.cache_dir)
+                self.stats["seeded"] = True
+                self.stats["seed_bytes"] = dir_size(self.cache_dir)
+            args.append(f"--disk-cache-dir={self.cache_dir}")
+            args.append(f"--disk-cache-size={self.cache_size_mb * 1024 * 1024}")
+
+        self.stats["prepare_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        logger.info(f"Chrome 실행 프로필 '{self.name}' 준비 ({self.stats['prepare_ms']}ms, "
+                    f"사용자 데이터: {self.user_data_dir or '기본'}, 캐시 시드: {'적용' if self.stats['seeded'] else '없음'})")
+        return args
+
+    def apply(self, chrome_options):
+        """Chrome 옵션에 프로필 인자 추가 (드라이버 스레드에서 실행)"""
+        for arg in self.prepare():
+            chrome_options.add_argument(arg)
+
+    def cleanup(self, save_seed: bool = True):
+        """
+        Chrome 종료 후 호출: 시드가 없으면 캐시를 시드로 저장하고 임시 디렉토리 삭제
+
+        Args:
+            save_seed: 캐시를 시드로 저장할지 여부 (비정상 종료 시 False)
+        """
+        try:
+            if save_seed and self.cache_dir and self.cache_seed_dir and not self.cache_seed_dir.exists() and self.cache_dir.is_dir():
+                self._save_seed()
+        finally:
+            if self.user_data_dir:
+                shutil.rmtree(self.user_data_dir, ignore_errors=True)
+                self.user_data_dir = None
+                self.cache_dir = None
+
+    def _save_seed(self):
+        """캐시 디렉토리를 시드로 원자적 저장 (다른 워커가 먼저 저장했으면 건너뜀)"""
+        tmp_dir = self.cache_seed_dir.parent / f".{self.cache_seed_dir.name}.{uuid.uuid4().hex[:8]}"
+        try:
+            self.cache_seed_dir.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copytree(self.cache_dir, tmp_dir)
+            os.rename(tmp_dir, self.cache_seed_dir)
+            self.stats["seed_saved"] = True
+            logger.info(f"HTTP 캐시 시드 저장: {self.cache_seed_dir} ({dir_size(self.cache_seed_dir) / 1024 / 1024:.1f}MB)")
+        except OSError as e:
+            # 다른 워커가 먼저 저장한 경우 (rename 대상 존재)
+            logger.debug(f"HTTP 캐시 시드 저장 건너뜀: {str(e)}")
+        except Exception as e:
+            logger.warning(f"HTTP 캐시 시드 저장 실패: {str(e)}")
+            logger.debug(traceback.format_exc())
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """프로필 설정 및 시드 사용 현황 반환"""
+        return {
+            "name": self.name,
+            "user_data_dir": str(self.user_data_dir) if self.user_data_dir else None,
+            "cache_seed_dir": str(self.cache_seed_dir) if self.cache_seed_dir else None,
+            **self.stats
+        }
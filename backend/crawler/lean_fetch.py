@@ -0,0 +1,175 @@
+"""
+리소스 차단(lean fetch) 모듈
+
+Chrome DevTools Protocol(Network.setBlockedURLs)을 사용하여
+페이지 유형별로 크롤링에 불필요한 리소스(이미지, 폰트, 추적 스크립트 등)를 차단합니다.
+"""
+
+import logging
+import traceback
+from typing import Dict, Any, List, Optional
+
+# 로거 설정
+logger = logging.getLogger("backend.crawler.lean_fetch")
+
+# 리소스 유형별 URL 패턴
+RESOURCE_TYPE_PATTERNS = {
+    "image": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp"],
+    "font": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "media": ["*.mp4", "*.webm", "*.mp3", "*.wav", "*.avi"],
+    "stylesheet": ["*.css"]
+}
+
+# 추적/분석 스크립트 URL 패턴
+TRACKER_PATTERNS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*facebook.net*",
+    "*wcs.naver.net*",
+    "*beacon*"
+]
+
+# 페이지 유형별 기본 차단 프로필
+# - main/bid_list: 메뉴 클릭과 그리드 표시 여부 판단에 CSS가 필요하므로 스타일시트는 유지
+# - detail: HTML 소스만 파싱하므로 스타일시트까지 차단
+DEFAULT_PROFILES = {
+    "main": {"block_types": ["image", "font", "media"], "block_urls": TRACKER_PATTERNS},
+    "bid_list": {"block_types": ["image", "font", "media"], "block_urls": TRACKER_PATTERNS},
+    "detail": {"block_types": ["image", "font", "media", "stylesheet"], "block_urls": TRACKER_PATTERNS}
+}
+
+def validate_profiles(profiles: Any):
+    """
+    사용자 프로필 형식 확인 (None 허용)
+
+    페이지 유형 → {"block_types": [...], "block_urls": [...]} 형식의 딕셔너리여야 합니다.
+
+    Raises:
+        ValueError: 형식이 맞지 않는 경우
+    """
+    if profiles is None:
+        return
+    if not isinstance(profiles, dict):
+        raise ValueError("leanFetchProfiles 값은 페이지 유형별 프로필 객체여야 합니다.")
+    for page_type, profile in profiles.items():
+        if not isinstance(profile, dict):
+            raise ValueError(f"leanFetchProfiles.{page_type} 값은 객체여야 합니다.")
+        for key in ("block_types", "block_urls"):
+            values = profile.get(key, [])
+            if not isinstance(values, list) or not all(isinstance(value, str) for value in values):
+                raise ValueError(f"leanFetchProfiles.{page_type}.{key} 값은 문자열 목록이어야 합니다.")
+
+class LeanFetch:
+    """페이지 유형별 CDP 리소스 차단 관리 클래스"""
+
+    def __init__(self, driver, actor, profiles: Optional[Dict[str, Dict[str, List[str]]]] = None):
+        """
+        초기화
+
+        Args:
+            driver: Selenium WebDriver 인스턴스 (Chrome)
+            actor: 드라이버 명령을 실행할 DriverActor
+            profiles: 페이지 유형별 차단 프로필 (None이면 기본 프로필)
+        """
+        self.driver = driver
+        self.actor = actor
+        self.enabled = False
+        self.profiles = {}
+        self.current_page_type = None
+        self._network_enabled = False
+        self.set_profiles(profiles)
+
+    def set_profiles(self, profiles: Optional[Dict[str, Dict[str, List[str]]]] = None):
+        """기본 프로필에 사용자 프로필을 덮어써 설정"""
+        merged = {page_type: dict(profile) for page_type, profile in DEFAULT_PROFILES.items()}
+        for page_type, profile in (profiles or {}).items():
+            merged.setdefault(page_type, {}).update(profile)
+        self.profiles = merged
+        self.current_page_type = None
+
+    def get_blocked_urls(self, page_type: str) -> List[str]:
+        """페이지 유형의 차단 URL 패턴 목록 반환"""
+        profile = self.profiles.get(page_type)
+        if not profile:
+            return []
+
+        urls = []
+        for resource_type in profile.get("block_types", []):
+            urls.extend(RESOURCE_TYPE_PATTERNS.get(resource_type, []))
+        urls.extend(profile.get("block_urls", []))
+        return urls
+
+    async def enable(self, profiles: Optional[Dict[str, Dict[str, List[str]]]] = None):
+        """리소스 차단 활성화"""
+        if profiles is not None:
+            self.set_profiles(profiles)
+        self.enabled = True
+        logger.info("리소스 차단(lean fetch) 활성화")
+
+    async def disable(self):
+        """리소스 차단 비활성화 및 차단 목록 초기화"""
+        was_applied = self.current_page_type is not None
+        self.enabled = False
+        self.current_page_type = None
+        if was_applied:
+            await self._set_blocked_urls([])
+            logger.info("리소스 차단(lean fetch) 비활성화")
+
+    async def apply(self, page_type: str):
+        """
+        페이지 이동 전에 해당 유형의 차단 프로필 적용
+
+        Args:
+            page_type: 페이지 유형 (main, bid_list, detail)
+        """
+        if not self.enabled or page_type == self.current_page_type:
+            return
+
+        urls = self.get_blocked_urls(page_type)
+        if await self._set_blocked_urls(urls):
+            self.current_page_type = page_type
+            logger.debug(f"리소스 차단 프로필 적용: {page_type} ({len(urls)}개 패턴)")
+
+    async def _set_blocked_urls(self, urls: List[str]) -> bool:
+        """CDP로 차단 URL 목록 설정"""
+        try:
+            if not self._network_enabled:
+                await self.actor.run(self.driver.execute_cdp_cmd, "Network.enable", {})
+                self._network_enabled = True
+            await self.actor.run(self.driver.execute_cdp_cmd, "Network.setBlockedURLs", {"urls": urls})
+            return True
+        except Exception as e:
+            logger.warning(f"리소스 차단 설정 실패 (무시): {str(e)}")
+            logger.debug(traceback.format_exc())
+            return False
+
+    def get_status(self) -> Dict[str, Any]:
+        """현재 차단 상태 반환"""
+        return {
+            "enabled": self.enabled,
+            "current_page_type": self.current_page_type,
+            "profiles": self.profiles
+        }
+
+# 페이지 로딩 시간 및 전송량 수집 스크립트 (Navigation/Resource Timing API)
+PAGE_METRICS_SCRIPT = """
+var nav = performance.getEntriesByType('navigation')[0];
+var resources = performance.getEntriesByType('resource');
+var bytes = nav ? (nav.transferSize || 0) : 0;
+resources.forEach(function(r) { bytes += r.transferSize || 0; });
+return {
+    ready_ms: nav ? Math.round(nav.domContentLoadedEventEnd - nav.startTime) : null,
+    load_ms: nav ? Math.round(nav.loadEventEnd - nav.startTime) : null,
+    resources: resources.length,
+    bytes: bytes
+};
+"""
+
+async def collect_page_metrics(driver, actor) -> Dict[str, Any]:
+    """현재 페이지의 로딩 시간과 전송 바이트 수 수집"""
+    try:
+        return await actor.run(driver.execute_script, PAGE_METRICS_SCRIPT) or {}
+    except Exception as e:
+        logger.warning(f"페이지 지표 수집 실패: {str(e)}")
+        return {}
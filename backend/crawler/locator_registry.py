@@ -0,0 +1,177 @@
+"""
+요소 탐색 전략(locator) 기억 모듈
+
+검색 입력 필드/검색 버튼처럼 여러 선택자를 순서대로 시도하는 요소에 대해
+마지막으로 성공한 선택자를 디스크에 저장하고, 다음 실행부터 짧은 제한 시간으로 먼저 시도합니다.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from backend.crawler.paths import CACHE_DIR
+
+# 로거 설정
+logger = logging.getLogger("backend.crawler.locator")
+
+# 캐시 저장 경로
+DEFAULT_REGISTRY_PATH = Path(os.environ.get("LOCATOR_REGISTRY_PATH", CACHE_DIR / "locators.json"))
+
+Locator = Tuple[str, str]
+
+def locator_key(locator: Locator) -> str:
+    """선택자를 저장용 문자열 키로 변환"""
+    return f"{locator[0]}={locator[1]}"
+
+class LocatorRegistry:
+    """마지막 성공 선택자 기억 및 적중률 통계 관리 클래스"""
+
+    def __init__(self, path: Path = DEFAULT_REGISTRY_PATH, fast_timeout: float = 1.0, fallback_timeout: float = 10.0):
+        """
+        초기화
+
+        Args:
+            path: 저장 파일 경로 (JSON)
+            fast_timeout: 기억된 선택자 시도 제한 시간 (초)
+            fallback_timeout: 전체 후보 선택자 탐색 제한 시간 (초)
+        """
+        self.path = Path(path)
+        self.fast_timeout = fast_timeout
+        self.fallback_timeout = fallback_timeout
+        self._lock = threading.Lock()  # 여러 드라이버 스레드에서 동시 접근
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.load()
+
+    def load(self):
+        """저장 파일에서 기억된 선택자와 통계 불러오기"""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+            logger.info(f"선택자 기록 로드: {len(self.entries)}개 ({self.path})")
+        except Exception as e:
+            logger.warning(f"선택자 기록 로드 실패 (초기화): {str(e)}")
+            self.entries = {}
+
+    def save(self):
+        """기억된 선택자와 통계를 저장 파일에 기록"""
+        # 여러 스레드가 같은 임시 파일에 동시에 쓰지 않도록 기록과 교체까지 잠금 유지
+        with self._lock:
+            try:
+                data = json.dumps(self.entries, ensure_ascii=False, indent=2)
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix(".tmp")
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                os.replace(tmp_path, self.path)
+            except Exception as e:
+                logger.warning(f"선택자 기록 저장 실패: {str(e)}")
+                logger.debug(traceback.format_exc())
+
+    def _entry(self, name: str) -> Dict[str, Any]:
+        """요소 이름별 기록 반환 (없으면 생성)"""
+        return self.entries.setdefault(name, {
+            "last_success": None,
+            "hits": 0,
+            "misses": 0,
+            "failures": 0,
+            "successes": {},
+            "changed_at": None
+        })
+
+    def find(self, driver, name: str, candidates: List[Locator], condition: Callable = EC.presence_of_element_located):
+        """
+        후보 선택자로 요소 탐색 (드라이버 스레드에서 실행)
+
+        기억된 선택자를 짧은 제한 시간으로 먼저 시도하고, 실패하면
+        모든 후보를 한 번의 대기 안에서 순서대로 확인합니다.
+
+        Args:
+            driver: Selenium WebDriver 인스턴스
+            name: 요소 이름 (기록 키)
+            candidates: (By, 값) 후보 선택자 목록 (우선순위 순)
+            condition: 요소 조건 (expected_conditions 팩토리)
+
+        Returns:
+            WebElement: 찾은 요소 (실패 시 None)
+        """
+        with self._lock:
+            remembered = self._entry(name)["last_success"]
+
+        # 1. 마지막 성공 선택자 우선 시도
+        remembered_locator = next((loc for loc in candidates if locator_key(loc) == remembered), None)
+        if remembered_locator:
+            try:
+                element = WebDriverWait(driver, self.fast_timeout).until(condition(remembered_locator))
+                self._record(name, remembered_locator, hit=True)
+                return element
+            except Exception:
+                logger.warning(f"기억된 선택자 실패 ({name}): {remembered}")
+
+        # 2. 전체 후보를 매 폴링마다 우선순위 순으로 확인
+        def first_match(d):
+            for loc in candidates:
+                try:
+                    element = condition(loc)(d)
+                    if element:
+                        return loc, element
+                except Exception:
+                    continue
+            return False
+
+        try:
+            locator, element = WebDriverWait(driver, self.fallback_timeout).until(first_match)
+        except Exception:
+            self._record(name, None, hit=False)
+            logger.error(f"모든 후보 선택자 실패 ({name})")
+            return None
+
+        self._record(name, locator, hit=False)
+        logger.info(f"선택자 발견 ({name}): {locator_key(locator)}")
+        return element
+
+    def _record(self, name: str, locator: Optional[Locator], hit: bool):
+        """탐색 결과 통계 기록 (성공 선택자가 바뀌면 저장)"""
+        changed = False
+        with self._lock:
+            entry = self._entry(name)
+            if locator is None:
+                entry["failures"] += 1
+            else:
+                key = locator_key(locator)
+                entry["hits" if hit else "misses"] += 1
+                entry["successes"][key] = entry["successes"].get(key, 0) + 1
+                if entry["last_success"] != key:
+                    if entry["last_success"]:
+                        logger.warning(f"선택자 변경 감지 ({name}): {entry['last_success']} -> {key}")
+                    entry["last_success"] = key
+                    entry["changed_at"] = time.time()
+                    changed = True
+
+        if changed:
+            self.save()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """요소별 적중/실패 통계 반환"""
+        with self._lock:
+            stats = {}
+            for name, entry in self.entries.items():
+                lookups = entry["hits"] + entry["misses"] + entry["failures"]
+                stats[name] = {
+                    **entry,
+                    "successes": dict(entry["successes"]),
+                    "hit_rate": round(entry["hits"] / lookups, 3) if lookups else None
+                }
+            return stats
+
+# 프로세스 전역 선택자 기록 (모든 크롤러가 공유)
+locator_registry = LocatorRegistry()
@@ -0,0 +1,186 @@
+"""
+브라우저 메모리 관리 모듈
+
+chromedriver 프로세스 트리(Chrome 브라우저/렌더러 포함)의 RSS를 주기적으로 측정하고,
+임계값을 넘거나 일정 페이지 수를 처리하면 드라이버 재시작이 필요하다고 알려줍니다.
+psutil이 있으면 사용하고, 없으면 Linux /proc 파일 시스템에서 직접 읽습니다.
+측정은 /proc 전체를 훑는 블로킹 작업이므로 이벤트 루프에서는 asyncio.to_thread로 호출합니다.
+"""
+
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+# 선택적 라이브러리 (설치된 경우에만 사용)
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# 로거 설정
+logger = logging.getLogger("backend.crawler.memory")
+
+# 환경 변수 설정
+MEMORY_GOVERNOR = os.environ.get("MEMORY_GOVERNOR", "true").lower() != "false"
+MEMORY_RSS_LIMIT_MB = float(os.environ.get("MEMORY_RSS_LIMIT_MB", "1500"))  # 프로세스 트리 RSS 한도 (0이면 미사용)
+MEMORY_MAX_PAGES = int(os.environ.get("MEMORY_MAX_PAGES", "300"))  # 재시작 전 최대 페이지 수 (0이면 미사용)
+MEMORY_SAMPLE_EVERY = int(os.environ.get("MEMORY_SAMPLE_EVERY", "5"))  # 측정 간격 (페이지 수)
+
+PROC_DIR = "/proc"
+
+class RecycleRequested(Exception):
+    """메모리/페이지 수 한도로 드라이버 재시작이 필요한 경우"""
+
+def _proc_children() -> Dict[int, List[int]]:
+    """/proc에서 부모 pid별 자식 pid 목록 구성"""
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir(PROC_DIR):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(os.path.join(PROC_DIR, entry, "stat"), "r") as f:
+                # 형식: pid (comm) state ppid ... (comm에 공백/괄호가 있을 수 있음)
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    return children
+
+def _proc_rss(pid: int) -> int:
+    """/proc/<pid>/statm에서 RSS(바이트) 읽기"""
+    try:
+        with open(os.path.join(PROC_DIR, str(pid), "statm"), "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, IndexError, ValueError):
+        return 0
+
+def process_tree_pids(pid: int) -> List[int]:
+    """루트 pid와 모든 하위 프로세스 pid 목록"""
+    if PSUTIL_AVAILABLE:
+        try:
+            root = psutil.Process(pid)
+            return [pid] + [child.pid for child in root.children(recursive=True)]
+        except psutil.Error:
+            return []
+
+    if not os.path.isdir(PROC_DIR):
+        return []
+    children = _proc_children()
+    pids, stack = [], [pid]
+    while stack:
+        current = stack.pop()
+        pids.append(current)
+        stack.extend(children.get(current, []))
+    return pids
+
+def process_tree_rss(pid: int) -> Tuple[int, int]:
+    """
+    프로세스 트리 전체 RSS 측정
+
+    Args:
+        pid: 루트 프로세스 (chromedriver) pid
+
+    Returns:
+        (RSS 바이트 합계, 프로세스 수) 튜플
+    """
+    pids = process_tree_pids(pid)
+    total = 0
+    for child_pid in pids:
+        if PSUTIL_AVAILABLE:
+            try:
+                total += psutil.Process(child_pid).memory_info().rss
+            except psutil.Error:
+                continue
+        else:
+            total += _proc_rss(child_pid)
+    return total, len(pids)
+
+def kill_process_tree(pid: int):
+    """루트 프로세스와 하위 프로세스 강제 종료 (남은 Chrome 프로세스 정리)"""
+    for child_pid in reversed(process_tree_pids(pid)):
+        try:
+            os.kill(child_pid, 9)
+        except OSError:
+            continue
+
+class MemoryGovernor:
+    """드라이버별 메모리 측정 및 재시작 판단 클래스"""
+
+    def __init__(self, pid: Optional[int], rss_limit_mb: float = MEMORY_RSS_LIMIT_MB, max_pages: int = MEMORY_MAX_PAGES,
+                 sample_every: int = MEMORY_SAMPLE_EVERY, max_samples: int = 200):
+        """
+        초기화
+
+        Args:
+            pid: chromedriver 프로세스 pid (None이면 페이지 수 한도만 사용)
+            rss_limit_mb: 프로세스 트리 RSS 한도 (MB, 0이면 미사용)
+            max_pages: 재시작 전 최대 페이지 수 (0이면 미사용)
+            sample_every: 측정 간격 (페이지 수)
+            max_samples: 보관할 최대 측정값 수
+        """
+        self.pid = pid
+        self.rss_limit_mb = rss_limit_mb
+        self.max_pages = max_pages
+        self.sample_every = max(1, sample_every)
+        self.pages = 0
+        self._pages_at_sample = None
+        self.samples = deque(maxlen=max_samples)
+        self.started_at = time.time()
+
+    def record_pages(self, count: int = 1):
+        """처리한 페이지(검색/상세 이동) 수 기록"""
+        self.pages += count
+
+    def maybe_sample(self, force: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        측정 간격이 지났으면 RSS 측정
+
+        Returns:
+            Dict: 새 측정값 (측정하지 않았으면 None)
+        """
+        if self.pid is None:
+            return None
+        if not force and self._pages_at_sample is not None and self.pages - self._pages_at_sample < self.sample_every:
+            return None
+
+        start = time.perf_counter()
+        rss, processes = process_tree_rss(self.pid)
+        self._pages_at_sample = self.pages
+        sample = {
+            "at": round(time.time(), 1),
+            "pages": self.pages,
+            "rss_mb": round(rss / (1024 * 1024), 1),
+            "processes": processes,
+            "sample_ms": round((time.perf_counter() - start) * 1000, 1)
+        }
+        self.samples.append(sample)
+        logger.debug(f"브라우저 메모리 측정: {sample['rss_mb']}MB, 프로세스 {processes}개, 페이지 {self.pages}")
+        return sample
+
+    def recycle_reason(self) -> Optional[str]:
+        """재시작이 필요하면 사유 반환 (마지막 측정값 및 페이지 수 기준)"""
+        if self.pages == 0:
+            return None  # 아직 페이지를 처리하지 않은 새 브라우저는 재시작하지 않음 (무한 재시작 방지)
+        if self.max_pages and self.pages >= self.max_pages:
+            return f"페이지 수 {self.pages}/{self.max_pages}"
+        last = self.samples[-1] if self.samples else None
+        if self.rss_limit_mb and last and last["rss_mb"] >= self.rss_limit_mb:
+            return f"RSS {last['rss_mb']}MB/{self.rss_limit_mb:.0f}MB"
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """측정값 및 한도 반환"""
+        rss_values = [sample["rss_mb"] for sample in self.samples]
+        return {
+            "pid": self.pid,
+            "backend": "psutil" if PSUTIL_AVAILABLE else "procfs",
+            "pages": self.pages,
+            "max_pages": self.max_pages,
+            "rss_limit_mb": self.rss_limit_mb,
+            "last_rss_mb": rss_values[-1] if rss_values else None,
+            "peak_rss_mb": max(rss_values) if rss_values else None,
+            "samples": list(self.samples)
+        }
@@ -0,0 +1,231 @@
+"""
+페이지 상태 머신 모듈
+
+손으로 설정하는 페이지 이름 대신 실제 브라우저 상태(URL, 검색 폼 표시 여부,
+보기 개수 선택값, 검색 기간 입력값, 그리드/상세 테이블 존재)를 스크립트 한 번으로 확인하고,
+검색에 필요한 전이(목록 이동, 검색조건 탭 선택, 보기 개수/기간 설정) 중 빠진 것만 적용합니다.
+"""
+
+import logging
+import time
+from collections import Counter
+from typing import Any, Dict, Optional
+
+from backend.crawler.wait_engine import GRID_ROW_SELECTOR, DETAIL_TABLE_SELECTOR
+from backend.crawler.date_range import DateRange, normalize_date
+
+# 로거 설정
+logger = logging.getLogger("backend.crawler.page_state")
+
+# 입찰공고 목록 페이지 표시 요소 (검색 버튼, 운영/테스트 페이지)
+BID_LIST_MARKER_IDS = ["mf_wfm_container_tacBidPbancLst_contents_tab2_body_btnS0004", "buttonSearch"]
+
+# 검색어 입력 필드 (스크립트 확인용, 우선순위 순)
+SEARCH_INPUT_SELECTORS = [
+    "#mf_wfm_container_tacBidPbancLst_contents_tab2_body_bidPbancNm",
+    "#mf_wfm_container_tacBidPbancLst_contents_tab2_body_txtBidNm",
+    "input[title='공고명']",
+    "[id*='bidPbancNm']",
+    "[id*='txtBidNm']"
+]
+
+# 보기 개수 선택 박스와 목표 값
+PAGE_SIZE_SELECT_ID = "mf_wfm_container_tacBidPbancLst_contents_tab2_body_sbxRecordCountPerPage1"
+SEARCH_PAGE_SIZE = "100"
+
+# 검색 기간 입력(달력) 및 조회기준 선택 박스 후보 선택자 (우선순위 순)
+DATE_FROM_SELECTORS = [
+    "#mf_wfm_container_tacBidPbancLst_contents_tab2_body_ibxStrDay_input",
+    "#mf_wfm_container_tacBidPbancLst_contents_tab2_body_ibxStrDay",
+    "[id^='mf_wfm_container_tacBidPbancLst_contents_tab2_body_'][id*='StrDay'] input",
+    "input[id^='mf_wfm_container_tacBidPbancLst_contents_tab2_body_'][id*='StrDay']",
+    "input[id^='mf_wfm_container_tacBidPbancLst_contents_tab2_body_'][id*='FromDt']",
+    "input[title*='시작일']"
+]
+DATE_TO_SELECTORS = [
+    "#mf_wfm_container_tacBidPbancLst_contents_tab2_body_ibxEndDay_input",
+    "#mf_wfm_container_tacBidPbancLst_contents_tab2_body_ibxEndDay",
+    "[id^='mf_wfm_container_tacBidPbancLst_contents_tab2_body_'][id*='EndDay'] input",
+    "input[id^='mf_wfm_container_tacBidPbancLst_contents_tab2_body_'][id*='EndDay']",
+    "input[id^='mf_wfm_container_tacBidPbancLst_contents_tab2_body_'][id*='ToDt']",
+    "input[title*='종료일']"
+]
+DATE_TYPE_SELECTORS = [
+    "#mf_wfm_container_tacBidPbancLst_contents_tab2_body_sbxDateType",
+    "select[id^='mf_wfm_container_tacBidPbancLst_contents_tab2_body_'][id*='Date']",
+    "select[id^='mf_wfm_container_tacBidPbancLst_contents_tab2_body_'][id*='Dt']"
+]
+
+# 선택자 목록에서 첫 번째로 찾은 요소 반환 (다른 스크립트 앞에 붙여 사용)
+FIND_FIRST_JS = """
+function findFirst(selectors) {
+    for (var i = 0; i < selectors.length; i++) {
+        var el = document.querySelector(selectors[i]);
+        if (el) return el;
+    }
+    return null;
+}
+function selectedText(select) {
+    if (!select || !select.options || select.selectedIndex < 0) return null;
+    return (select.options[select.selectedIndex].text || '').trim();
+}
+"""
+
+# 현재 페이지 상태를 한 번에 수집하는 스크립트
+PAGE_PROBE_SCRIPT = FIND_FIRST_JS + """
+var markers = arguments[0], inputSelectors = arguments[1], sizeId = arguments[2];
+var gridSelector = arguments[3], detailSelector = arguments[4], dateSelectors = arguments[5];
+function visible(el) {
+    return !!(el && (el.offsetWidth || el.offsetHeight || el.getClientRects().length));
+}
+var input = findFirst(inputSelectors);
+var size = document.getElementById(sizeId);
+var sizeText = selectedText(size);
+var dateFrom = findFirst(dateSelectors[0]), dateTo = findFirst(dateSelectors[1]);
+return {
+    date_from: dateFrom ? dateFrom.value : null,
+    date_to: dateTo ? dateTo.value : null,
+    date_type: selectedText(findFirst(dateSelectors[2])),
+    url: location.href,
+    ready: document.readyState,
+    bid_list: markers.some(function(id) { return !!document.getElementById(id); }),
+    search_input: visible(input),
+    keyword: input ? input.value : null,
+    page_size: sizeText,
+    has_page_size: !!size,
+    grid_rows: document.querySelectorAll(gridSelector).length,
+    detail: !!document.querySelector(detailSelector)
+};
+"""
+
+class PageState:
+    """한 번의 확인으로 얻은 페이지 상태"""
+
+    def __init__(self, snapshot: Optional[Dict[str, Any]] = None):
+        """
+        초기화
+
+        Args:
+            snapshot: PAGE_PROBE_SCRIPT 반환값 (None이면 알 수 없는 상태)
+        """
+        snapshot = snapshot or {}
+        self.url = snapshot.get("url") or ""
+        self.bid_list = bool(snapshot.get("bid_list"))
+        self.search_input = bool(snapshot.get("search_input"))
+        self.keyword = snapshot.get("keyword")
+        self.page_size = snapshot.get("page_size")
+        self.has_page_size = bool(snapshot.get("has_page_size"))
+        self.grid_rows = snapshot.get("grid_rows") or 0
+        self.detail = bool(snapshot.get("detail"))
+        self.date_from = normalize_date(snapshot.get("date_from"))
+        self.date_to = normalize_date(snapshot.get("date_to"))
+        self.date_type = snapshot.get("date_type")
+
+    @property
+    def name(self) -> Optional[str]:
+        """페이지 이름 (CrawlerBase.current_page와 같은 이름 사용)"""
+        if self.bid_list:
+            return "search_results" if self.grid_rows else "bid_list"
+        if self.detail:
+            return "detail_page"
+        if "g2b.go.kr" in self.url:
+            return "main"
+        return None
+
+    @property
+    def page_size_ok(self) -> bool:
+        """보기 개수가 목표 값인지 여부 (선택 박스가 없으면 설정할 수 없으므로 충족으로 간주)"""
+        return not self.has_page_size or self.page_size == SEARCH_PAGE_SIZE
+
+    def dates_match(self, date_range: Optional[DateRange]) -> bool:
+        """검색 폼 기간 입력값이 요청한 기간과 같은지 여부 (기간 조건이 없으면 충족)"""
+        if not date_range or not date_range.active:
+            return True
+        if date_range.start and self.date_from != date_range.start:
+            return False
+        if date_range.end and self.date_to != date_range.end:
+            return False
+        return self.date_type is None or date_range.label in self.date_type
+
+    @property
+    def search_ready(self) -> bool:
+        """검색어 입력과 검색 버튼 클릭만으로 검색할 수 있는 상태인지 여부"""
+        return self.bid_list and self.search_input and self.page_size_ok
+
+    def as_dict(self) -> Dict[str, Any]:
+        """상태 조회용 딕셔너리"""
+        return {
+            "name": self.name,
+            "url": self.url,
+            "search_input": self.search_input,
+            "page_size": self.page_size,
+            "date_from": self.date_from,
+            "date_to": self.date_to,
+            "grid_rows": self.grid_rows
+        }
+
+class PageStateMachine:
+    """실제 페이지 상태 확인 및 필요한 전이만 적용하는 클래스"""
+
+    def __init__(self, driver, actor=None):
+        """
+        초기화
+
+        Args:
+            driver: Selenium WebDriver 인스턴스
+            actor: 드라이버 명령을 실행할 DriverActor (None이면 직접 호출)
+        """
+        self.driver = driver
+        self.actor = actor
+        self.last: Optional[PageState] = None
+        self.transitions = Counter()  # 적용한 전이
+        self.skipped = Counter()  # 상태 확인으로 건너뛴 전이
+        self.stats = {
+            "probes": 0,
+            "probe_failures": 0,
+            "probe_ms_total": 0.0
+        }
+
+    async def probe(self) -> PageState:
+        """
+        현재 페이지 상태 확인 (스크립트 1회 실행)
+
+        Returns:
+            PageState: 확인한 상태 (실패 시 알 수 없는 상태)
+        """
+        start = time.perf_counter()
+        self.stats["probes"] += 1
+        try:
+            args = (PAGE_PROBE_SCRIPT, BID_LIST_MARKER_IDS, SEARCH_INPUT_SELECTORS, PAGE_SIZE_SELECT_ID,
+                    GRID_ROW_SELECTOR, DETAIL_TABLE_SELECTOR, [DATE_FROM_SELECTORS, DATE_TO_SELECTORS, DATE_TYPE_SELECTORS])
+            if self.actor:
+                snapshot = await self.actor.run(self.driver.execute_script, *args)
+            else:
+                snapshot = self.driver.execute_script(*args)
+            state = PageState(snapshot)
+        except Exception as e:
+            self.stats["probe_failures"] += 1
+            logger.debug(f"페이지 상태 확인 실패: {str(e)}")
+            state = PageState()
+        self.stats["probe_ms_total"] += (time.perf_counter() - start) * 1000
+        self.last = state
+        return state
+
+    def record(self, transition: str, applied: bool):
+        """전이 적용/생략 기록"""
+        if applied:
+            self.transitions[transition] += 1
+        else:
+            self.skipped[transition] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """확인 횟수와 전이 적용/생략 통계 반환"""
+        probes = self.stats["probes"]
+        return {
+            "probes": probes,
+            "probe_failures": self.stats["probe_failures"],
+            "mean_probe_ms": round(self.stats["probe_ms_total"] / probes, 2) if probes else None,
+            "applied": dict(self.transitions),
+            "skipped": dict(self.skipped),
+            "last": self.last.as_dict() if self.last else None
+        }
@@ -0,0 +1,144 @@
+"""
+HTML 파싱 프로세스 풀 모듈
+
+상세 페이지 HTML 파싱(BeautifulSoup + 전체 트리 탐색)은 페이지당 수백 ms의 CPU를 쓰므로
+이벤트 루프 스레드에서 실행하면 다른 코루틴(탭 처리, WebSocket 전송 등)이 모두 멈춥니다.
+파싱 함수를 별도 프로세스 풀에서 실행하고 결과는 순수 딕셔너리로 돌려받습니다.
+풀 크기는 사용 가능한 코어 수를 기본값으로 하며, PARSE_WORKERS=0이면 스레드에서 실행합니다.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+# 로거 설정
+logger = logging.getLogger("backend.crawler.parse_pool")
+
+def available_cores() -> int:
+    """현재 프로세스가 사용할 수 있는 코어 수"""
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return max(1, os.cpu_count() or 1)
+
+# 환경 변수 설정
+PARSE_WORKERS = int(os.environ.get("PARSE_WORKERS", str(available_cores())))
+PARSE_START_METHOD = os.environ.get("PARSE_START_METHOD") or None  # 예: fork, forkserver, spawn (None이면 플랫폼 기본값)
+
+class ParsePool:
+    """CPU 작업(HTML 파싱)용 프로세스 풀"""
+
+    def __init__(self, workers: int = PARSE_WORKERS, start_method: Optional[str] = PARSE_START_METHOD):
+        """
+        초기화
+
+        Args:
+            workers: 작업 프로세스 수 (0이면 프로세스 풀 대신 스레드에서 실행)
+            start_method: 작업 프로세스 시작 방식 (None이면 플랫폼 기본값)
+        """
+        self.workers = max(0, workers)
+        self.start_method = start_method
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.in_flight = 0
+        self.stats = {
+            "tasks": 0,
+            "errors": 0,
+            "restarts": 0,
+            "thread_fallbacks": 0,
+            "busy_ms_total": 0.0,
+            "max_in_flight": 0
+        }
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        """프로세스 풀 반환 (처음 사용할 때 생성, 스레드 모드면 None)"""
+        if self.workers == 0:
+            return None
+        with self._lock:
+            if self._executor is None:
+                context = multiprocessing.get_context(self.start_method) if self.start_method else None
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+                logger.info(f"파싱 프로세스 풀 시작: {self.workers}개 프로세스")
+            return self._executor
+
+    def start(self):
+        """
+        작업 프로세스 미리 시작
+
+        fork 방식에서는 프로세스 풀이 첫 작업 때 작업 프로세스를 한꺼번에 만들므로,
+        드라이버 스레드 등이 생기기 전(서버 시작 시)에 호출하면 스레드가 적은 상태에서 복제됩니다.
+        """
+        executor = self._get_executor()
+        if executor is not None:
+            executor.submit(os.getpid).result()
+
+    def _discard(self, executor: ProcessPoolExecutor):
+        """중단된 프로세스 풀 폐기 (다음 작업 때 새로 생성)"""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+                self.stats["restarts"] += 1
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    async def run(self, func: Callable, *args) -> Any:
+        """
+        함수를 작업 프로세스에서 실행
+
+        작업 프로세스가 비정상 종료되면 풀을 다시 만들고, 해당 작업은 스레드에서 실행합니다.
+
+        Args:
+            func: 모듈 수준 함수 (인자와 반환값은 pickle 가능해야 함)
+            *args: 함수 인자
+
+        Returns:
+            함수 반환값
+        """
+        loop = asyncio.get_running_loop()
+        self.in_flight += 1
+        self.stats["max_in_flight"] = max(self.stats["max_in_flight"], self.in_flight)
+        start = time.perf_counter()
+        try:
+            executor = self._get_executor()
+            if executor is None:
+                return await asyncio.to_thread(func, *args)
+            try:
+                return await loop.run_in_executor(executor, func, *args)
+            except BrokenProcessPool as e:
+                logger.error(f"파싱 프로세스 비정상 종료 (풀 재생성, 스레드에서 재시도): {str(e)}")
+                self._discard(executor)
+                self.stats["thread_fallbacks"] += 1
+                return await asyncio.to_thread(func, *args)
+        except Exception:
+            self.stats["errors"] += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            self.stats["tasks"] += 1
+            self.stats["busy_ms_total"] += (time.perf_counter() - start) * 1000
+
+    def close(self):
+        """프로세스 풀 종료 (다음 작업 때 다시 생성)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """풀 통계 반환"""
+        tasks = self.stats["tasks"]
+        return {
+            "workers": self.workers,
+            "mode": "process" if self.workers else "thread",
+            "running": self._executor is not None,
+            "in_flight": self.in_flight,
+            **{key: value for key, value in self.stats.items() if key != "busy_ms_total"},
+            "mean_task_ms": round(self.stats["busy_ms_total"] / tasks, 2) if tasks else None
+        }
+
+# 전역 파싱 풀 (PARSE_WORKERS=0이면 스레드에서 실행)
+parse_pool = ParsePool()
@@ -0,0 +1,11 @@
+"""
+크롤러 공용 경로 모듈
+
+캐시/기준점/스냅샷 등 실행 중 생성되는 파일의 기본 위치를 한곳에서 정의합니다.
+각 모듈의 경로 환경 변수(예: WATERMARK_PATH, DETAIL_CACHE_PATH)는 이 위치를 기본값으로 사용합니다.
+"""
+
+from pathlib import Path
+
+# 크롤러 캐시 기본 디렉토리
+CACHE_DIR = Path(__file__).parent / "cache"
@@ -0,0 +1,221 @@
+"""
+팝업 자동 닫기 모듈
+
+페이지 이동마다 알림창 확인, 닫기 버튼 탐색, ESC 입력을 반복하는 대신
+CDP Page.addScriptToEvaluateOnNewDocument로 문서 시작 시점에 스크립트를 주입하여
+MutationObserver가 나라장터 공지/모달 팝업이 생성되는 즉시 페이지 안에서 닫도록 합니다.
+닫은 팝업은 window.__cradClosedPopups에 기록되며, Python 쪽은 필요할 때 한 번 읽기만 합니다.
+"""
+
+import json
+import logging
+import time
+from collections import Counter, deque
+from typing import Any, Dict, List, Optional
+
+# 로거 설정
+logger = logging.getLogger("backend.crawler.popup")
+
+# 어디서든 닫아도 되는 팝업 닫기 버튼 (기존 팝업 처리 선택자)
+POPUP_CLOSE_SELECTORS = [
+    ".w2window .w2window_close",
+    ".w2window_close",
+    "[id*='poupR'][id$='_close']",
+    "[id*='poupR'][id*='close']",
+    ".popup_close",
+    "[aria-label='창닫기']"
+]
+
+# 일반적인 .close 클래스는 팝업/모달 컨테이너 안에서만 클릭 (본문 버튼 오작동 방지)
+POPUP_CONTAINER_SELECTORS = [".w2window", "[id*='poupR']", ".popup", ".modal", "[role='dialog']"]
+
+# 요소당 최대 클릭 시도 횟수 (WebSquare가 클릭 핸들러를 늦게 연결하는 경우 재시도)
+MAX_CLICK_ATTEMPTS = 3
+
+# 보관할 최대 닫기 기록 수 (페이지 내/Python 양쪽)
+MAX_REPORT_ENTRIES = 50
+
+# 문서 시작 시 실행되는 팝업 자동 닫기 스크립트 (중복 설치 방지)
+POPUP_GUARD_SCRIPT = """
+(function(closeSelectors, containerSelectors, maxAttempts, maxEntries) {
+    if (window.__cradPopupGuard) return;
+    window.__cradPopupGuard = true;
+    window.__cradClosedPopups = [];
+
+    var selector = closeSelectors.concat(containerSelectors.map(function(c) { return c + ' .close'; })).join(',');
+    var attempts = new WeakMap();
+    var scheduled = false;
+
+    function report(kind, detail) {
+        var log = window.__cradClosedPopups;
+        log.push({kind: kind, detail: String(detail || '').slice(0, 120), at: Date.now(), url: location.pathname});
+        if (log.length > maxEntries) log.splice(0, log.length - maxEntries);
+    }
+
+    // 네이티브 알림창은 드라이버 명령을 막으므로 페이지 안에서 바로 확인 처리
+    window.alert = function(message) { report('alert', message); };
+    window.confirm = function(message) { report('confirm', message); return true; };
+
+    function visible(el) {
+        return !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    }
+
+    function sweep() {
+        scheduled = false;
+        var buttons = document.querySelectorAll(selector);
+        for (var i = 0; i < buttons.length; i++) {
+            var button = buttons[i];
+            var count = attempts.get(button) || 0;
+            if (count >= maxAttempts || !visible(button)) continue;
+            attempts.set(button, count + 1);
+            try {
+                button.click();
+                if (count === 0) report('button', button.id || button.className || button.getAttribute('aria-label'));
+            } catch (e) {}
+        }
+        // 클릭 후에도 남아 있는 버튼은 다음 프레임에 재시도
+        for (var j = 0; j < buttons.length; j++) {
+            var n = attempts.get(buttons[j]) || 0;
+            if (n > 0 && n < maxAttempts && buttons[j].isConnected && visible(buttons[j])) {
+                schedule(200);
+                break;
+            }
+        }
+    }
+
+    function schedule(delay) {
+        if (scheduled) return;
+        scheduled = true;
+        setTimeout(sweep, delay || 0);
+    }
+
+    new MutationObserver(function() { schedule(0); }).observe(document, {
+        childList: true,
+        subtree: true,
+        attributes: true,
+        attributeFilter: ['style', 'class']
+    });
+    schedule(0);
+})(%s, %s, %d, %d);
+"""
+
+# 페이지 내 닫기 기록을 읽고 비우는 스크립트 (스크립트 미주입 시 None)
+DRAIN_SCRIPT = """
+if (!window.__cradPopupGuard) return null;
+var closed = window.__cradClosedPopups || [];
+window.__cradClosedPopups = [];
+return closed;
+"""
+
+def build_guard_script() -> str:
+    """선택자 상수를 넣은 주입 스크립트 생성"""
+    return POPUP_GUARD_SCRIPT % (
+        json.dumps(POPUP_CLOSE_SELECTORS),
+        json.dumps(POPUP_CONTAINER_SELECTORS),
+        MAX_CLICK_ATTEMPTS,
+        MAX_REPORT_ENTRIES
+    )
+
+class PopupGuard:
+    """주입 스크립트 기반 팝업 자동 닫기 클래스"""
+
+    def __init__(self, driver, actor=None):
+        """
+        초기화
+
+        Args:
+            driver: Selenium WebDriver 인스턴스
+            actor: 드라이버 명령을 실행할 DriverActor (None이면 직접 호출)
+        """
+        self.driver = driver
+        self.actor = actor
+        self.installed = False
+        self.closed = Counter()
+        self.recent = deque(maxlen=MAX_REPORT_ENTRIES)
+        self.stats = {
+            "drains": 0,
+            "missing": 0,
+            "window_popups": 0,
+            "drain_ms_total": 0.0
+        }
+
+    async def _call(self, func, *args):
+        """드라이버 명령 실행 (액터가 있으면 드라이버 스레드에서)"""
+        if self.actor:
+            return await self.actor.run(func, *args)
+        return func(*args)
+
+    async def install(self) -> bool:
+        """새 문서마다 팝업 자동 닫기 스크립트가 먼저 실행되도록 등록"""
+        try:
+            await self._call(self.driver.execute_cdp_cmd, "Page.addScriptToEvaluateOnNewDocument", {"source": build_guard_script()})
+            self.installed = True
+        except Exception as e:
+            logger.warning(f"팝업 자동 닫기 스크립트 등록 실패 (기존 팝업 처리 사용): {str(e)}")
+            self.installed = False
+        return self.installed
+
+    def drain_sync(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        페이지 내 닫기 기록을 읽고 비움 (드라이버 스레드에서 실행)
+
+        Returns:
+            List[Dict]: 이번에 새로 닫힌 팝업 목록 (현재 문서에 스크립트가 없으면 None)
+        """
+        start = time.perf_counter()
+        closed = self.driver.execute_script(DRAIN_SCRIPT)
+        self.stats["drains"] += 1
+        self.stats["drain_ms_total"] += (time.perf_counter() - start) * 1000
+        if closed is None:
+            self.stats["missing"] += 1
+            return None
+
+        for entry in closed:
+            self.closed[entry.get("kind", "unknown")] += 1
+            self.recent.append(entry)
+            logger.info(f"팝업 자동 닫기: {entry.get('kind')} ({entry.get('detail')})")
+        return closed
+
+    def close_extra_windows_sync(self) -> int:
+        """현재 창 외의 팝업 윈도우 닫기 (창이 하나면 명령 1회로 종료)"""
+        all_windows = self.driver.window_handles
+        if len(all_windows) <= 1:
+            return 0
+
+        current_window = self.driver.current_window_handle
+        closed = 0
+        for window in all_windows:
+            if window != current_window:
+                self.driver.switch_to.window(window)
+                self.driver.close()
+                closed += 1
+        self.driver.switch_to.window(current_window)
+        self.stats["window_popups"] += closed
+        logger.info(f"팝업 윈도우 {closed}개 닫기 완료")
+        return closed
+
+    def dismiss_sync(self) -> Optional[int]:
+        """
+        팝업 윈도우를 닫고 페이지 내 닫기 기록을 수집 (드라이버 스레드에서 실행)
+
+        Returns:
+            int: 닫힌 팝업 수 (현재 문서에 스크립트가 없으면 None, 기존 팝업 처리 필요)
+        """
+        windows = self.close_extra_windows_sync()
+        closed = self.drain_sync()
+        if closed is None:
+            return None
+        return windows + len(closed)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """닫은 팝업 수 및 기록 조회 비용 반환"""
+        drains = self.stats["drains"]
+        return {
+            "installed": self.installed,
+            "closed": dict(self.closed),
+            "drains": drains,
+            "missing": self.stats["missing"],
+            "window_popups": self.stats["window_popups"],
+            "mean_drain_ms": round(self.stats["drain_ms_total"] / drains, 2) if drains else None,
+            "recent": list(self.recent)[-10:]
+        }
@@ -0,0 +1,232 @@
+"""
+검색 결과 목록 캐시 모듈
+
+(키워드, 검색 기간, 보기 개수, 페이지) 별로 검색 결과 목록 항목을 디스크에 저장하여
+같은 키워드를 짧은 간격으로 다시 실행할 때 목록 단계(검색 + 페이지 이동 + 추출)에서 브라우저를 쓰지 않도록 합니다.
+항목은 유효 시간(TTL)이 지나면 버리고, 최대 개수를 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다(LRU).
+파일 읽기/쓰기는 동기 함수이므로 이벤트 루프에서는 asyncio.to_thread로 호출합니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from backend.crawler.paths import CACHE_DIR
+
+# 로거 설정
+logger = logging.getLogger("backend.crawler.search_cache")
+
+# 환경 변수 설정
+SEARCH_CACHE_DIR = Path(os.environ.get("SEARCH_CACHE_DIR", CACHE_DIR / "search_cache"))
+SEARCH_CACHE_TTL = float(os.environ.get("SEARCH_CACHE_TTL", "900"))  # 초 (0이면 사용 안 함)
+SEARCH_CACHE_MAX_ENTRIES = int(os.environ.get("SEARCH_CACHE_MAX_ENTRIES", "500"))
+
+def search_cache_key(keyword: str, date_range=None, page_size: str = "", page: int = 1) -> Dict[str, Any]:
+    """
+    캐시 키 구성
+
+    Args:
+        keyword: 검색 키워드
+        date_range: 검색 기간 조건 (DateRange, None이면 사이트 기본 기간)
+        page_size: 보기 개수
+        page: 결과 페이지 번호
+
+    Returns:
+        Dict: 캐시 키 (파일에도 함께 기록)
+    """
+    active = date_range is not None and date_range.active
+    return {
+        "keyword": keyword,
+        "start": date_range.start if active else None,
+        "end": date_range.end if active else None,
+        "field": date_range.field if active else None,
+        "page_size": str(page_size),
+        "page": page
+    }
+
+class SearchCache:
+    """디스크 기반 검색 결과 목록 캐시 (TTL + LRU)"""
+
+    def __init__(self, root: Path = SEARCH_CACHE_DIR, ttl: float = SEARCH_CACHE_TTL, max_entries: int = SEARCH_CACHE_MAX_ENTRIES):
+        """
+        초기화
+
+        Args:
+            root: 저장 디렉토리 (항목당 JSON 파일 하나)
+            ttl: 유효 시간 (초, 0 이하면 사용 안 함)
+            max_entries: 최대 항목 수
+        """
+        self.root = Path(root)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self.entries: "OrderedDict[str, float]" = OrderedDict()  # 파일 이름 → 마지막 사용 시각 (오래된 순)
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "expired": 0,
+            "writes": 0,
+            "evicted": 0,
+            "errors": 0
+        }
+        if self.enabled:
+            self._scan()
+
+    @property
+    def enabled(self) -> bool:
+        """캐시 사용 여부"""
+        return self.ttl > 0 and self.max_entries > 0
+
+    @staticmethod
+    def _name(key: Dict[str, Any]) -> str:
+        """캐시 키의 파일 이름"""
+        encoded = json.dumps(key, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha1(encoded.encode("utf-8")).hexdigest() + ".json"
+
+    def _scan(self):
+        """저장 디렉토리의 항목을 마지막 사용 시각 순으로 불러오기"""
+        if not self.root.exists():
+            return
+        files = sorted(self.root.glob("*.json"), key=lambda path: path.stat().st_mtime)
+        for path in files:
+            self.entries[path.name] = path.stat().st_mtime
+        if files:
+            logger.info(f"검색 결과 캐시 로드: {len(files)}개 ({self.root})")
+
+    def _remove(self, name: str):
+        """항목 파일 삭제 (잠금 안에서 호출)"""
+        self.entries.pop(name, None)
+        try:
+            (self.root / name).unlink()
+        except FileNotFoundError:
+            pass
+
+    def get(self, key: Dict[str, Any], record: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        캐시 항목 조회
+
+        Args:
+            key: search_cache_key 반환값
+            record: 적중/미스 통계와 사용 시각 갱신 여부 (존재 여부만 확인할 때 False)
+
+        Returns:
+            Dict: {"items": 항목 리스트, "last": 마지막 페이지 여부, "created": 저장 시각} (없거나 만료되면 None)
+        """
+        if not self.enabled:
+            return None
+        name = self._name(key)
+        with self._lock:
+            if name not in self.entries:
+                if record:
+                    self.stats["misses"] += 1
+                return None
+            try:
+                with open(self.root / name, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+            except Exception as e:
+                logger.warning(f"검색 결과 캐시 읽기 실패 (삭제): {str(e)}")
+                self.stats["errors"] += 1
+                self._remove(name)
+                return None
+
+            if time.time() - entry.get("created", 0) > self.ttl:
+                self.stats["expired"] += 1
+                if record:
+                    self.stats["misses"] += 1
+                self._remove(name)
+                return None
+            if not record:
+                return entry
+
+            # 사용 시각 갱신 (재시작 후에도 LRU 순서 유지)
+            now = time.time()
+            self.entries[name] = now
+            self.entries.move_to_end(name)
+            try:
+                os.utime(self.root / name, (now, now))
+            except OSError:
+                pass
+            self.stats["hits"] += 1
+            return entry
+
+    def put(self, key: Dict[str, Any], payload: str, last: bool = False):
+        """
+        캐시 항목 저장
+
+        Args:
+            key: search_cache_key 반환값
+            payload: 항목 리스트 JSON 문자열 (호출 시점의 내용을 유지하기 위해 미리 직렬화)
+            last: 검색 결과의 마지막 페이지 여부
+        """
+        if not self.enabled:
+            return
+        name = self._name(key)
+        data = '{"key": %s, "created": %f, "last": %s, "items": %s}' % (
+            json.dumps(key, ensure_ascii=False), time.time(), "true" if last else "false", payload
+        )
+        with self._lock:
+            try:
+                self.root.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.root / (name + ".tmp")
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                os.replace(tmp_path, self.root / name)
+            except Exception as e:
+                logger.warning(f"검색 결과 캐시 저장 실패: {str(e)}")
+                logger.debug(traceback.format_exc())
+                self.stats["errors"] += 1
+                return
+            self.entries[name] = time.time()
+            self.entries.move_to_end(name)
+            self.stats["writes"] += 1
+
+            while len(self.entries) > self.max_entries:
+                oldest = next(iter(self.entries))
+                self._remove(oldest)
+                self.stats["evicted"] += 1
+
+    def mark_last(self, key: Dict[str, Any]):
+        """저장된 페이지를 검색 결과의 마지막 페이지로 표시"""
+        if not self.enabled:
+            return
+        name = self._name(key)
+        with self._lock:
+            if name not in self.entries:
+                return
+            try:
+                path = self.root / name
+                with open(path, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+                entry["last"] = True
+                with open(path, 'w', encoding='utf-8') as f:
+                    json.dump(entry, f, ensure_ascii=False)
+            except Exception as e:
+                logger.warning(f"검색 결과 캐시 갱신 실패: {str(e)}")
+                self.stats["errors"] += 1
+
+    @staticmethod
+    def serialize(items: List[Dict[str, Any]]) -> str:
+        """항목 리스트를 저장용 JSON 문자열로 변환 (직렬화할 수 없는 값은 문자열로)"""
+        return json.dumps(items, ensure_ascii=False, default=str)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환"""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            "enabled": self.enabled,
+            "ttl": self.ttl,
+            "entries": len(self.entries),
+            "max_entries": self.max_entries,
+            **self.stats,
+            "hit_rate": round(self.stats["hits"] / lookups, 3) if lookups else None
+        }
+
+# 전역 검색 결과 캐시
+search_cache = SearchCache()
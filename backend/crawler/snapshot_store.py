@@ -0,0 +1,281 @@
+"""
+페이지 스냅샷 저장 모듈
+
+검색 결과 목록/상세 페이지 HTML을 내용 해시(SHA-256) 주소로 압축 저장합니다 (기본값: 사용 안 함).
+같은 HTML은 한 번만 저장하고, 전체 크기가 한도를 넘으면 오래된 스냅샷부터 삭제합니다.
+압축/디스크 기록은 백그라운드 스레드 하나에서 순서대로 처리하므로 이벤트 루프를 막지 않으며,
+저장한 스냅샷은 index.jsonl 기준으로 다시 읽어 파서 재현(replay) 자료로 사용할 수 있습니다.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import traceback
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from backend.crawler.paths import CACHE_DIR
+
+# 선택적 라이브러리 (설치된 경우에만 사용)
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# 로거 설정
+logger = logging.getLogger("backend.crawler.snapshot")
+
+# 환경 변수 설정
+PAGE_SNAPSHOTS = os.environ.get("PAGE_SNAPSHOTS", "false").lower() in ("1", "true", "yes")
+SNAPSHOT_DIR = Path(os.environ.get("SNAPSHOT_DIR", CACHE_DIR / "snapshots"))
+SNAPSHOT_MAX_MB = float(os.environ.get("SNAPSHOT_MAX_MB", "200"))
+SNAPSHOT_CODEC = os.environ.get("SNAPSHOT_CODEC", "zstd" if ZSTD_AVAILABLE else "gzip")
+
+# 코덱별 파일 확장자
+CODEC_SUFFIXES = {"zstd": ".html.zst", "gzip": ".html.gz"}
+
+def compress(data: bytes, codec: str) -> bytes:
+    """HTML 바이트 압축"""
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    return gzip.compress(data, compresslevel=6)
+
+def decompress(data: bytes, codec: str) -> bytes:
+    """압축된 HTML 바이트 복원"""
+    if codec == "zstd":
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+class SnapshotStore:
+    """내용 주소 기반 압축 페이지 스냅샷 저장소"""
+
+    def __init__(self, root: Path = SNAPSHOT_DIR, enabled: bool = PAGE_SNAPSHOTS, max_mb: float = SNAPSHOT_MAX_MB, codec: str = SNAPSHOT_CODEC):
+        """
+        초기화
+
+        Args:
+            root: 저장 디렉토리 (objects/ 아래 압축 파일, index.jsonl 기록)
+            enabled: 기록 여부 (False면 record 호출을 무시)
+            max_mb: 압축 파일 전체 최대 크기 (MB)
+            codec: 압축 방식 ("zstd" 또는 "gzip", zstandard 미설치 시 gzip)
+        """
+        if codec == "zstd" and not ZSTD_AVAILABLE:
+            logger.warning("zstandard 라이브러리가 없어 gzip으로 스냅샷을 압축합니다.")
+            codec = "gzip"
+        if codec not in CODEC_SUFFIXES:
+            raise ValueError(f"지원하지 않는 스냅샷 압축 방식입니다: {codec}")
+        self.root = Path(root)
+        self.enabled = enabled
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.codec = codec
+        self.index_path = self.root / "index.jsonl"
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.objects: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()  # 해시 → 객체 정보 (오래된 순)
+        self.total_bytes = 0
+        self.kinds = Counter()
+        self.stats = {
+            "recorded": 0,
+            "deduplicated": 0,
+            "evicted": 0,
+            "errors": 0,
+            "raw_bytes": 0,
+            "stored_bytes": 0,
+            "write_ms_total": 0.0
+        }
+        if self.enabled:
+            self._load_index()
+
+    def _object_path(self, digest: str, codec: str) -> Path:
+        """해시에 해당하는 압축 파일 경로 (앞 2자리로 디렉토리 분산)"""
+        return self.root / "objects" / digest[:2] / f"{digest}{CODEC_SUFFIXES[codec]}"
+
+    def _load_index(self):
+        """기록 파일에서 남아 있는 객체와 전체 크기 복원"""
+        if not self.index_path.exists():
+            return
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    entry = json.loads(line)
+                    digest = entry["hash"]
+                    path = self._object_path(digest, entry["codec"])
+                    if digest in self.objects or not path.exists():
+                        continue
+                    self.objects[digest] = {"codec": entry["codec"], "size": entry["stored"]}
+                    self.total_bytes += entry["stored"]
+            logger.info(f"스냅샷 기록 로드: {len(self.objects)}개, {self.total_bytes / 1024 / 1024:.1f}MB ({self.root})")
+        except Exception as e:
+            logger.warning(f"스냅샷 기록 로드 실패 (새로 기록): {str(e)}")
+            self.objects.clear()
+            self.total_bytes = 0
+
+    def record(self, kind: str, html: Optional[str], **meta) -> Optional[Future]:
+        """
+        스냅샷 기록 요청 (압축/저장은 백그라운드 스레드에서 수행)
+
+        Args:
+            kind: 페이지 종류 (예: "list", "detail")
+            html: 페이지 HTML
+            **meta: 함께 기록할 정보 (keyword, bid_number, url 등)
+
+        Returns:
+            Future: 저장 작업 (결과는 해시, 비활성/빈 HTML이면 None)
+        """
+        if not self.enabled or not html:
+            return None
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="snapshot")
+        return self._executor.submit(self._write, kind, html, meta)
+
+    def _write(self, kind: str, html: str, meta: Dict[str, Any]) -> Optional[str]:
+        """압축 후 저장하고 기록 파일에 한 줄 추가 (백그라운드 스레드)"""
+        start = time.perf_counter()
+        try:
+            raw = html.encode("utf-8")
+            digest = hashlib.sha256(raw).hexdigest()
+            with self._lock:
+                known = self.objects.get(digest)
+            if known:
+                codec, stored = known["codec"], known["size"]
+                self.stats["deduplicated"] += 1
+                with self._lock:
+                    self.objects.move_to_end(digest)
+            else:
+                codec = self.codec
+                data = compress(raw, codec)
+                stored = len(data)
+                path = self._object_path(digest, codec)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(".tmp")
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+                with self._lock:
+                    self.objects[digest] = {"codec": codec, "size": stored}
+                    self.total_bytes += stored
+                self.stats["stored_bytes"] += stored
+
+            entry = {
+                "hash": digest,
+                "kind": kind,
+                "codec": codec,
+                "raw": len(raw),
+                "stored": stored,
+                "at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                **{key: value for key, value in meta.items() if value is not None}
+            }
+            with open(self.index_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+            self.stats["recorded"] += 1
+            self.stats["raw_bytes"] += len(raw)
+            self.kinds[kind] += 1
+            self._evict()
+            return digest
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"스냅샷 저장 실패 ({kind}): {str(e)}")
+            logger.debug(traceback.format_exc())
+            return None
+        finally:
+            self.stats["write_ms_total"] += (time.perf_counter() - start) * 1000
+
+    def _evict(self):
+        """전체 크기가 한도를 넘으면 오래된 객체부터 삭제하고 기록 파일 정리 (백그라운드 스레드)"""
+        removed = []
+        with self._lock:
+            while self.total_bytes > self.max_bytes and len(self.objects) > 1:
+                digest, info = self.objects.popitem(last=False)
+                self.total_bytes -= info["size"]
+                removed.append((digest, info["codec"]))
+        if not removed:
+            return
+
+        for digest, codec in removed:
+            try:
+                self._object_path(digest, codec).unlink()
+            except FileNotFoundError:
+                pass
+        self.stats["evicted"] += len(removed)
+
+        # 삭제한 객체를 가리키는 기록 줄 제거
+        gone = {digest for digest, _ in removed}
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            lines = [line for line in f if json.loads(line)["hash"] not in gone]
+        tmp_path = self.index_path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.writelines(lines)
+        os.replace(tmp_path, self.index_path)
+        logger.info(f"스냅샷 {len(removed)}개 삭제 (크기 한도 {self.max_bytes / 1024 / 1024:.0f}MB)")
+
+    def flush(self):
+        """대기 중인 저장 작업을 모두 마치고 백그라운드 스레드 종료 (다음 기록 시 다시 시작)"""
+        if self._executor is None:
+            return
+        executor, self._executor = self._executor, None
+        executor.shutdown(wait=True)
+
+    def iter_entries(self, kind: Optional[str] = None, **match) -> Iterator[Dict[str, Any]]:
+        """
+        기록된 스냅샷 정보 순회 (재현 자료 선택용)
+
+        Args:
+            kind: 페이지 종류 (None이면 전체)
+            **match: 일치해야 하는 기록 값 (예: keyword="AI")
+
+        Yields:
+            Dict: 기록 줄 (hash, kind, codec, raw, stored, at 및 기록 시 전달한 정보)
+        """
+        if not self.index_path.exists():
+            return
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                entry = json.loads(line)
+                if kind and entry.get("kind") != kind:
+                    continue
+                if any(entry.get(key) != value for key, value in match.items()):
+                    continue
+                yield entry
+
+    def load(self, digest: str, codec: Optional[str] = None) -> Optional[str]:
+        """
+        해시로 스냅샷 HTML 읽기
+
+        Args:
+            digest: 스냅샷 해시
+            codec: 압축 방식 (None이면 저장된 파일 확장자로 판단)
+
+        Returns:
+            str: HTML (없으면 None)
+        """
+        for candidate in ([codec] if codec else list(CODEC_SUFFIXES)):
+            path = self._object_path(digest, candidate)
+            if path.exists():
+                return decompress(path.read_bytes(), candidate).decode("utf-8")
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """저장 통계 반환"""
+        recorded = self.stats["recorded"]
+        return {
+            "enabled": self.enabled,
+            "codec": self.codec,
+            "root": str(self.root),
+            "objects": len(self.objects),
+            "total_mb": round(self.total_bytes / 1024 / 1024, 2),
+            "kinds": dict(self.kinds),
+            **{key: value for key, value in self.stats.items() if key != "write_ms_total"},
+            "compression_ratio": round(self.stats["raw_bytes"] / self.stats["stored_bytes"], 2) if self.stats["stored_bytes"] else None,
+            "mean_write_ms": round(self.stats["write_ms_total"] / recorded, 2) if recorded else None
+        }
+
+# 전역 스냅샷 저장소 (PAGE_SNAPSHOTS=true일 때만 기록)
+snapshot_store = SnapshotStore()
@@ -0,0 +1,275 @@
+"""
+조건 기반 대기 엔진 모듈
+
+고정 시간 sleep 대신 페이지 준비 신호(문서 로딩 완료, 진행 중인 XHR 없음,
+그리드 행 수 안정화, 상세 테이블 표시)를 폴링하여 대기하고,
+대기 유형별 지연 시간 히스토그램으로 제한 시간을 적응적으로 조정합니다.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+from backend.crawler.driver_actor import DriverDeadError
+
+# 로거 설정
+logger = logging.getLogger("backend.crawler.wait")
+
+# 입찰공고 목록 그리드의 공고명 셀 (행 수 측정용)
+GRID_ROW_SELECTOR = "[id^='mf_wfm_container_tacBidPbancLst_contents_tab2_body_gridView1_cell_'][id$='_6']"
+
+# 상세 페이지 정보 테이블
+DETAIL_TABLE_SELECTOR = ".table_list, .detail_table, .bid_table"
+
+# 히스토그램 구간 상한 (밀리초)
+HISTOGRAM_BUCKETS_MS = [50, 100, 250, 500, 1000, 2000, 4000, 8000, 16000, 32000]
+
+# 진행 중인 XHR/fetch 요청 수를 window.__cradPendingXhr에 기록하는 스크립트 (중복 설치 방지)
+XHR_TRACKER_SCRIPT = """
+if (!window.__cradXhrTracker) {
+    window.__cradXhrTracker = true;
+    window.__cradPendingXhr = 0;
+    var origSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function() {
+        window.__cradPendingXhr++;
+        this.addEventListener('loadend', function() {
+            window.__cradPendingXhr = Math.max(0, window.__cradPendingXhr - 1);
+        });
+        return origSend.apply(this, arguments);
+    };
+    if (window.fetch) {
+        var origFetch = window.fetch;
+        window.fetch = function() {
+            window.__cradPendingXhr++;
+            return origFetch.apply(this, arguments).finally(function() {
+                window.__cradPendingXhr = Math.max(0, window.__cradPendingXhr - 1);
+            });
+        };
+    }
+}
+"""
+
+# 문서 상태, 진행 중인 요청 수, 선택자별 요소 수를 한 번에 수집하는 스크립트
+SNAPSHOT_SCRIPT = XHR_TRACKER_SCRIPT + """
+var selectors = arguments[0] || [];
+var counts = selectors.map(function(s) { return document.querySelectorAll(s).length; });
+var first = selectors.length ? document.querySelector(selectors[0]) : null;
+return {
+    ready: document.readyState,
+    pending: window.__cradPendingXhr || 0,
+    counts: counts,
+    first: first ? (first.textContent || '').trim().slice(0, 80) : ''
+};
+"""
+
+class LatencyHistogram:
+    """대기 유형별 지연 시간 히스토그램"""
+
+    def __init__(self, max_samples: int = 200):
+        """
+        초기화
+
+        Args:
+            max_samples: 백분위 계산에 사용할 최근 샘플 수
+        """
+        self.samples = deque(maxlen=max_samples)
+        self.buckets = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        self.count = 0
+        self.timeouts = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        """대기 성공 시간 기록"""
+        self.samples.append(seconds)
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+        elapsed_ms = seconds * 1000
+        for idx, bound in enumerate(HISTOGRAM_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                self.buckets[idx] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+    def record_timeout(self):
+        """대기 시간 초과 기록"""
+        self.timeouts += 1
+
+    def percentile(self, ratio: float) -> Optional[float]:
+        """최근 샘플 기준 백분위 값 반환 (초)"""
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, max(0, int(len(ordered) * ratio + 0.5) - 1))
+        return ordered[index]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """히스토그램 통계 반환"""
+        labels = [f"<={bound}ms" for bound in HISTOGRAM_BUCKETS_MS] + [f">{HISTOGRAM_BUCKETS_MS[-1]}ms"]
+        p50 = self.percentile(0.5)
+        p95 = self.percentile(0.95)
+        return {
+            "count": self.count,
+            "timeouts": self.timeouts,
+            "mean_ms": round(self.total / self.count * 1000, 1) if self.count else None,
+            "p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+            "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+            "max_ms": round(self.max * 1000, 1),
+            "buckets": {label: n for label, n in zip(labels, self.buckets) if n}
+        }
+
+class WaitEngine:
+    """조건 기반 적응형 대기 엔진"""
+
+    def __init__(self, driver, actor=None, default_timeout: float = 10.0, min_timeout: float = 2.0,
+                 max_timeout: float = 30.0, timeout_factor: float = 3.0, min_samples: int = 5,
+                 poll_interval: float = 0.1):
+        """
+        초기화
+
+        Args:
+            driver: Selenium WebDriver 인스턴스
+            actor: 드라이버 명령을 실행할 DriverActor (None이면 조건을 직접 호출)
+            default_timeout: 샘플이 부족할 때 사용할 제한 시간 (초)
+            min_timeout: 적응형 제한 시간 하한 (초)
+            max_timeout: 적응형 제한 시간 상한 (초)
+            timeout_factor: p95 지연 시간에 곱할 배수
+            min_samples: 적응형 제한 시간을 사용하기 위한 최소 샘플 수
+            poll_interval: 조건 확인 주기 (초)
+        """
+        self.driver = driver
+        self.actor = actor
+        self.default_timeout = default_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.timeout_factor = timeout_factor
+        self.min_samples = min_samples
+        self.poll_interval = poll_interval
+        self.histograms: Dict[str, LatencyHistogram] = {}
+
+    async def install(self):
+        """새 문서마다 XHR 추적 스크립트가 먼저 실행되도록 등록"""
+        try:
+            await self._call(self.driver.execute_cdp_cmd, "Page.addScriptToEvaluateOnNewDocument", {"source": XHR_TRACKER_SCRIPT})
+        except Exception as e:
+            logger.warning(f"XHR 추적 스크립트 등록 실패 (스냅샷 시 설치): {str(e)}")
+
+    def timeout_for(self, name: str) -> float:
+        """대기 유형의 제한 시간 계산 (p95 x 배수, 상/하한 적용)"""
+        histogram = self.histograms.get(name)
+        if not histogram or histogram.count < self.min_samples:
+            return self.default_timeout
+        p95 = histogram.percentile(0.95)
+        return min(self.max_timeout, max(self.min_timeout, p95 * self.timeout_factor))
+
+    async def wait_for(self, name: str, condition: Callable, timeout: Optional[float] = None, stable_polls: int = 1):
+        """
+        조건이 참이 될 때까지 폴링하여 대기
+
+        Args:
+            name: 대기 유형 이름 (히스토그램 키)
+            condition: 조건 함수 (참 값 반환 시 충족, 드라이버 스레드에서 실행)
+            timeout: 제한 시간 (None이면 적응형 제한 시간)
+            stable_polls: 같은 값이 연속으로 관찰되어야 하는 횟수
+
+        Returns:
+            조건 함수의 마지막 반환값 (시간 초과 시 None)
+        """
+        histogram = self.histograms.setdefault(name, LatencyHistogram())
+        if timeout is None:
+            timeout = self.timeout_for(name)
+
+        start = time.perf_counter()
+        deadline = start + timeout
+        last_value = None
+        streak = 0
+
+        while True:
+            try:
+                value = await self._call(condition)
+            except DriverDeadError:
+                # 세션이 죽었으면 제한 시간까지 기다리지 않고 바로 실패
+                logger.warning(f"대기 중단: {name} (드라이버 응답 없음)")
+                return None
+            except Exception as e:
+                logger.debug(f"대기 조건 확인 중 오류 ({name}): {str(e)}")
+                value = None
+
+            if value:
+                streak = streak + 1 if value == last_value else 1
+                last_value = value
+                if streak >= stable_polls:
+                    elapsed = time.perf_counter() - start
+                    histogram.record(elapsed)
+                    logger.debug(f"대기 완료: {name} ({elapsed * 1000:.0f}ms)")
+                    return value
+            else:
+                streak = 0
+                last_value = None
+
+            if time.perf_counter() >= deadline:
+                histogram.record_timeout()
+                logger.warning(f"대기 시간 초과: {name} ({timeout:.1f}초)")
+                return None
+
+            await asyncio.sleep(self.poll_interval)
+
+    async def wait_for_page_ready(self, name: str = "page", timeout: Optional[float] = None) -> bool:
+        """문서 로딩이 끝나고 진행 중인 XHR이 없을 때까지 대기"""
+        return bool(await self.wait_for(name, self._page_signature, timeout, stable_polls=2))
+
+    async def wait_for_grid(self, name: str = "grid", timeout: Optional[float] = None) -> bool:
+        """목록 그리드의 행 수와 첫 행 내용이 안정될 때까지 대기"""
+        return bool(await self.wait_for(name, lambda: self._page_signature([GRID_ROW_SELECTOR]), timeout, stable_polls=3))
+
+    async def wait_for_grid_change(self, previous_first: str, name: str = "grid_page", timeout: Optional[float] = None) -> bool:
+        """목록 그리드 첫 행 내용이 이전 값과 달라지고 안정될 때까지 대기 (페이지 이동 후)"""
+        def condition():
+            signature = self._page_signature([GRID_ROW_SELECTOR])
+            if not signature or signature[2] == previous_first:
+                return None
+            return signature
+        return bool(await self.wait_for(name, condition, timeout, stable_polls=2))
+
+    async def wait_for_detail(self, name: str = "detail", timeout: Optional[float] = None) -> bool:
+        """상세 정보 테이블이 표시되거나 목록 그리드가 사라질 때까지 대기"""
+        return bool(await self.wait_for(name, self._detail_signature, timeout, stable_polls=2))
+
+    def _snapshot(self, selectors: Optional[List[str]] = None) -> Dict[str, Any]:
+        """문서 상태 스냅샷 수집 (드라이버 스레드에서 실행)"""
+        return self.driver.execute_script(SNAPSHOT_SCRIPT, selectors or []) or {}
+
+    def _page_signature(self, selectors: Optional[List[str]] = None):
+        """페이지가 준비되었으면 상태 서명 반환 (드라이버 스레드에서 실행)"""
+        snapshot = self._snapshot(selectors)
+        if snapshot.get("ready") != "complete" or snapshot.get("pending", 0) > 0:
+            return None
+        return ("ready", tuple(snapshot.get("counts", [])), snapshot.get("first", ""))
+
+    def _detail_signature(self):
+        """상세 페이지가 준비되었으면 상태 서명 반환 (드라이버 스레드에서 실행)"""
+        signature = self._page_signature([DETAIL_TABLE_SELECTOR, GRID_ROW_SELECTOR])
+        if not signature:
+            return None
+        detail_tables, grid_rows = signature[1]
+        if detail_tables == 0 and grid_rows > 0:
+            return None  # 아직 목록 페이지
+        return signature
+
+    async def _call(self, func: Callable, *args):
+        """액터가 있으면 드라이버 스레드에서, 없으면 직접 실행"""
+        if self.actor:
+            return await self.actor.run(func, *args)
+        return func(*args)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """대기 유형별 지연 시간 통계 및 현재 제한 시간 반환"""
+        stats = {}
+        for name, histogram in self.histograms.items():
+            stats[name] = {**histogram.get_stats(), "timeout_s": round(self.timeout_for(name), 2)}
+        return stats
@@ -0,0 +1,157 @@
+"""
+브라우저 감시(watchdog) 모듈
+
+드라이버 명령 시간 초과(hang)와 세션 종료(crash)를 감지하고,
+브라우저 재시작 횟수와 복구 시간을 집계하며,
+키워드/페이지/행 단위 재개 지점(checkpoint)을 관리합니다.
+"""
+
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional, Set
+
+# 로거 설정
+logger = logging.getLogger("backend.crawler.watchdog")
+
+# 세션 상태 확인 명령 제한 시간 (초)
+WATCHDOG_PROBE_TIMEOUT = float(os.environ.get("WATCHDOG_PROBE_TIMEOUT", "10"))
+# 키워드당 최대 브라우저 재시작 횟수 (초과하면 키워드 포기)
+WATCHDOG_MAX_RESTARTS = int(os.environ.get("WATCHDOG_MAX_RESTARTS", "3"))
+
+class ResumePoint:
+    """키워드 처리 재개 지점 (키워드, 페이지, 처리 완료 행)"""
+
+    def __init__(self, keyword: str):
+        """
+        초기화
+
+        Args:
+            keyword: 처리 중인 키워드
+        """
+        self.keyword = keyword
+        self.page = 1
+        self.page_start = 0  # 현재 페이지 첫 항목의 items 내 위치
+        self.items: Optional[List[Any]] = None  # 추출한 검색 결과 (상세 정보 병합 중)
+        self.done_rows: Set[int] = set()  # 상세 정보 처리를 마친 행
+        self.published_rows: Set[int] = set()  # 전체 결과에 반영한 행 (재개 시 중복 반영 방지)
+        self.deferred_rows: Set[int] = set()  # 다른 키워드가 선점 중인 중복 공고 행 (게시/해제 확인 후 처리)
+        self.restarts = 0
+
+    @property
+    def row(self) -> int:
+        """다음에 처리할 행 번호"""
+        row = 0
+        while row in self.done_rows:
+            row += 1
+        return row
+
+    def pending_rows(self) -> List[int]:
+        """아직 처리하지 않은 행 번호 목록"""
+        if self.items is None:
+            return []
+        return [index for index in range(len(self.items)) if index not in self.done_rows and index not in self.deferred_rows]
+
+    def page_rows(self) -> List[int]:
+        """현재 페이지에 속한 행 번호 목록"""
+        if self.items is None:
+            return []
+        return list(range(self.page_start, len(self.items)))
+
+    def as_dict(self) -> Dict[str, Any]:
+        """상태 조회용 딕셔너리"""
+        return {
+            "keyword": self.keyword,
+            "page": self.page,
+            "row": self.row,
+            "rows_done": len(self.done_rows),
+            "rows_total": len(self.items) if self.items is not None else None,
+            "restarts": self.restarts
+        }
+
+class DriverWatchdog:
+    """브라우저 세션 감시 및 재시작 통계 클래스"""
+
+    def __init__(self, probe_timeout: float = WATCHDOG_PROBE_TIMEOUT, max_restarts: int = WATCHDOG_MAX_RESTARTS):
+        """
+        초기화
+
+        Args:
+            probe_timeout: 세션 상태 확인 명령 제한 시간 (초)
+            max_restarts: 키워드당 최대 브라우저 재시작 횟수
+        """
+        self.probe_timeout = probe_timeout
+        self.max_restarts = max_restarts
+        self.recovery_times: List[float] = []
+        self.stats = {
+            "hangs": 0,
+            "crashes": 0,
+            "restarts": 0,
+            "restart_failures": 0,
+            "resumed_rows": 0,
+            "abandoned_keywords": 0,
+            "last_failure": None
+        }
+
+    @staticmethod
+    def is_dead(crawler) -> bool:
+        """명령 시간 초과/세션 종료로 표시된 크롤러인지 확인 (명령 실행 없음)"""
+        return not crawler or not crawler.actor or crawler.actor.dead
+
+    async def probe(self, crawler) -> bool:
+        """
+        짧은 명령으로 세션 응답 확인 (실패하면 액터를 dead로 표시)
+
+        Returns:
+            bool: 세션 정상 여부
+        """
+        if self.is_dead(crawler):
+            return False
+        try:
+            await crawler.actor.run(lambda: crawler.driver.window_handles, deadline=self.probe_timeout)
+            return True
+        except Exception as e:
+            crawler.actor.mark_dead(f"상태 확인 실패: {str(e)}")
+            return False
+
+    def record_failure(self, crawler, checkpoint: Optional[ResumePoint] = None):
+        """세션 장애 기록 (hang/crash 구분)"""
+        actor = crawler.actor if crawler else None
+        reason = actor.dead_reason if actor else "크롤러 없음"
+        if actor and actor.hang_count:
+            self.stats["hangs"] += 1
+        else:
+            self.stats["crashes"] += 1
+        self.stats["last_failure"] = {
+            "reason": reason,
+            "at": time.time(),
+            "checkpoint": checkpoint.as_dict() if checkpoint else None
+        }
+        logger.error(f"브라우저 장애 감지: {reason} (재개 지점: {checkpoint.as_dict() if checkpoint else None})")
+
+    def record_restart(self, seconds: float, success: bool):
+        """브라우저 재시작 결과 기록"""
+        if success:
+            self.stats["restarts"] += 1
+            self.recovery_times.append(seconds)
+            self.recovery_times = self.recovery_times[-100:]
+            logger.info(f"브라우저 재시작 완료 ({seconds:.1f}초)")
+        else:
+            self.stats["restart_failures"] += 1
+            logger.error(f"브라우저 재시작 실패 ({seconds:.1f}초)")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """재시작 횟수 및 복구 시간 통계 반환"""
+        times = self.recovery_times
+        return {
+            **self.stats,
+            "max_restarts_per_keyword": self.max_restarts,
+            "recovery_seconds": {
+                "last": round(times[-1], 2) if times else None,
+                "mean": round(sum(times) / len(times), 2) if times else None,
+                "max": round(max(times), 2) if times else None
+            }
+        }
+
+# 프로세스 전역 브라우저 감시기 (모든 워커가 공유)
+driver_watchdog = DriverWatchdog()
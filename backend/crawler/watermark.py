@@ -0,0 +1,200 @@
+"""
+증분 수집 기준점(high-water mark) 모듈
+
+키워드 + 필터 조합별로 지금까지 처리한 공고번호/차수와 가장 최근 공고게시일시를 디스크에 저장합니다.
+증분 모드에서는 이미 처리한 공고(같은 차수 이하)는 상세 처리를 건너뛰고,
+검색 결과는 최근 게시 순으로 나오므로 한 페이지가 모두 알려진 공고면 다음 페이지로 넘어가지 않습니다.
+정정공고처럼 차수가 올라간 공고는 새 공고로 취급합니다.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import traceback
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from backend.crawler.bid_registry import bid_key
+from backend.crawler.paths import CACHE_DIR
+
+# 로거 설정
+logger = logging.getLogger("backend.crawler.watermark")
+
+# 저장 경로 및 키워드별 보관할 최대 공고 수 (최근 게시 순)
+DEFAULT_WATERMARK_PATH = Path(os.environ.get("WATERMARK_PATH", CACHE_DIR / "watermarks.json"))
+WATERMARK_MAX_BIDS = int(os.environ.get("WATERMARK_MAX_BIDS", "5000"))
+
+def posting_time(item) -> Optional[str]:
+    """
+    항목의 공고게시일시를 비교용 문자열(YYYYMMDDHHMM)로 변환
+
+    Args:
+        item: 검색 결과 항목 (딕셔너리 또는 BidItem 모델)
+
+    Returns:
+        str: 12자리 숫자 문자열 (시각이 없으면 0000으로 채움, 날짜가 없으면 None)
+    """
+    for key in ("date_start", "start_date"):
+        value = item.get(key) if isinstance(item, dict) else getattr(item, key, None)
+        digits = re.sub(r"\D", "", str(value or ""))
+        if len(digits) >= 8:
+            return digits[:12].ljust(12, "0")
+    return None
+
+def watermark_key(keyword: str, filters: Optional[Dict[str, Any]] = None) -> str:
+    """키워드와 필터 조합으로 저장 키 생성 (필터는 이름순 정렬)"""
+    parts = [keyword] + [f"{name}={value}" for name, value in sorted((filters or {}).items())]
+    return "|".join(parts)
+
+class KeywordWatermark:
+    """키워드 + 필터 조합 하나의 기준점과 이번 실행에서 처리한 공고"""
+
+    def __init__(self, key: str, entry: Optional[Dict[str, Any]] = None):
+        """
+        초기화
+
+        Args:
+            key: 저장 키 (watermark_key)
+            entry: 저장된 기준점 (None이면 처음 수집)
+        """
+        entry = entry or {}
+        self.key = key
+        self.bids: Dict[str, str] = dict(entry.get("bids") or {})  # 공고번호 → 처리한 최고 차수
+        self.posted: Dict[str, str] = dict(entry.get("posted") or {})  # 공고번호 → 공고게시일시 (보관 수 제한용)
+        self.newest_posting: Optional[str] = entry.get("newest_posting")
+        self.runs = entry.get("runs", 0)
+        self.observed = 0  # 이번 실행에서 기록한 공고 수
+        self.skipped = 0  # 이번 실행에서 건너뛴 공고 수 (호출하는 쪽에서 기록)
+
+    def is_known(self, item) -> bool:
+        """
+        이미 처리한 공고인지 확인
+
+        공고번호가 같고 차수가 저장된 차수 이하이면 처리한 공고입니다.
+        공고번호를 알 수 없는 항목은 게시일시가 기준점보다 이전일 때만 처리한 것으로 봅니다.
+        """
+        key = bid_key(item)
+        if key is None:
+            posted = posting_time(item)
+            known = bool(posted and self.newest_posting and posted < self.newest_posting)
+        else:
+            seen_revision = self.bids.get(key[0])
+            known = seen_revision is not None and key[1] <= seen_revision
+        return known
+
+    def all_known(self, items) -> bool:
+        """모든 항목이 이미 처리한 공고인지 확인 (빈 목록이면 False)"""
+        return bool(items) and all(self.is_known(item) for item in items)
+
+    def observe(self, item):
+        """처리한 공고를 기준점에 반영"""
+        key = bid_key(item)
+        posted = posting_time(item)
+        if key is not None:
+            if key[1] > self.bids.get(key[0], ""):
+                self.bids[key[0]] = key[1]
+            if posted:
+                self.posted[key[0]] = posted
+        if posted and (self.newest_posting is None or posted > self.newest_posting):
+            self.newest_posting = posted
+        self.observed += 1
+
+    def observe_all(self, items: Iterable[Any]):
+        """여러 공고를 기준점에 반영"""
+        for item in items:
+            self.observe(item)
+
+    def to_entry(self) -> Dict[str, Any]:
+        """저장용 딕셔너리 (게시일시가 최근인 공고부터 최대 WATERMARK_MAX_BIDS개 유지)"""
+        bids = self.bids
+        if len(bids) > WATERMARK_MAX_BIDS:
+            recent = sorted(bids, key=lambda number: self.posted.get(number, ""), reverse=True)[:WATERMARK_MAX_BIDS]
+            bids = {number: bids[number] for number in recent}
+        return {
+            "newest_posting": self.newest_posting,
+            "bids": bids,
+            "posted": {number: self.posted[number] for number in bids if number in self.posted},
+            "runs": self.runs,
+            "updated_at": datetime.now().isoformat()
+        }
+
+class WatermarkStore:
+    """키워드별 증분 수집 기준점 저장소"""
+
+    def __init__(self, path: Path = DEFAULT_WATERMARK_PATH):
+        """
+        초기화
+
+        Args:
+            path: 저장 파일 경로 (JSON)
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.active: Dict[str, KeywordWatermark] = {}  # 이번 실행에서 수집 중인 기준점 (재시작 후 재개 시 재사용)
+        self.load()
+
+    def load(self):
+        """저장 파일에서 기준점 불러오기"""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+            logger.info(f"증분 수집 기준점 로드: {len(self.entries)}개 ({self.path})")
+        except Exception as e:
+            logger.warning(f"증분 수집 기준점 로드 실패 (처음부터 수집): {str(e)}")
+            self.entries = {}
+
+    def save(self):
+        """기준점을 저장 파일에 기록"""
+        # 여러 스레드가 같은 임시 파일에 동시에 쓰지 않도록 기록과 교체까지 잠금 유지
+        with self._lock:
+            try:
+                data = json.dumps(self.entries, ensure_ascii=False, indent=2)
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix(".tmp")
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                os.replace(tmp_path, self.path)
+            except Exception as e:
+                logger.warning(f"증분 수집 기준점 저장 실패: {str(e)}")
+                logger.debug(traceback.format_exc())
+
+    def track(self, keyword: str, filters: Optional[Dict[str, Any]] = None) -> KeywordWatermark:
+        """
+        키워드 + 필터 조합의 기준점 조회 (이번 실행에서 이미 수집 중이면 같은 인스턴스 반환)
+
+        Args:
+            keyword: 검색 키워드
+            filters: 결과 범위에 영향을 주는 필터 (예: 기간 기준)
+
+        Returns:
+            KeywordWatermark: 기준점
+        """
+        key = watermark_key(keyword, filters)
+        with self._lock:
+            if key not in self.active:
+                self.active[key] = KeywordWatermark(key, self.entries.get(key))
+            return self.active[key]
+
+    def commit(self, mark: KeywordWatermark):
+        """키워드 처리를 마친 기준점을 저장 (중간에 중단된 키워드는 저장하지 않음)"""
+        mark.runs += 1
+        with self._lock:
+            self.entries[mark.key] = mark.to_entry()
+            self.active.pop(mark.key, None)
+        self.save()
+        logger.info(f"증분 수집 기준점 저장: {mark.key} (새 공고 {mark.observed}건, 건너뜀 {mark.skipped}건, 최근 게시 {mark.newest_posting})")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """저장된 기준점 및 수집 중인 기준점 요약"""
+        with self._lock:
+            return {
+                "path": str(self.path),
+                "keywords": len(self.entries),
+                "active": {key: {"observed": mark.observed, "skipped": mark.skipped} for key, mark in self.active.items()}
+            }
@@ -0,0 +1,91 @@
+"""
+이벤트 루프 지연 모니터 모듈
+
+asyncio 이벤트 루프가 블로킹 호출로 인해 멈춘 시간을 측정합니다.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Any, List, Optional
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+class LoopLagMonitor:
+    """이벤트 루프 지연 측정 클래스"""
+
+    def __init__(self, interval: float = 0.1, threshold: float = 0.05, max_samples: int = 1000):
+        """
+        모니터 초기화
+
+        Args:
+            interval: 측정 주기 (초)
+            threshold: 블로킹으로 간주할 지연 임계값 (초)
+            max_samples: 보관할 최대 지연 샘플 수
+        """
+        self.interval = interval
+        self.threshold = threshold
+        self.max_samples = max_samples
+        self._task: Optional[asyncio.Task] = None
+        self.reset()
+
+    def reset(self):
+        """측정값 초기화"""
+        self.samples: List[float] = []
+        self.sample_count = 0
+        self.max_lag = 0.0
+        self.blocked_time = 0.0
+        self.blocked_events = 0
+        self.started_at = time.time()
+
+    def start(self):
+        """측정 시작 (실행 중인 이벤트 루프 필요)"""
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        logger.info("이벤트 루프 지연 측정 시작")
+
+    async def stop(self):
+        """측정 중지"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        """주기적으로 sleep 초과 시간을 측정"""
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.perf_counter() - start - self.interval)
+            self._record(lag)
+
+    def _record(self, lag: float):
+        """지연 샘플 기록"""
+        self.sample_count += 1
+        self.samples.append(lag)
+        if len(self.samples) > self.max_samples:
+            self.samples.pop(0)
+
+        self.max_lag = max(self.max_lag, lag)
+        if lag >= self.threshold:
+            self.blocked_events += 1
+            self.blocked_time += lag
+            logger.debug(f"이벤트 루프 블로킹 감지: {lag * 1000:.1f}ms")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """지연 통계 반환"""
+        ordered = sorted(self.samples)
+        p95 = ordered[int(len(ordered) * 0.95) - 1] if ordered else 0.0
+        return {
+            "samples": self.sample_count,
+            "max_lag_ms": round(self.max_lag * 1000, 1),
+            "p95_lag_ms": round(p95 * 1000, 1),
+            "blocked_events": self.blocked_events,
+            "blocked_ms": round(self.blocked_time * 1000, 1),
+            "since": self.started_at
+        }
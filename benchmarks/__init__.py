@@ -0,0 +1,6 @@
+"""
+성능 측정 스크립트 패키지
+
+크롤러 성능 개선 전후를 비교하는 벤치마크 스크립트들을 담고 있는 패키지입니다.
+프로젝트 루트에서 `python -m benchmarks.<스크립트명>` 형태로 실행합니다.
+"""
@@ -0,0 +1,72 @@
+"""
+chromedriver 경로 확인 시작 시간 벤치마크
+
+매 초기화마다 chromedriver_autoinstaller.install(True)을 호출하던 방식(변경 전)과
+주 버전별 캐시를 사용하는 ChromeDriverResolver(변경 후)의 소요 시간을 비교합니다.
+(Chrome 필요, 캐시가 없으면 첫 확인 시 드라이버 다운로드)
+
+사용 예:
+    python -m benchmarks.bench_driver_startup --runs 5
+    python -m benchmarks.bench_driver_startup --runs 3 --launch
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+
+import chromedriver_autoinstaller
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+from backend.crawler.driver_resolver import ChromeDriverResolver, DEFAULT_CACHE_PATH
+
+def timed(func):
+    """함수 실행 시간(초)과 결과 반환"""
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+def report(label: str, samples):
+    """측정 결과 출력"""
+    print(f"{label}: 평균 {statistics.mean(samples) * 1000:.0f}ms | "
+          f"최소 {min(samples) * 1000:.0f}ms | 최대 {max(samples) * 1000:.0f}ms ({len(samples)}회)")
+
+def launch_browser(driver_path: str) -> float:
+    """헤드리스 Chrome 실행부터 종료까지 시간 측정"""
+    options = Options()
+    options.add_argument('--headless=new')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    elapsed, driver = timed(lambda: webdriver.Chrome(service=Service(driver_path), options=options))
+    driver.quit()
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="chromedriver 경로 확인 시작 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=5, help="반복 횟수")
+    parser.add_argument("--offline", action="store_true", help="변경 후 측정을 오프라인 모드로 실행 (변경 전 측정 생략)")
+    parser.add_argument("--launch", action="store_true", help="브라우저 실행 시간도 측정")
+    args = parser.parse_args()
+
+    # 변경 전: 매번 버전 확인 및 설치 확인
+    if not args.offline:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            legacy = [timed(lambda: chromedriver_autoinstaller.install(path=tmp_dir))[0] for _ in range(args.runs)]
+        report("변경 전 (매번 install)", legacy)
+
+    # 변경 후: 새 프로세스의 첫 확인 (디스크 캐시) + 이후 확인 (프로세스 캐시)
+    resolver = ChromeDriverResolver(cache_path=DEFAULT_CACHE_PATH, offline=args.offline)
+    first, driver_path = timed(resolver.resolve)
+    first_source = resolver.stats["last_source"]
+    repeated = [timed(resolver.resolve)[0] for _ in range(args.runs)]
+    print(f"변경 후 첫 확인 ({first_source}): {first * 1000:.0f}ms")
+    report("변경 후 반복 확인 (프로세스 캐시)", repeated)
+    print(f"드라이버 경로: {driver_path}")
+
+    if args.launch and driver_path:
+        report("브라우저 실행 (캐시된 드라이버)", [launch_browser(driver_path) for _ in range(args.runs)])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+검색 결과 추출 속도 벤치마크 (그리드 응답 수집 vs 그리드 스크립트 vs DOM 추출)
+
+실제 Chrome으로 키워드를 검색한 뒤 같은 결과 페이지에서
+그리드 JSON 응답 수집 방식, 그리드 스크립트 방식(execute_script 1회), DOM 추출 방식(BS4, 셀 ID)의
+초당 처리 행 수와 브라우저에서 가져오는 데이터 크기를 비교합니다.
+(Chrome 및 인터넷 연결 필요, 성능 로그 사용: GRID_CAPTURE=true)
+
+사용 예:
+    python -m benchmarks.bench_grid_extract --keyword 인공지능 --runs 3
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from backend.crawler.g2b_crawler import G2BCrawler
+from backend.crawler.grid_script import GRID_ID, GRID_EXTRACT_SCRIPT, TITLE_COLUMN
+
+async def timed(label: str, coro_factory):
+    """추출 함수 실행 시간과 초당 행 수 출력"""
+    start = time.perf_counter()
+    items = await coro_factory()
+    elapsed = time.perf_counter() - start
+    rows = len(items or [])
+    rate = rows / elapsed if elapsed > 0 else 0
+    print(f"{label}: {rows}행 | {elapsed * 1000:.0f}ms | {rate:.1f}행/초")
+    return rows
+
+async def main():
+    parser = argparse.ArgumentParser(description="검색 결과 추출 속도 벤치마크")
+    parser.add_argument("--keyword", default="인공지능", help="검색 키워드")
+    parser.add_argument("--runs", type=int, default=3, help="반복 횟수")
+    parser.add_argument("--show-browser", action="store_true", help="헤드리스 모드 끄기")
+    args = parser.parse_args()
+
+    crawler = G2BCrawler(headless=not args.show_browser)
+    try:
+        if not await crawler.initialize():
+            raise RuntimeError("크롤러 초기화 실패")
+        if not crawler.searcher.grid_capture:
+            raise RuntimeError("GRID_CAPTURE가 비활성화되어 있습니다")
+        if not await crawler.navigate_to_bid_list():
+            raise RuntimeError("입찰공고 목록 페이지 이동 실패")
+
+        searcher = crawler.searcher
+        for run in range(args.runs):
+            # 매 회차 새로 검색하여 응답을 다시 수신
+            if not await crawler.search_keyword(args.keyword):
+                raise RuntimeError("검색 실패")
+            print(f"--- {run + 1}회차 ---")
+            await timed("그리드 응답 수집", lambda: searcher.grid_capture.collect(args.keyword))
+            await timed("그리드 스크립트", searcher.extract_search_results_script)
+            await timed("DOM 추출 (BS4)", searcher.extract_search_results_bs4)
+            await timed("DOM 추출 (셀 ID)", lambda: searcher.actor.run(searcher._extract_items_by_cell_ids))
+
+        # 브라우저에서 가져오는 데이터 크기 비교 (스크립트 JSON vs 페이지 소스)
+        payload = await searcher.actor.run(searcher.driver.execute_script, GRID_EXTRACT_SCRIPT, GRID_ID, TITLE_COLUMN)
+        page_source = await searcher.actor.run(lambda: searcher.driver.page_source)
+        payload_size = len(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+        source_size = len(page_source.encode("utf-8"))
+        print(f"그리드 스크립트 JSON: {payload_size / 1024:.1f}KB (방식: {payload.get('source') if payload else None}) | "
+              f"페이지 소스: {source_size / 1024:.1f}KB")
+    finally:
+        await crawler.close()
+
+if __name__ == "__main__":
+    asyncio.run(main())
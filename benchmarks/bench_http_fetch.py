@@ -0,0 +1,119 @@
+"""
+HTTP 수집 처리량 벤치마크 (순차 요청 vs 공유 세션 동시 요청)
+
+로컬 스탠드인 서버(aiohttp.web)가 나라장터 목록 JSON/상세 JSON 응답을 지연 시간을 두고 흉내 내며,
+캡처한 요청 템플릿을 G2BHttpFetcher로 재전송하여 초당 처리 항목 수를 비교합니다.
+(브라우저/인터넷 연결 불필요)
+
+사용 예:
+    python -m benchmarks.bench_http_fetch --keywords 20 --items 50 --latency-ms 80 --concurrency 1 8 32
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from aiohttp import web
+
+from backend.crawler.g2b_http import G2BHttpFetcher
+
+def make_app(items_per_keyword: int, latency: float) -> web.Application:
+    """목록/상세 요청을 흉내 내는 스탠드인 서버"""
+
+    async def list_handler(request):
+        await asyncio.sleep(latency)
+        body = await request.json()
+        params = body["dlParamM"]
+        keyword = params["bidPbancNm"]
+        page = int(params["currentPage"])
+        size = int(params["recordCountPerPage"])
+        start = (page - 1) * size
+        rows = [{
+            "bidPbancNo": f"R25BK{abs(hash(keyword)) % 1000:03d}{index:05d}",
+            "bidPbancOrd": "000",
+            "bidPbancNm": f"{keyword} 관련 용역 {index}",
+            "dmstNm": "조달청",
+            "pbancPstgDt": "2025/01/01 10:00",
+            "slprRcptDdlnDt": "2025/01/15 18:00",
+            "pbancSttsNm": "공고중"
+        } for index in range(start, min(start + size, items_per_keyword))]
+        return web.json_response({"result": rows})
+
+    async def detail_handler(request):
+        await asyncio.sleep(latency)
+        body = await request.json()
+        bid_number = body["dlParamM"]["bidPbancNo"]
+        return web.json_response({"bidInfo": {"bidPbancNo": bid_number, "bidPbancNm": "상세", "cntrctMthdNm": "제한경쟁", "presmptPrce": "100000000"}})
+
+    app = web.Application()
+    app.router.add_post("/pn/pnp/pnpe/BidPbac/selectBidPbacScrollTypeList.do", list_handler)
+    app.router.add_post("/pn/pnp/pnpe/BidPbac/selectBidPbacDetl.do", detail_handler)
+    return app
+
+def make_templates(base_url: str):
+    """브라우저에서 캡처한 것과 같은 형태의 요청 템플릿"""
+    headers = {"Content-Type": "application/json;charset=UTF-8", "Cookie": "JSESSIONID=captured"}
+    list_request = {
+        "url": f"{base_url}/pn/pnp/pnpe/BidPbac/selectBidPbacScrollTypeList.do",
+        "method": "POST",
+        "headers": headers,
+        "post_data": json.dumps({"dlParamM": {"bidPbancNm": "캡처키워드", "currentPage": 1, "recordCountPerPage": 10}}),
+        "keyword": "캡처키워드"
+    }
+    detail_request = {
+        "url": f"{base_url}/pn/pnp/pnpe/BidPbac/selectBidPbacDetl.do",
+        "method": "POST",
+        "headers": headers,
+        "post_data": json.dumps({"dlParamM": {"bidPbancNo": "R25BK00000000", "bidPbancOrd": "000"}}),
+        "bid_number": "R25BK00000000",
+        "bid_revision": "000"
+    }
+    return list_request, detail_request
+
+async def run_once(base_url: str, keywords, items: int, concurrency: int, page_size: int):
+    """키워드 전체 목록/상세 수집 후 (항목 수, 소요 시간, 통계) 반환"""
+    list_request, detail_request = make_templates(base_url)
+    session = {"cookies": {"JSESSIONID": "captured"}, "user_agent": "bench"}
+
+    async with G2BHttpFetcher(session, list_request, detail_request, concurrency=concurrency, base_url=base_url) as fetcher:
+        async def fetch_keyword(keyword):
+            rows = await fetcher.fetch_all(keyword, max_items=items, page_size=page_size)
+            details = await fetcher.fetch_details(rows)
+            return sum(1 for detail in details if detail)
+
+        start = time.perf_counter()
+        counts = await asyncio.gather(*[fetch_keyword(keyword) for keyword in keywords])
+        elapsed = time.perf_counter() - start
+        return sum(counts), elapsed, fetcher.get_stats()
+
+async def main():
+    parser = argparse.ArgumentParser(description="HTTP 수집 처리량 벤치마크")
+    parser.add_argument("--keywords", type=int, default=20, help="키워드 수")
+    parser.add_argument("--items", type=int, default=50, help="키워드당 항목 수")
+    parser.add_argument("--page-size", type=int, default=25, help="목록 페이지 크기")
+    parser.add_argument("--latency-ms", type=float, default=80, help="스탠드인 서버 응답 지연 (ms)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32], help="비교할 동시 요청 수")
+    args = parser.parse_args()
+
+    runner = web.AppRunner(make_app(args.items, args.latency_ms / 1000))
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    base_url = f"http://127.0.0.1:{port}"
+    keywords = [f"키워드{index}" for index in range(args.keywords)]
+
+    try:
+        baseline = None
+        for concurrency in args.concurrency:
+            count, elapsed, stats = await run_once(base_url, keywords, args.items, concurrency, args.page_size)
+            rate = count / elapsed if elapsed > 0 else 0
+            baseline = baseline or rate
+            print(f"동시 요청 {concurrency:>3}: {count}항목 | {elapsed:.2f}초 | {rate:.1f}항목/초 | "
+                  f"요청 {stats['requests']}건, 오류 {stats['errors']}건 | x{rate / baseline:.1f}")
+    finally:
+        await runner.cleanup()
+
+if __name__ == "__main__":
+    asyncio.run(main())
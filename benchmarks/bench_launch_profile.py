@@ -0,0 +1,88 @@
+"""
+Chrome 실행 프로필 벤치마크 (콜드 시작 vs 웜 시작)
+
+같은 실행 프로필로 브라우저를 여러 번 띄워 navigate_to_main + navigate_to_bid_list 시간을 측정합니다.
+- 콜드: 매번 빈 사용자 데이터 디렉토리 (WebSquare JS 번들을 매번 다운로드)
+- 웜: 첫 실행 종료 시 저장한 HTTP 캐시 시드를 복사해 시작
+(Chrome 및 인터넷 연결 필요)
+
+사용 예:
+    python -m benchmarks.bench_launch_profile --runs 3 --profile lean --profile-root /dev/shm
+"""
+
+import argparse
+import asyncio
+import shutil
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from backend.crawler.g2b_crawler import G2BCrawler
+from backend.crawler.launch_profile import LaunchProfile, PROFILES
+
+async def measure_once(profile: LaunchProfile, headless: bool):
+    """브라우저 한 번 실행하여 시작/페이지 이동 시간 측정 (ms)"""
+    crawler = G2BCrawler(headless=headless, launch_profile=profile)
+    timings = {}
+    try:
+        start = time.perf_counter()
+        if not await crawler.initialize():
+            raise RuntimeError("크롤러 초기화 실패")
+        timings["initialize"] = (time.perf_counter() - start) * 1000
+
+        for page_type, navigate in (("main", crawler.navigate_to_main), ("bid_list", crawler.navigate_to_bid_list)):
+            start = time.perf_counter()
+            if not await navigate():
+                raise RuntimeError(f"{page_type} 페이지 이동 실패")
+            timings[page_type] = (time.perf_counter() - start) * 1000
+        timings["seeded"] = profile.stats["seeded"]
+    finally:
+        await crawler.close()
+    return timings
+
+def report(label: str, samples):
+    """단계별 평균 시간 출력"""
+    for key in ("initialize", "main", "bid_list"):
+        values = [sample[key] for sample in samples]
+        print(f"[{label}] {key}: 평균 {statistics.mean(values):.0f}ms | 최소 {min(values):.0f}ms | 최대 {max(values):.0f}ms")
+    totals = [sample["main"] + sample["bid_list"] for sample in samples]
+    print(f"[{label}] 메인+목록 합계: 평균 {statistics.mean(totals):.0f}ms ({len(samples)}회)")
+    return statistics.mean(totals)
+
+async def main():
+    parser = argparse.ArgumentParser(description="Chrome 실행 프로필 벤치마크")
+    parser.add_argument("--runs", type=int, default=3, help="모드별 반복 횟수")
+    parser.add_argument("--profile", default="lean", choices=sorted(PROFILES), help="실행 플래그 프로필")
+    parser.add_argument("--profile-root", default="", help="사용자 데이터 디렉토리 상위 경로 (예: /dev/shm)")
+    parser.add_argument("--show-browser", action="store_true", help="헤드리스 모드 끄기")
+    args = parser.parse_args()
+
+    headless = not args.show_browser
+    work_dir = Path(tempfile.mkdtemp(prefix="bench-launch-"))
+    seed_dir = work_dir / "cache-seed"
+    try:
+        # 콜드: 시드 없이 매번 빈 프로필
+        cold = []
+        for run in range(args.runs):
+            cold.append(await measure_once(LaunchProfile(args.profile, args.profile_root or str(work_dir)), headless))
+
+        # 시드 생성 (첫 실행 종료 시 캐시 저장)
+        await measure_once(LaunchProfile(args.profile, args.profile_root or str(work_dir), str(seed_dir)), headless)
+        if not seed_dir.exists():
+            raise RuntimeError("HTTP 캐시 시드 생성 실패")
+
+        # 웜: 시드 복사 후 시작
+        warm = []
+        for run in range(args.runs):
+            warm.append(await measure_once(LaunchProfile(args.profile, args.profile_root or str(work_dir), str(seed_dir)), headless))
+
+        cold_total = report("콜드", cold)
+        warm_total = report("웜", warm)
+        if warm_total > 0:
+            print(f"웜 시작 속도 향상: x{cold_total / warm_total:.2f}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    asyncio.run(main())
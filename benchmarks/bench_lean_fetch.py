@@ -0,0 +1,54 @@
+"""
+리소스 차단(lean fetch) 벤치마크
+
+실제 Chrome으로 메인 페이지와 입찰공고 목록 페이지를 열어
+리소스 차단 사용 전/후의 페이지 준비 시간과 전송 바이트 수를 비교합니다.
+(Chrome 및 인터넷 연결 필요)
+
+사용 예:
+    python -m benchmarks.bench_lean_fetch --runs 3
+"""
+
+import argparse
+import asyncio
+import time
+
+from backend.crawler.g2b_crawler import G2BCrawler
+from backend.crawler.lean_fetch import collect_page_metrics
+
+async def measure_once(lean_fetch: bool, headless: bool):
+    """브라우저 한 번 실행하여 페이지별 지표 측정"""
+    crawler = G2BCrawler(headless=headless)
+    results = {}
+    try:
+        if not await crawler.initialize():
+            raise RuntimeError("크롤러 초기화 실패")
+        await crawler.configure_lean_fetch(lean_fetch)
+
+        for page_type, navigate in (("main", crawler.navigate_to_main), ("bid_list", crawler.navigate_to_bid_list)):
+            start = time.perf_counter()
+            await navigate()
+            elapsed_ms = round((time.perf_counter() - start) * 1000)
+            metrics = await collect_page_metrics(crawler.driver, crawler.actor)
+            results[page_type] = {"elapsed_ms": elapsed_ms, **metrics}
+    finally:
+        await crawler.close()
+    return results
+
+async def main():
+    parser = argparse.ArgumentParser(description="리소스 차단 벤치마크")
+    parser.add_argument("--runs", type=int, default=3, help="모드별 반복 횟수")
+    parser.add_argument("--show-browser", action="store_true", help="헤드리스 모드 끄기")
+    args = parser.parse_args()
+
+    for lean_fetch in (False, True):
+        label = "차단 사용" if lean_fetch else "차단 미사용"
+        for run in range(args.runs):
+            results = await measure_once(lean_fetch, headless=not args.show_browser)
+            for page_type, metrics in results.items():
+                print(f"[{label} #{run + 1}] {page_type}: 소요 {metrics['elapsed_ms']}ms | "
+                      f"DOM 준비 {metrics.get('ready_ms')}ms | 로드 {metrics.get('load_ms')}ms | "
+                      f"리소스 {metrics.get('resources')}개 | 전송 {metrics.get('bytes', 0) / 1024:.0f}KB")
+
+if __name__ == "__main__":
+    asyncio.run(main())
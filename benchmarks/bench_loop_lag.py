@@ -0,0 +1,67 @@
+"""
+이벤트 루프 블로킹 벤치마크
+
+WebDriver 명령을 이벤트 루프에서 직접 호출할 때(변경 전)와
+DriverActor 스레드를 통해 호출할 때(변경 후)의 루프 지연을 비교합니다.
+
+사용 예:
+    python -m benchmarks.bench_loop_lag --commands 50 --latency 0.2
+"""
+
+import argparse
+import asyncio
+import time
+
+from backend.crawler.driver_actor import DriverActor
+from backend.utils.loop_monitor import LoopLagMonitor
+
+def blocking_command(latency: float):
+    """WebDriver HTTP 왕복을 흉내 내는 블로킹 명령"""
+    time.sleep(latency)
+
+async def run_direct(commands: int, latency: float):
+    """변경 전: 이벤트 루프에서 블로킹 명령 직접 실행"""
+    for _ in range(commands):
+        blocking_command(latency)
+        await asyncio.sleep(0)
+
+async def run_actor(commands: int, latency: float):
+    """변경 후: DriverActor 스레드에서 블로킹 명령 실행"""
+    actor = DriverActor(name="bench-actor")
+    try:
+        for _ in range(commands):
+            await actor.run(blocking_command, latency)
+    finally:
+        actor.shutdown()
+
+async def measure(label: str, runner, commands: int, latency: float):
+    """실행 함수의 소요 시간과 루프 지연 측정"""
+    monitor = LoopLagMonitor(interval=0.01, threshold=0.02)
+    monitor.start()
+    await asyncio.sleep(0.05)
+
+    start = time.perf_counter()
+    await runner(commands, latency)
+    elapsed = time.perf_counter() - start
+
+    await asyncio.sleep(0.05)
+    await monitor.stop()
+    stats = monitor.get_stats()
+    print(f"[{label}] 소요 {elapsed:.2f}s | 최대 지연 {stats['max_lag_ms']}ms | "
+          f"p95 {stats['p95_lag_ms']}ms | 블로킹 누적 {stats['blocked_ms']}ms ({stats['blocked_events']}회)")
+    return stats
+
+async def main():
+    parser = argparse.ArgumentParser(description="이벤트 루프 블로킹 벤치마크")
+    parser.add_argument("--commands", type=int, default=30, help="실행할 명령 수")
+    parser.add_argument("--latency", type=float, default=0.1, help="명령당 블로킹 시간 (초)")
+    args = parser.parse_args()
+
+    before = await measure("변경 전 (직접 호출)", run_direct, args.commands, args.latency)
+    after = await measure("변경 후 (DriverActor)", run_actor, args.commands, args.latency)
+
+    saved = before["blocked_ms"] - after["blocked_ms"]
+    print(f"이벤트 루프 블로킹 감소: {saved:.1f}ms")
+
+if __name__ == "__main__":
+    asyncio.run(main())
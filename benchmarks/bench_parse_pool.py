@@ -0,0 +1,99 @@
+"""
+상세 페이지 파싱 프로세스 풀 벤치마크
+
+상세 페이지 HTML 파싱(extract_detail_fields)을 이벤트 루프에서 직접 실행할 때(변경 전)와
+파싱 프로세스 풀에서 1, 2, 4, 8개 프로세스로 실행할 때(변경 후)의 처리량과 루프 지연을 비교합니다.
+PAGE_SNAPSHOTS=true로 수집한 상세 페이지 스냅샷을 사용하고, 없으면 합성 페이지를 만들어 사용합니다.
+(Chrome/인터넷 연결/Gemini 불필요)
+
+사용 예:
+    python -m benchmarks.bench_parse_pool --pages 64 --workers 1 2 4 8
+"""
+
+import argparse
+import asyncio
+import time
+
+from backend.crawler.g2b_parser import extract_detail_fields
+from backend.crawler.parse_pool import ParsePool, available_cores
+from backend.crawler.snapshot_store import SnapshotStore
+from backend.utils.loop_monitor import LoopLagMonitor
+from benchmarks.bench_snapshot_replay import load_snapshots
+
+def synthetic_page(index: int, tables: int = 12, rows: int = 40) -> str:
+    """WebSquare 상세 페이지와 비슷한 크기/구조의 합성 HTML 생성"""
+    parts = ["<html><body><div id='mf_wfm_container'>"]
+    for t in range(tables):
+        parts.append(f"<table><caption>공고일반_{t}</caption><tbody>")
+        for r in range(rows):
+            parts.append(
+                f"<tr><th class='w2tb_th'>항목 {r}</th>"
+                f"<td class='w2tb_td'><span>값 {index}-{t}-{r}</span>"
+                f"<input type='text' title='입력 {r}' value='{index * r}'/>"
+                f"<a href='#' onclick=\"fn_view('{index}', '{r}')\">보기</a></td>"
+                f"<th>비고</th><td><div><span>{'내용 ' * 8}</span></div></td></tr>"
+            )
+        parts.append("</tbody></table>")
+    parts.append("<div><strong>기관담당자정보</strong><table><tr><th>수요기관</th><td>조달청</td></tr>"
+                 "<tr><th>담당자</th><td>홍길동</td></tr></table></div>")
+    parts.append("<a href='/fileDown.do?id=1' class='file'>제안요청서.hwp</a></div></body></html>")
+    return "".join(parts)
+
+def load_pages(limit: int):
+    """상세 페이지 스냅샷 읽기 (없으면 합성 페이지)"""
+    store = SnapshotStore(enabled=True)
+    snapshots = load_snapshots(store, "detail", limit)
+    if snapshots:
+        print(f"상세 페이지 스냅샷 {len(snapshots)}개 사용 ({store.root})")
+        return [(entry.get("bid_number", ""), html) for entry, html in snapshots]
+    print(f"스냅샷이 없어 합성 페이지 {limit}개 사용")
+    return [(f"R25BK{index:08d}", synthetic_page(index)) for index in range(limit)]
+
+async def run_inline(pages):
+    """변경 전: 이벤트 루프에서 파싱 직접 실행"""
+    for bid_number, html in pages:
+        extract_detail_fields(html, bid_number, "")
+        await asyncio.sleep(0)
+
+async def run_pool(pool: ParsePool, pages):
+    """변경 후: 파싱 프로세스 풀에서 동시 실행"""
+    await asyncio.gather(*[pool.run(extract_detail_fields, html, bid_number, "") for bid_number, html in pages])
+
+async def measure(label: str, runner, pages):
+    """처리량과 루프 지연 측정"""
+    monitor = LoopLagMonitor(interval=0.01, threshold=0.02)
+    monitor.start()
+    await asyncio.sleep(0.05)
+
+    start = time.perf_counter()
+    await runner
+    elapsed = time.perf_counter() - start
+
+    await asyncio.sleep(0.05)
+    await monitor.stop()
+    stats = monitor.get_stats()
+    print(f"[{label}] {len(pages)}페이지 | {elapsed:.2f}s | {len(pages) / elapsed:.1f}페이지/초 | "
+          f"최대 지연 {stats['max_lag_ms']}ms | 블로킹 누적 {stats['blocked_ms']}ms")
+    return len(pages) / elapsed
+
+async def main():
+    parser = argparse.ArgumentParser(description="상세 페이지 파싱 프로세스 풀 벤치마크")
+    parser.add_argument("--pages", type=int, default=64, help="파싱할 페이지 수")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="측정할 프로세스 수")
+    args = parser.parse_args()
+
+    pages = load_pages(args.pages)
+    print(f"사용 가능한 코어: {available_cores()}개")
+
+    baseline = await measure("변경 전 (이벤트 루프)", run_inline(pages), pages)
+    for workers in args.workers:
+        pool = ParsePool(workers=workers)
+        await asyncio.to_thread(pool.start)
+        try:
+            throughput = await measure(f"프로세스 {workers}개", run_pool(pool, pages), pages)
+        finally:
+            pool.close()
+        print(f"  → 이벤트 루프 대비 x{throughput / baseline:.2f}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,70 @@
+"""
+페이지 스냅샷 재현 벤치마크
+
+PAGE_SNAPSHOTS=true로 수집한 스냅샷(SNAPSHOT_DIR)을 브라우저 없이 다시 읽어
+상세 페이지 파서(G2BParser.parse_detail_page) 처리 속도와 코덱별 압축률/압축 시간을 측정합니다.
+(스냅샷만 있으면 Chrome/인터넷 연결 불필요)
+
+사용 예:
+    PAGE_SNAPSHOTS=true python -m benchmarks.bench_snapshot_replay --limit 200
+"""
+
+import argparse
+import asyncio
+import time
+
+from backend.crawler.g2b_parser import G2BParser
+from backend.crawler.snapshot_store import CODEC_SUFFIXES, ZSTD_AVAILABLE, SnapshotStore, compress
+
+def load_snapshots(store: SnapshotStore, kind: str, limit: int):
+    """기록 순서대로 서로 다른 스냅샷 HTML과 기록 정보 읽기"""
+    seen = set()
+    snapshots = []
+    for entry in store.iter_entries(kind):
+        if entry["hash"] in seen:
+            continue
+        seen.add(entry["hash"])
+        html = store.load(entry["hash"], entry["codec"])
+        if html:
+            snapshots.append((entry, html))
+        if len(snapshots) >= limit:
+            break
+    return snapshots
+
+def report_codecs(snapshots):
+    """코덱별 압축률과 평균 압축 시간 출력"""
+    raw = [html.encode("utf-8") for _, html in snapshots]
+    total = sum(len(data) for data in raw)
+    for codec in CODEC_SUFFIXES:
+        if codec == "zstd" and not ZSTD_AVAILABLE:
+            print("zstd: zstandard 미설치로 건너뜀")
+            continue
+        start = time.perf_counter()
+        stored = sum(len(compress(data, codec)) for data in raw)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"{codec}: 압축률 x{total / stored:.2f} | 평균 압축 {elapsed / len(raw):.2f}ms/페이지")
+
+async def main():
+    parser = argparse.ArgumentParser(description="페이지 스냅샷 재현 벤치마크")
+    parser.add_argument("--kind", default="detail", choices=["detail", "list"], help="재현할 페이지 종류")
+    parser.add_argument("--limit", type=int, default=200, help="최대 스냅샷 수")
+    args = parser.parse_args()
+
+    store = SnapshotStore(enabled=True)
+    snapshots = load_snapshots(store, args.kind, args.limit)
+    if not snapshots:
+        raise RuntimeError(f"{store.root}에 '{args.kind}' 스냅샷이 없습니다 (PAGE_SNAPSHOTS=true로 수집 필요)")
+    print(f"스냅샷 {len(snapshots)}개 ({store.root})")
+    report_codecs(snapshots)
+
+    if args.kind == "detail":
+        start = time.perf_counter()
+        fields = 0
+        for entry, html in snapshots:
+            detail_data = await G2BParser.parse_detail_page(html, entry.get("bid_number", ""), "")
+            fields += len(detail_data or {})
+        elapsed = time.perf_counter() - start
+        print(f"상세 파싱: {len(snapshots)}페이지 | {elapsed * 1000:.0f}ms | {len(snapshots) / elapsed:.1f}페이지/초 | 평균 {fields / len(snapshots):.1f}필드")
+
+if __name__ == "__main__":
+    asyncio.run(main())
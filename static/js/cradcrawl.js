@@ -11,7 +11,8 @@ document.addEventListener('DOMContentLoaded', function() {
         processedKeywords: [],
         totalKeywords: 0,
         startTime: null,
-        endTime: null
+        endTime: null,
+        workers: {}
     };
 
     // 요소 선택
@@ -22,6 +23,9 @@ document.addEventListener('DOMContentLoaded', function() {
         startDateInput: document.getElementById('start-date'),
         endDateInput: document.getElementById('end-date'),
         headlessModeCheckbox: document.getElementById('headless-mode'),
+        concurrencyInput: document.getElementById('concurrency'),
+        detailTabsInput: document.getElementById('detail-tabs'),
+        fetchModeSelect: document.getElementById('fetch-mode'),
         
         // 버튼
         startButton: document.getElementById('btn-start'),
@@ -35,6 +39,7 @@ document.addEventListener('DOMContentLoaded', function() {
         progressBar: document.getElementById('progress-bar'),
         processedKeywords: document.getElementById('processed-keywords'),
         totalResults: document.getElementById('total-results'),
+        workerStatus: document.getElementById('worker-status'),
         logContainer: document.getElementById('log-container'),
         
         // 결과 표시
@@ -93,6 +98,9 @@ document.addEventListener('DOMContentLoaded', function() {
                 case 'error':
                     handleErrorMessage(message.data);
                     break;
+                case 'worker':
+                    handleWorkerUpdate(message.data);
+                    break;
                 default:
                     console.log('Unknown message type:', message.type);
             }
@@ -149,6 +157,15 @@ document.addEventListener('DOMContentLoaded', function() {
             updateTotalResults(data.total_items);
         }
         
+        // 워커 진행 상황 표시
+        if (data.workers) {
+            state.workers = {};
+            data.workers.forEach(worker => {
+                state.workers[worker.worker_id] = worker;
+            });
+            updateWorkerStatus();
+        }
+        
         // 시작/종료 시간 업데이트
         if (data.start_time) {
             state.startTime = new Date(data.start_time);
@@ -170,6 +187,12 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
 
+    function handleWorkerUpdate(data) {
+        // 워커별 진행 상황 업데이트
+        state.workers[data.worker_id] = data;
+        updateWorkerStatus();
+    }
+
     function handleErrorMessage(data) {
         addLog(data.message, 'error');
         
@@ -244,6 +267,20 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
 
+    function updateWorkerStatus() {
+        const workers = Object.values(state.workers);
+        if (workers.length === 0) {
+            elements.workerStatus.textContent = '-';
+            return;
+        }
+        
+        elements.workerStatus.innerHTML = workers.map(worker => {
+            const keyword = worker.keyword ? ` '${worker.keyword}'` : '';
+            const items = worker.items_total ? ` (${worker.items_done}/${worker.items_total})` : '';
+            return `<div>워커 ${worker.worker_id + 1}: ${worker.state}${keyword}${items} · 완료 키워드 ${worker.keywords_done}개</div>`;
+        }).join('');
+    }
+
     function updateTotalResults(totalItems) {
         elements.totalResults.textContent = totalItems !== undefined ? `${totalItems} 건` : '-';
     }
@@ -356,12 +393,24 @@ document.addEventListener('DOMContentLoaded', function() {
         // 헤드리스 모드 설정
         const headless = elements.headlessModeCheckbox.checked;
         
+        // 동시 실행 브라우저 수
+        const concurrency = parseInt(elements.concurrencyInput.value, 10) || 1;
+        
+        // 브라우저당 상세 페이지 탭 수
+        const detailTabs = parseInt(elements.detailTabsInput.value, 10) || 1;
+        
+        // 수집 방식 (browser 또는 http)
+        const fetchMode = elements.fetchModeSelect.value;
+        
         // 요청 데이터 구성
         const requestData = {
             keywords: keywords,
             startDate: startDate,
             endDate: endDate,
             headless: headless,
+            concurrency: concurrency,
+            detailTabs: detailTabs,
+            fetchMode: fetchMode,
             clientInfo: {
                 userAgent: navigator.userAgent,
                 timestamp: new Date().toISOString()
@@ -0,0 +1,12 @@
+"""
+테스트 공통 설정
+
+저장소 루트를 import 경로에 추가하여 backend 패키지를 바로 임포트합니다.
+"""
+
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
@@ -0,0 +1,255 @@
+"""
+HTTP 수집(G2BHttpFetcher) 테스트
+
+로컬 스탠드인 서버(aiohttp.test_utils.TestServer)에 캡처한 요청 템플릿을 재전송하여
+요청 값 치환(JSON/form/쿼리), 응답 행 매핑, 동시 요청 수 제한, 오류 처리를 확인합니다.
+"""
+
+import asyncio
+import json
+import unittest
+from urllib.parse import parse_qs, urlsplit
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from backend.crawler.g2b_http import G2BHttpFetcher, HttpFetchError, replace_values
+
+LIST_PATH = "/pn/pnp/pnpe/BidPbac/selectBidPbacScrollTypeList.do"
+DETAIL_PATH = "/pn/pnp/pnpe/BidPbac/selectBidPbacDetl.do"
+CAPTURED_HOST = "https://www.g2b.go.kr"
+SESSION = {"cookies": {"JSESSIONID": "captured"}, "user_agent": "test-agent"}
+
+def list_template(post_data=None, url=CAPTURED_HOST + LIST_PATH, method="POST"):
+    """브라우저에서 캡처한 것과 같은 형태의 목록 요청 템플릿"""
+    return {
+        "url": url,
+        "method": method,
+        "headers": {"Content-Type": "application/json;charset=UTF-8", "Cookie": "JSESSIONID=old", ":authority": "www.g2b.go.kr"},
+        "post_data": post_data if post_data is not None else json.dumps(
+            {"dlParamM": {"bidPbancNm": "캡처키워드", "currentPage": 1, "recordCountPerPage": 10}}
+        ),
+        "keyword": "캡처키워드"
+    }
+
+def detail_template():
+    """공고번호/차수가 들어 있는 상세 요청 템플릿"""
+    return {
+        "url": CAPTURED_HOST + DETAIL_PATH,
+        "method": "POST",
+        "headers": {"Content-Type": "application/json;charset=UTF-8"},
+        "post_data": json.dumps({"dlParamM": {"bidPbancNo": "R25BK00000001", "bidPbancOrd": "000"}}),
+        "bid_number": "R25BK00000001",
+        "bid_revision": "000"
+    }
+
+def make_row(keyword, index):
+    """목록 응답 행"""
+    return {
+        "bidPbancNo": f"R25BK{index:08d}",
+        "bidPbancOrd": "001" if index % 2 else "000",
+        "bidPbancNm": f"{keyword} 관련 용역 {index}",
+        "dmstNm": "조달청",
+        "pbancPstgDt": "2025/01/01 10:00",
+        "slprRcptDdlnDt": "2025/01/15 18:00",
+        "pbancSttsNm": "공고중"
+    }
+
+class StandInServer:
+    """목록/상세 요청을 흉내 내는 스탠드인 서버 (받은 요청과 동시 처리 수 기록)"""
+
+    def __init__(self, total_rows=25, latency=0.0):
+        self.total_rows = total_rows
+        self.latency = latency
+        self.list_status = 200
+        self.list_body = None  # 지정하면 목록 응답 본문을 그대로 반환
+        self.detail_status = 200
+        self.list_requests = []
+        self.detail_requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        app = web.Application()
+        app.router.add_post(LIST_PATH, self.list_handler)
+        app.router.add_get(LIST_PATH, self.list_handler)
+        app.router.add_post(DETAIL_PATH, self.detail_handler)
+        self.server = TestServer(app)
+
+    @property
+    def base_url(self):
+        return str(self.server.make_url("")).rstrip("/")
+
+    async def _track(self):
+        """동시 처리 수 기록 후 지연"""
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+
+    async def list_handler(self, request):
+        text = await request.text()
+        self.list_requests.append({"query": request.query_string, "body": text, "headers": dict(request.headers), "cookies": dict(request.cookies)})
+        await self._track()
+        if self.list_status != 200:
+            return web.Response(status=self.list_status, text="forbidden")
+        if self.list_body is not None:
+            return web.Response(text=self.list_body, content_type="text/html")
+        params = json.loads(text)["dlParamM"]
+        page = int(params["currentPage"])
+        size = int(params["recordCountPerPage"])
+        start = (page - 1) * size
+        rows = [make_row(params["bidPbancNm"], index) for index in range(start, min(start + size, self.total_rows))]
+        return web.json_response({"result": {"list": rows}})
+
+    async def detail_handler(self, request):
+        body = await request.json()
+        self.detail_requests.append(body)
+        await self._track()
+        if self.detail_status != 200:
+            return web.Response(status=self.detail_status, text="error")
+        params = body["dlParamM"]
+        return web.json_response({"bidInfo": {"bidPbancNo": params["bidPbancNo"], "bidPbancOrd": params["bidPbancOrd"],
+                                              "bidPbancNm": "상세 공고명", "cntrctMthdNm": "제한경쟁"}})
+
+class BuildRequestTest(unittest.TestCase):
+    """캡처한 요청 템플릿 값 치환"""
+
+    def setUp(self):
+        self.fetcher = G2BHttpFetcher(SESSION, list_template(), base_url="http://127.0.0.1:8080")
+
+    def test_replace_values_nested(self):
+        body = {"dlParamM": {"bidPbancNm": "캡처키워드", "currentPage": 1, "items": ["캡처키워드", "기타"]}}
+        result = replace_values(body, {"캡처키워드": "AI"}, {"currentPage": 3})
+        self.assertEqual(result, {"dlParamM": {"bidPbancNm": "AI", "currentPage": 3, "items": ["AI", "기타"]}})
+
+    def test_replace_values_exact_match_only(self):
+        self.assertEqual(replace_values({"q": "캡처키워드 포함"}, {"캡처키워드": "AI"}, {}), {"q": "캡처키워드 포함"})
+
+    def test_json_body(self):
+        method, url, headers, body = self.fetcher._build_request(
+            list_template(), {"캡처키워드": "인공지능"}, {"currentPage": 4, "recordCountPerPage": 50}
+        )
+        self.assertEqual(method, "POST")
+        self.assertEqual(url, "http://127.0.0.1:8080" + LIST_PATH)
+        self.assertEqual(json.loads(body), {"dlParamM": {"bidPbancNm": "인공지능", "currentPage": 4, "recordCountPerPage": 50}})
+        # 세션/연결별 헤더와 HTTP/2 의사 헤더는 제외
+        self.assertEqual(headers, {"Content-Type": "application/json;charset=UTF-8"})
+
+    def test_form_body(self):
+        template = list_template(post_data="bidPbancNm=%EC%BA%A1%EC%B2%98%ED%82%A4%EC%9B%8C%EB%93%9C&currentPage=1&flag=")
+        _, _, _, body = self.fetcher._build_request(template, {"캡처키워드": "머신러닝"}, {"currentPage": 2})
+        self.assertEqual(parse_qs(body, keep_blank_values=True), {"bidPbancNm": ["머신러닝"], "currentPage": ["2"], "flag": [""]})
+
+    def test_query_string(self):
+        template = list_template(post_data="", url=CAPTURED_HOST + LIST_PATH + "?bidPbancNo=R25BK00000001&bidPbancOrd=000&pageNo=1", method="GET")
+        method, url, _, body = self.fetcher._build_request(template, {"R25BK00000001": "R25BK00000077", "000": "002"}, {"pageNo": 5})
+        self.assertEqual(method, "GET")
+        self.assertFalse(body)
+        parts = urlsplit(url)
+        self.assertEqual(parts.netloc, "127.0.0.1:8080")
+        self.assertEqual(parse_qs(parts.query), {"bidPbancNo": ["R25BK00000077"], "bidPbancOrd": ["002"], "pageNo": ["5"]})
+
+class FetcherServerTest(unittest.IsolatedAsyncioTestCase):
+    """스탠드인 서버 대상 목록/상세 수집"""
+
+    async def asyncSetUp(self):
+        self.stand_in = StandInServer()
+        await self.stand_in.server.start_server()
+
+    async def asyncTearDown(self):
+        await self.stand_in.server.close()
+
+    def fetcher(self, concurrency=4):
+        return G2BHttpFetcher(SESSION, list_template(), detail_template(), concurrency=concurrency, base_url=self.stand_in.base_url)
+
+    async def test_fetch_list_maps_rows(self):
+        async with self.fetcher() as fetcher:
+            items = await fetcher.fetch_list("인공지능", page=2, page_size=10)
+
+        self.assertEqual(len(items), 10)
+        first = items[0]
+        self.assertEqual(first["bid_number"], "R25BK00000010")
+        self.assertEqual(first["bid_revision"], "000")
+        self.assertEqual(first["title"], "인공지능 관련 용역 10")
+        self.assertEqual(first["department"], "조달청")
+        self.assertEqual(first["date_start"], "2025/01/01 10:00")
+        self.assertEqual(first["keyword"], "인공지능")
+        self.assertEqual(first["source"], "network")
+        self.assertEqual(first["row_index"], 10)  # 페이지 오프셋 반영
+        self.assertIn("R25BK00000010", first["detail_url"])
+        self.assertEqual(items[1]["bid_revision"], "001")
+
+        # 재전송 요청: 키워드/페이지 치환, 세션 쿠키와 User-Agent 사용
+        sent = self.stand_in.list_requests[0]
+        self.assertEqual(json.loads(sent["body"])["dlParamM"], {"bidPbancNm": "인공지능", "currentPage": 2, "recordCountPerPage": 10})
+        self.assertEqual(sent["cookies"].get("JSESSIONID"), "captured")
+        self.assertEqual(sent["headers"].get("User-Agent"), "test-agent")
+
+    async def test_fetch_all_paginates_until_short_page(self):
+        async with self.fetcher() as fetcher:
+            items = await fetcher.fetch_all("AI", max_items=0, page_size=10)
+
+        self.assertEqual(len(items), 25)
+        self.assertEqual([json.loads(r["body"])["dlParamM"]["currentPage"] for r in self.stand_in.list_requests], [1, 2, 3])
+        self.assertEqual(len({item["bid_number"] for item in items}), 25)
+
+    async def test_fetch_all_max_items_and_stop_when(self):
+        async with self.fetcher() as fetcher:
+            limited = await fetcher.fetch_all("AI", max_items=15, page_size=10)
+            stopped = await fetcher.fetch_all("AI", max_items=0, page_size=10, stop_when=lambda rows: True)
+
+        self.assertEqual(len(limited), 15)
+        self.assertEqual(len(stopped), 10)
+
+    async def test_fetch_detail_substitutes_bid_number_and_revision(self):
+        async with self.fetcher() as fetcher:
+            detail = await fetcher.fetch_detail({"bid_number": "R25BK00000077", "bid_revision": "002", "row_index": 0, "title": "목록 제목"})
+
+        self.assertEqual(self.stand_in.detail_requests[0]["dlParamM"], {"bidPbancNo": "R25BK00000077", "bidPbancOrd": "002"})
+        self.assertEqual(detail["bid_number"], "R25BK00000077")
+        self.assertEqual(detail["title"], "상세 공고명")
+        self.assertEqual(detail["cntrctMthdNm"], "제한경쟁")
+
+    async def test_concurrency_bound(self):
+        self.stand_in.latency = 0.05
+        items = [{"bid_number": f"R25BK{index:08d}", "bid_revision": "000"} for index in range(20)]
+        async with self.fetcher(concurrency=3) as fetcher:
+            details = await fetcher.fetch_details(items)
+
+        self.assertTrue(all(details))
+        self.assertEqual(len(self.stand_in.detail_requests), 20)
+        self.assertLessEqual(self.stand_in.max_in_flight, 3)
+        self.assertGreater(self.stand_in.max_in_flight, 1)
+
+    async def test_list_http_error_raises(self):
+        self.stand_in.list_status = 403
+        async with self.fetcher() as fetcher:
+            with self.assertRaises(HttpFetchError):
+                await fetcher.fetch_all("AI", max_items=0, page_size=10)
+            self.assertEqual(fetcher.stats["errors"], 1)
+
+    async def test_list_non_json_raises(self):
+        # 세션 만료 시 로그인/오류 페이지 HTML이 200으로 오는 경우
+        self.stand_in.list_body = "<html><body>세션이 만료되었습니다</body></html>"
+        async with self.fetcher() as fetcher:
+            with self.assertRaises(HttpFetchError):
+                await fetcher.fetch_list("AI", page=1, page_size=10)
+
+    async def test_error_on_later_page_is_not_last_page(self):
+        async with self.fetcher() as fetcher:
+            first = await fetcher.fetch_list("AI", page=1, page_size=10)
+            self.stand_in.list_status = 500
+            with self.assertRaises(HttpFetchError):
+                await fetcher.fetch_list("AI", page=2, page_size=10)
+        self.assertEqual(len(first), 10)
+
+    async def test_detail_error_returns_none(self):
+        self.stand_in.detail_status = 500
+        async with self.fetcher() as fetcher:
+            detail = await fetcher.fetch_detail({"bid_number": "R25BK00000001", "bid_revision": "000"})
+            self.assertIsNone(detail)
+            self.assertEqual(fetcher.stats["errors"], 1)
+
+if __name__ == "__main__":
+    unittest.main()